@@ -0,0 +1,114 @@
+"""ad-hoc 실행과 PREPARE/EXECUTE 실행 비교 벤치마크
+
+로컬 PostgreSQL에서 임시 테이블을 만들어 후보자 상태 갱신/단건 조회를 반복 실행한다.
+
+    DATABASE_URL=postgresql://... python -m scripts.benchmark_prepared_statements --rows 5000 --repeat 3
+"""
+import argparse
+import os
+import random
+import time
+
+import psycopg2
+
+from src.utils.prepared_statements import PreparedStatementRegistry
+
+STATUSES = ['extracted', 'sent', 'accepted', 'rejected']
+
+UPDATE_SQL = """
+    UPDATE bench_position_candidate
+    SET scout_status = {status},
+        last_checked_at = NOW()
+    WHERE id = {mapping_id}
+"""
+SELECT_SQL = """
+    SELECT * FROM bench_candidates
+    WHERE saramin_key = {saramin_key}
+"""
+
+def setup_tables(cur, rows: int):
+    """세션 임시 테이블 생성 및 데이터 채우기"""
+    cur.execute("""
+        CREATE TEMP TABLE bench_candidates (
+            saramin_key text PRIMARY KEY,
+            name text,
+            regex_desired_job text,
+            update_dt timestamp DEFAULT NOW()
+        )
+    """)
+    cur.execute("""
+        CREATE TEMP TABLE bench_position_candidate (
+            id serial PRIMARY KEY,
+            position_id integer,
+            saramin_key text,
+            scout_status text,
+            last_checked_at timestamp
+        )
+    """)
+    cur.execute("""
+        INSERT INTO bench_candidates (saramin_key, name, regex_desired_job)
+        SELECT 'key_' || i, 'name_' || i, 'backend python django ' || i
+        FROM generate_series(1, %s) AS i
+    """, (rows,))
+    cur.execute("""
+        INSERT INTO bench_position_candidate (position_id, saramin_key, scout_status)
+        SELECT 1, 'key_' || i, 'extracted'
+        FROM generate_series(1, %s) AS i
+    """, (rows,))
+    cur.execute("ANALYZE bench_candidates")
+    cur.execute("ANALYZE bench_position_candidate")
+
+def run_adhoc(cur, workload):
+    for mapping_id, saramin_key, status in workload:
+        cur.execute(UPDATE_SQL.format(status="%s", mapping_id="%s"), (status, mapping_id))
+        cur.execute(SELECT_SQL.format(saramin_key="%s"), (saramin_key,))
+        cur.fetchone()
+
+def run_prepared(cur, registry, workload):
+    for mapping_id, saramin_key, status in workload:
+        registry.execute(cur, "bench_update_status", (status, mapping_id))
+        registry.execute(cur, "bench_candidate_details", (saramin_key,))
+        cur.fetchone()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="반복 실행 횟수(= 임시 테이블 행 수)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    registry = PreparedStatementRegistry()
+    registry.register("bench_update_status", UPDATE_SQL.format(status="$1", mapping_id="$2"))
+    registry.register("bench_candidate_details", SELECT_SQL.format(saramin_key="$1"))
+
+    conn = psycopg2.connect(os.environ["DATABASE_URL"])
+    try:
+        with conn.cursor() as cur:
+            setup_tables(cur, args.rows)
+            conn.commit()
+
+            workload = [
+                (i, f"key_{i}", random.choice(STATUSES)) for i in range(1, args.rows + 1)
+            ]
+            results = {}
+            for label, run in (
+                ("ad-hoc", lambda: run_adhoc(cur, workload)),
+                ("prepared", lambda: run_prepared(cur, registry, workload)),
+            ):
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    run()
+                    conn.commit()
+                    timings.append(time.perf_counter() - start)
+                results[label] = min(timings)
+
+        statements = args.rows * 2
+        for label, elapsed in results.items():
+            print(f"{label:>9}: {elapsed:.3f}s ({statements / elapsed:,.0f} statements/s)")
+        print(f"  speedup: {results['ad-hoc'] / results['prepared']:.2f}x")
+        print(f"registry: {registry.stats()}")
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
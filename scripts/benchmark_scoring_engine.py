@@ -0,0 +1,64 @@
+"""벡터 점수 엔진 순위 계산 벤치마크 (DB 없이 가상 후보자 데이터 사용)
+
+    python -m scripts.benchmark_scoring_engine --rows 500000 --keywords 20 --repeat 3
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from src.services.query_builder import KEYWORD_COLUMNS
+from src.services.scoring_engine import CandidateScoringEngine, WORK_YEAR_COLUMN, WORK_REGION_COLUMN
+
+VOCABULARY = [
+    'python', 'django', 'fastapi', 'java', 'spring', 'kotlin', 'react', 'vue', 'typescript',
+    'aws', 'docker', 'kubernetes', 'postgresql', 'redis', 'kafka', '백엔드', '프론트엔드',
+    '데이터', '머신러닝', '디자인', 'figma', '기획', '마케팅', '영업', '인사'
+]
+REGIONS = ['서울', '경기', '인천', '부산', '대전']
+
+def make_rows(rows: int) -> pd.DataFrame:
+    """KEYWORD_COLUMNS와 정렬 컬럼을 가진 가상 후보자 데이터 생성"""
+    random.seed(0)
+    now = datetime(2024, 1, 1)
+    data = {
+        'saramin_key': [f'key_{i}' for i in range(rows)],
+        'update_dt': [now] * rows,
+        WORK_YEAR_COLUMN: [f"{random.randint(0, 15)}년" for _ in range(rows)],
+        WORK_REGION_COLUMN: [random.choice(REGIONS) for _ in range(rows)],
+        'regex_desired_annual_salary': [f"{random.randint(30, 90) * 100}만원" for _ in range(rows)],
+        'regex_login_dt': [
+            (now - timedelta(days=random.randint(0, 365))).strftime('%Y-%m-%d') for _ in range(rows)
+        ]
+    }
+    for column in KEYWORD_COLUMNS:
+        data[column] = [' '.join(random.sample(VOCABULARY, 4)) for _ in range(rows)]
+    return pd.DataFrame(data)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--keywords', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    frame = make_rows(args.rows)
+    engine = CandidateScoringEngine()
+    engine._load_rows = lambda since=None: frame
+
+    started = time.perf_counter()
+    engine.refresh()
+    print(f"적재: {args.rows}명 {time.perf_counter() - started:.2f}s")
+
+    keywords = VOCABULARY[:args.keywords]
+    job_description = "3~6년 경력, 서울 근무, 연봉 6000만원"
+    for attempt in range(args.repeat):
+        started = time.perf_counter()
+        ranked = engine.rank(keywords, job_description)
+        label = "첫 실행 (일치 벡터 계산)" if attempt == 0 else "캐시 사용"
+        print(f"순위 계산 {label}: {(time.perf_counter() - started) * 1000:.1f}ms, 상위 {ranked[:3]}")
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,65 @@
 from openai import OpenAI
-from typing import Dict, Optional, List, Tuple
+from typing import Callable, Dict, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from utils.database import get_latest_prompt_template, save_prompt_execution
+from src.utils.database import (
+    get_latest_prompt_template,
+    save_prompt_execution,
+    save_filtering_intermediates
+)
+from src.services.query_builder import build_filtering_query
+from src.services.llm_cache import get_llm_cache
+
+def run_concurrently(tasks: Dict[str, Callable[[], object]]) -> Dict[str, object]:
+    """서로 독립적인 단계들을 스레드 풀에서 동시에 실행하고 이름별 결과를 반환"""
+    # 작업 스레드에서도 st.session_state / st.error를 쓸 수 있도록 스크립트 컨텍스트 전달
+    ctx = get_script_run_ctx()
+    
+    def run_with_ctx(task):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return task()
+    
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {name: executor.submit(run_with_ctx, task) for name, task in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+RECRUITER_SYSTEM_MESSAGE = "You are a helpful HR recruiter. Answer in Korean."
+SQL_SYSTEM_MESSAGE = "You are a helpful SQL expert. Answer with SQL query only, without ```sql or ``` tags."
 
 class AIService:
     def __init__(self):
         self.client = OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
+        self.cache = get_llm_cache()
+    
+    def _complete(self, prompt: str, system_message: str = RECRUITER_SYSTEM_MESSAGE, 
+                  model: str = "gpt-4") -> str:
+        """temperature=0 채팅 완성 호출 (동일 요청은 캐시된 응답 재사용)"""
+        use_cache = not st.session_state.get('llm_cache_bypass', False)
+        cache_key = self.cache.make_key(model, system_message, prompt)
+        
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0
+        )
+        content = response.choices[0].message.content.strip()
+        
+        if use_cache:
+            self.cache.set(cache_key, model, content)
+        return content
     
     def extract_job_keywords(self, job_description: str) -> dict:
         """직무 키워드 추출"""
@@ -17,16 +68,7 @@ class AIService:
             template = get_latest_prompt_template('keyword_extraction')
             prompt = template['template_content'].replace('{job_description}', job_description)
             
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a helpful HR recruiter. Answer in Korean."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0
-            )
-            
-            keywords = response.choices[0].message.content.strip()
+            keywords = self._complete(prompt)
             
             # 실행 이력 저장
             save_prompt_execution(
@@ -57,16 +99,7 @@ class AIService:
             {job_type}
             """
             
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a helpful HR recruiter. Answer in Korean."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0
-            )
-            
-            keywords = response.choices[0].message.content.strip()
+            keywords = self._complete(prompt)
             return {
                 "prompt": prompt,
                 "keywords": keywords,
@@ -90,16 +123,7 @@ class AIService:
             prompt = combine_prompt.replace("{extracted_keywords}", extracted_keywords)
             prompt = prompt.replace("{refined_keywords}", refined_keywords)
             
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a helpful HR recruiter. Answer in Korean."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0
-            )
-            
-            keywords = response.choices[0].message.content.strip()
+            keywords = self._complete(prompt)
             return {
                 "prompt": prompt,
                 "keywords": keywords,
@@ -110,8 +134,56 @@ class AIService:
             st.error(f"키워드 통합 중 오류 발생: {str(e)}")
             return None
 
-    def generate_sql(self, keywords: str, job_description: str = "") -> dict:
-        """SQL 쿼리 생성 (Step 4)"""
+    def run_keyword_pipeline(self, job_description: str, job_type: str, 
+                             filtering_id: Optional[int] = None) -> dict:
+        """키워드 추출(Step 1)과 정제(Step 2)를 동시에 실행한 뒤 통합(Step 3)
+        
+        filtering_id가 주어지면 세 단계의 결과를 한 번에 중간 결과로 저장한다.
+        """
+        results = run_concurrently({
+            'keyword_extraction': lambda: self.extract_job_keywords(job_description),
+            'keyword_refinement': lambda: self.refine_job_keywords(job_type)
+        })
+        extracted = results['keyword_extraction']
+        refined = results['keyword_refinement']
+        if not extracted or not refined:
+            return None
+        
+        combined = self.combine_keywords(extracted['keywords'], refined['keywords'])
+        if not combined:
+            return None
+        
+        if filtering_id is not None:
+            save_filtering_intermediates(filtering_id, [
+                ('keyword_extraction', extracted),
+                ('keyword_refinement', refined),
+                ('keyword_combination', combined)
+            ])
+        
+        return {
+            "extracted_keywords": extracted,
+            "refined_keywords": refined,
+            "combined_keywords": combined
+        }
+
+    def generate_sql(self, keywords: str, job_description: str = "", use_llm: bool = False) -> dict:
+        """SQL 쿼리 생성 (Step 4)
+        
+        기본적으로 쿼리 빌더로 즉시 생성하며, use_llm이 True인 경우에만 GPT 프롬프트를 사용한다.
+        """
+        if not use_llm:
+            try:
+                result = build_filtering_query(keywords, job_description)
+                return {
+                    "prompt": None,
+                    "query": result['query'],
+                    "keywords": keywords,
+                    "builder": result
+                }
+            except Exception as e:
+                st.error(f"SQL 생성 중 오류 발생: {str(e)}")
+                return None
+        
         try:
             # SQL 프롬프트 템플릿
             sql_prompt = st.session_state.get('current_sql_prompt', """
@@ -134,16 +206,7 @@ class AIService:
             prompt = sql_prompt.replace("{keywords}", keywords)
             prompt = prompt.replace("{job_description}", job_description)
 
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a helpful SQL expert. Answer with SQL query only, without ```sql or ``` tags."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0
-            )
-            
-            query = response.choices[0].message.content.strip()
+            query = self._complete(prompt, system_message=SQL_SYSTEM_MESSAGE)
             return {
                 "prompt": prompt,
                 "query": query,
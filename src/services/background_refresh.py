@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Optional
+
+class PeriodicRefresher:
+    """refresh()/rebuild()를 가진 메모리 캐시를 데몬 스레드에서 주기적으로 갱신
+
+    refresh_interval마다 증분 갱신하고, 마지막 전체 재적재 후 rebuild_interval이 지났으면
+    전체 재적재한다. 요청 스레드는 DB 조회를 기다리지 않고 현재 캐시로 바로 응답한다.
+    """
+
+    def __init__(self, target, name: str, refresh_interval: float, rebuild_interval: float):
+        self.target = target
+        self.name = name
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+
+    def start(self):
+        """백그라운드 갱신 스레드 시작 (이미 실행 중이면 그대로)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def run_once(self) -> int:
+        """재적재 주기가 지났으면 전체 재적재, 아니면 증분 갱신"""
+        last_rebuilt_at = self.target.last_rebuilt_at
+        if last_rebuilt_at is None or time.time() - last_rebuilt_at >= self.rebuild_interval:
+            return self.target.rebuild()
+        return self.target.refresh()
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.run_once()
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)  # 기존 캐시를 유지하고 다음 주기에 재시도
+
+    def stop(self):
+        """백그라운드 갱신 스레드 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
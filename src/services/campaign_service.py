@@ -0,0 +1,107 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import streamlit as st
+from src.utils import async_database
+from src.utils.database import (
+    ensure_campaign_tables,
+    create_campaign,
+    get_campaign,
+    get_position_campaigns,
+    get_resumable_campaign_candidates
+)
+from src.utils.rate_limiter import run_bounded
+from src.services.job_service import CANDIDATE_FIELDS
+from src.services.send_outbox import ScoutSendOutbox
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_SECONDS = 2.0
+MAX_RETRY_DELAY = 60.0
+
+def retry_delay(attempts: int) -> float:
+    """attempts번 실패한 후보자를 다시 시도하기 전 대기 시간 (지수 백오프)"""
+    base = float(st.secrets.get("CAMPAIGN_RETRY_BASE_SECONDS", DEFAULT_RETRY_BASE_SECONDS))
+    return min(MAX_RETRY_DELAY, base * 2 ** (attempts - 1)) if attempts else 0.0
+
+_tables_ready = False
+
+def _ensure_tables():
+    global _tables_ready
+    if not _tables_ready:
+        ensure_campaign_tables()
+        _tables_ready = True
+
+def start_campaign(position_id: int, candidates: List[Dict], message: Dict) -> int:
+    """발송 캠페인 기록 생성 후 campaign_id 반환"""
+    _ensure_tables()
+    return create_campaign(
+        position_id,
+        message,
+        [{field: candidate.get(field) for field in CANDIDATE_FIELDS} for candidate in candidates]
+    )
+
+def list_resumable_campaigns(position_id: int) -> List[Dict]:
+    """끝까지 발송하지 못한 캠페인 목록 (중단되었거나 실패가 남은 캠페인)"""
+    _ensure_tables()
+    return [
+        campaign for campaign in get_position_campaigns(position_id)
+        if campaign['status'] != 'completed'
+    ]
+
+def load_campaign_for_resume(campaign_id: int,
+                             max_attempts: Optional[int] = None) -> Tuple[Dict, List[Dict]]:
+    """(캠페인, 이어서 발송할 후보자 목록) 조회"""
+    max_attempts = max_attempts or int(st.secrets.get("CAMPAIGN_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS))
+    campaign = get_campaign(campaign_id)
+    if campaign is None:
+        raise ValueError(f"캠페인을 찾을 수 없습니다: {campaign_id}")
+    return campaign, get_resumable_campaign_candidates(campaign_id, max_attempts)
+
+async def run_campaign(campaign_id: int, candidates: List[Dict],
+                       send: Callable[[Dict], Awaitable[bool]],
+                       max_attempts: int = 1, concurrency: Optional[int] = None,
+                       progress_callback: Optional[Callable[[int, int], None]] = None,
+                       outbox: Optional[ScoutSendOutbox] = None) -> Tuple[int, List[Dict]]:
+    """후보자별 시도 결과를 저장하며 발송하고 (성공 건수, 최종 실패 후보자) 반환
+
+    이전에 실패한 후보자(attempts > 0)는 지수 백오프 후 다시 시도하고,
+    max_attempts번까지 실패하면 포기한다. outbox(campaign_id 지정)가 주어지면 성공 기록은
+    send가 outbox에 넣은 발송 결과와 함께 저장되므로 여기서는 실패만 바로 기록하고,
+    캠페인 종료 전에 outbox를 비워 저장되지 못한 후보자가 완료로 남지 않게 한다.
+    """
+    failed = []
+
+    async def handle(candidate: Dict) -> bool:
+        attempts = candidate.get('attempts', 0)
+        while True:
+            if attempts:
+                await asyncio.sleep(retry_delay(attempts))
+
+            error = None
+            try:
+                success = await send(candidate)
+            except Exception as e:
+                success = False
+                error = str(e)
+            attempts += 1
+            if not (success and outbox is not None):
+                await async_database.record_campaign_attempt(
+                    campaign_id, candidate['saramin_key'], success,
+                    error or (None if success else "발송 실패")
+                )
+
+            if success:
+                return True
+            if attempts >= max_attempts:
+                failed.append(candidate)
+                return False
+
+    try:
+        success_count = await run_bounded(candidates, handle, concurrency, progress_callback)
+    finally:
+        try:
+            if outbox is not None:
+                await async_database.run_db(outbox.close)
+        finally:
+            await async_database.finish_campaign(campaign_id)
+    return success_count, failed
@@ -0,0 +1,209 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import streamlit as st
+
+from src.utils.database import get_db_connection
+from src.services.background_refresh import PeriodicRefresher
+from src.services.query_builder import KEYWORD_COLUMNS
+
+NGRAM_SIZE = 2  # 한글 키워드는 두 글자가 많아 bigram 사용
+FETCH_SIZE = 5000
+DEFAULT_REFRESH_INTERVAL = 60  # 초
+DEFAULT_REBUILD_INTERVAL = 3600  # 초, 삭제된 후보자를 반영하기 위한 전체 재색인 주기
+
+def _normalize(text: str) -> str:
+    """ILIKE와 같이 소문자로 바꿔 비교"""
+    return (text or '').lower()
+
+def _ngrams(text: str) -> Set[str]:
+    if len(text) < NGRAM_SIZE:
+        return {text} if text else set()
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+class CandidateSearchIndex:
+    """scraping_saramin_candidates의 키워드 컬럼에 대한 n-gram 역색인
+
+    LIKE '%키워드%'와 같은 부분 문자열 일치를 posting list 교집합으로 후보를 좁힌 뒤
+    원문 확인으로 판정한다 (build_filtering_query의 ILIKE와 같이 대소문자 구분 없음).
+    update_dt 기준으로 증분 갱신된다.
+    DB 조회와 전체 색인 생성은 잠금 밖에서 하고, 결과를 반영할 때만 잠금을 잡아 검색이 멈추지 않는다.
+    """
+
+    def __init__(self, columns: List[str] = KEYWORD_COLUMNS):
+        self.columns = columns
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()  # 갱신은 한 번에 하나만
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self._texts: Dict[int, str] = {}
+        self._doc_ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._watermark = None
+        self.last_refreshed_at = None
+        self.last_rebuilt_at = None
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _index_document(self, saramin_key: str, text: str):
+        doc_id = self._doc_ids.get(saramin_key)
+        if doc_id is None:
+            doc_id = len(self._keys)
+            self._keys.append(saramin_key)
+            self._doc_ids[saramin_key] = doc_id
+        else:
+            # 기존 n-gram 제거 후 다시 색인
+            for gram in _ngrams(self._texts[doc_id]):
+                postings = self._postings.get(gram)
+                if postings is not None:
+                    postings.discard(doc_id)
+                    if not postings:
+                        del self._postings[gram]
+
+        self._texts[doc_id] = text
+        for gram in _ngrams(text):
+            self._postings[gram].add(doc_id)
+
+    def _fetch(self, since=None) -> list:
+        """since 이후 갱신된 후보자의 (saramin_key, update_dt, 정규화 텍스트) 목록 (since가 없으면 전체)"""
+        query = f"""
+            SELECT saramin_key, update_dt, {', '.join(self.columns)}
+            FROM scraping_saramin_candidates
+        """
+        params = ()
+        if since is not None:
+            # 같은 시각에 갱신된 행을 놓치지 않도록 >= 비교 (재색인은 멱등),
+            # update_dt가 없는 행은 워터마크로 구분할 수 없으므로 매번 다시 색인
+            query += " WHERE update_dt >= %s OR update_dt IS NULL"
+            params = (since,)
+
+        rows = []
+        with get_db_connection() as conn:
+            with conn.cursor(name="candidate_index_refresh") as cur:
+                cur.itersize = FETCH_SIZE
+                cur.execute(query, params)
+                for row in cur:
+                    text = "\n".join(_normalize(value) for value in row[2:] if value)
+                    rows.append((row[0], row[1], text))
+        return rows
+
+    @staticmethod
+    def _max_update_dt(rows: list, watermark=None):
+        for _, update_dt, _ in rows:
+            if update_dt is not None and (watermark is None or update_dt > watermark):
+                watermark = update_dt
+        return watermark
+
+    def refresh(self) -> int:
+        """마지막 갱신 이후 추가/수정된 후보자만 색인 (최초 호출 시 전체 색인)"""
+        with self._refresh_lock:
+            if self._watermark is None:
+                return self._rebuild_unlocked()
+
+            rows = self._fetch(self._watermark)
+            with self._lock:
+                for saramin_key, _, text in rows:
+                    self._index_document(saramin_key, text)
+                self._watermark = self._max_update_dt(rows, self._watermark)
+                self.last_refreshed_at = time.time()
+            return len(rows)
+
+    def _rebuild_unlocked(self) -> int:
+        # 새 색인을 잠금 밖에서 만든 뒤 교체
+        rows = self._fetch()
+        fresh = CandidateSearchIndex(self.columns)
+        for saramin_key, _, text in rows:
+            fresh._index_document(saramin_key, text)
+
+        with self._lock:
+            self._postings = fresh._postings
+            self._texts = fresh._texts
+            self._doc_ids = fresh._doc_ids
+            self._keys = fresh._keys
+            self._watermark = self._max_update_dt(rows)
+            self.last_refreshed_at = self.last_rebuilt_at = time.time()
+        return len(rows)
+
+    def rebuild(self) -> int:
+        """전체 재색인 후 교체 (삭제된 후보자 반영용)"""
+        with self._refresh_lock:
+            return self._rebuild_unlocked()
+
+    def _match(self, keyword: str) -> Set[int]:
+        """키워드를 부분 문자열로 포함하는 문서 집합"""
+        keyword = _normalize(keyword)
+        if not keyword:
+            return set()
+
+        if len(keyword) < NGRAM_SIZE:
+            return {doc_id for doc_id, text in self._texts.items() if keyword in text}
+
+        # 짧은 posting list부터 교집합
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in _ngrams(keyword)),
+            key=len
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+
+        return {doc_id for doc_id in candidates if keyword in self._texts[doc_id]}
+
+    def search(self, keywords: List[str], min_match: int = 1,
+               limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """min_match개 이상 키워드가 일치하는 후보자를 일치 개수 순으로 반환"""
+        counts: Dict[int, int] = defaultdict(int)
+        with self._lock:
+            for keyword in dict.fromkeys(keywords):
+                for doc_id in self._match(keyword):
+                    counts[doc_id] += 1
+
+            ranked = sorted(
+                ((self._keys[doc_id], count) for doc_id, count in counts.items() if count >= min_match),
+                key=lambda item: item[1],
+                reverse=True
+            )
+        return ranked[:limit] if limit else ranked
+
+    def stats(self) -> dict:
+        """색인 상태"""
+        with self._lock:
+            return {
+                'documents': len(self._texts),
+                'ngrams': len(self._postings),
+                'watermark': self._watermark,
+                'last_refreshed_at': self.last_refreshed_at,
+                'last_rebuilt_at': self.last_rebuilt_at
+            }
+
+_index = None
+_refresher = None
+_index_lock = threading.Lock()
+
+def get_candidate_index(refresh: bool = True) -> CandidateSearchIndex:
+    """프로세스 전역 후보자 색인 조회
+
+    최초 색인만 호출한 스레드에서 하고, 이후 증분 갱신/전체 재색인은 백그라운드 스레드가
+    주기적으로 하므로 검색은 DB 조회를 기다리지 않는다.
+    """
+    global _index, _refresher
+    with _index_lock:
+        if _index is None:
+            _index = CandidateSearchIndex()
+
+    if refresh:
+        if _index.last_refreshed_at is None:
+            _index.refresh()
+        with _index_lock:
+            if _refresher is None:
+                _refresher = PeriodicRefresher(
+                    _index,
+                    name="candidate-index-refresh",
+                    refresh_interval=float(st.secrets.get("CANDIDATE_INDEX_REFRESH_INTERVAL", DEFAULT_REFRESH_INTERVAL)),
+                    rebuild_interval=float(st.secrets.get("CANDIDATE_INDEX_REBUILD_INTERVAL", DEFAULT_REBUILD_INTERVAL))
+                ).start()
+    return _index
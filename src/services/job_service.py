@@ -0,0 +1,161 @@
+import asyncio
+from typing import Dict, List
+from src.utils import async_database
+from src.utils.database import (
+    JobLeaseLost,
+    ensure_job_queue_table,
+    enqueue_jobs,
+    finish_job,
+    get_position_candidates
+)
+from src.utils.playwright_helper import BrowserPool
+from src.utils.rate_limiter import HostRateLimiter
+from src.services.playwright_service import PlaywrightService
+from src.services.scout_service import check_and_collect_candidate
+
+SCOUT_SEND_JOB = 'scout_send'
+RESPONSE_SWEEP_JOB = 'response_sweep'
+DEFAULT_CHUNK_SIZE = 50  # 작업 하나에 담을 후보자 수 (워커 여러 개가 나눠서 처리)
+HEARTBEAT_INTERVAL = 30  # 초, dequeue_job의 stale_after_seconds(300초)보다 충분히 짧게
+
+# 작업 payload에 담을 후보자 필드
+CANDIDATE_FIELDS = ['saramin_key', 'page_url', 'name', 'name_extraction', 'mapping_id']
+
+def submit_scout_send_job(position_id: int, candidates: List[Dict], message: Dict,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """스카우트 발송 작업 등록 (chunk_size명 단위로 나눠 등록) 후 batch_id 반환"""
+    ensure_job_queue_table()
+    slim_candidates = [
+        {field: candidate.get(field) for field in CANDIDATE_FIELDS}
+        for candidate in candidates
+    ]
+    chunks = [
+        slim_candidates[i:i + chunk_size]
+        for i in range(0, len(slim_candidates), chunk_size)
+    ]
+    return enqueue_jobs(
+        SCOUT_SEND_JOB,
+        position_id,
+        [{'message': message, 'candidates': chunk} for chunk in chunks],
+        [len(chunk) for chunk in chunks]
+    )
+
+def submit_response_sweep_job(position_id: int) -> str:
+    """응답 상태 확인 작업 등록 후 batch_id 반환"""
+    ensure_job_queue_table()
+    candidates = [
+        {field: candidate.get(field) for field in CANDIDATE_FIELDS}
+        for candidate in get_position_candidates(position_id)
+    ]
+    return enqueue_jobs(
+        RESPONSE_SWEEP_JOB,
+        position_id,
+        [{'candidates': candidates}],
+        [len(candidates)]
+    )
+
+async def _run_items(job: Dict, handle) -> str:
+    """체크포인트 위치부터 후보자를 하나씩 처리하고 매 건마다 진행 위치 저장"""
+    candidates = job['payload'].get('candidates', [])
+    succeeded = job['succeeded']
+    failed = job['failed']
+
+    for position in range(job['cursor_position'], len(candidates)):
+        if await async_database.get_job_status(job['id']) == 'cancelled':
+            return 'cancelled'
+
+        error = None
+        try:
+            if await handle(candidates[position]):
+                succeeded += 1
+            else:
+                failed += 1
+        except Exception as e:
+            failed += 1
+            error = str(e)
+
+        await async_database.checkpoint_job(
+            job['id'], job['worker_id'], position + 1, succeeded, failed, error
+        )
+
+    return 'completed'
+
+async def _run_scout_send(job: Dict) -> str:
+    message = job['payload']['message']
+    service = PlaywrightService()
+    service.rate_limiter = HostRateLimiter()
+
+    async with BrowserPool(size=1) as pool:
+        service.browser_pool = pool
+
+        async def handle(candidate):
+            if not await service.send_scout_message(candidate, message):
+                return False
+            await async_database.mark_scout_sent(job['position_id'], candidate['saramin_key'], message['id'])
+            return True
+
+        return await _run_items(job, handle)
+
+async def _run_response_sweep(job: Dict) -> str:
+    position_details = await async_database.get_position_details(job['position_id'])
+    if not position_details or not position_details.get('scout_url'):
+        raise ValueError("스카우트 응답 확인 URL이 없습니다.")
+
+    async with BrowserPool(size=1) as pool:
+        async def handle(candidate):
+            await check_and_collect_candidate(position_details['scout_url'], candidate, pool)
+            return True
+
+        return await _run_items(job, handle)
+
+JOB_HANDLERS = {
+    SCOUT_SEND_JOB: _run_scout_send,
+    RESPONSE_SWEEP_JOB: _run_response_sweep
+}
+
+async def _heartbeat(job: Dict, interval: float):
+    """후보자 한 명 처리가 오래 걸려도 작업을 뺏기지 않도록 주기적으로 heartbeat 갱신"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await async_database.heartbeat_job(job['id'], job['worker_id'])
+        except JobLeaseLost:
+            raise
+        except Exception as e:
+            # 일시적인 DB 오류는 다음 주기에 다시 시도
+            print(f"작업 #{job['id']} heartbeat 실패: {e}")
+
+async def _run_with_heartbeat(handler, job: Dict, interval: float = HEARTBEAT_INTERVAL) -> str:
+    """handler 실행 중 별도 태스크로 heartbeat를 보내고, 작업을 잃으면 handler를 중단"""
+    work = asyncio.ensure_future(handler(job))
+    heartbeat = asyncio.ensure_future(_heartbeat(job, interval))
+    try:
+        await asyncio.wait({work, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+        if work.done():
+            return work.result()
+        # heartbeat 태스크는 JobLeaseLost로만 끝나므로 handler를 중단하고 예외를 전달
+        work.cancel()
+        await asyncio.gather(work, return_exceptions=True)
+        raise heartbeat.exception()
+    finally:
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+
+def run_job(job: Dict):
+    """작업 하나 실행 후 종료 상태 기록 (다른 워커가 가져간 작업이면 기록하지 않고 중단)"""
+    handler = JOB_HANDLERS.get(job['job_type'])
+    try:
+        if handler is None:
+            finish_job(job['id'], job['worker_id'], 'failed', f"알 수 없는 작업 유형: {job['job_type']}")
+            return
+
+        try:
+            status = asyncio.run(_run_with_heartbeat(handler, job))
+            if status != 'cancelled':
+                finish_job(job['id'], job['worker_id'], status)
+        except JobLeaseLost:
+            raise
+        except Exception as e:
+            finish_job(job['id'], job['worker_id'], 'failed', str(e))
+    except JobLeaseLost as e:
+        print(f"작업 #{job['id']} 중단: {e}")
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import streamlit as st
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "llm_responses.sqlite3")
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # 7일
+DEFAULT_MAX_ENTRIES = 5000
+
+class LLMResponseCache:
+    """temperature=0 LLM 응답을 (model, system, prompt) 해시로 저장하는 디스크 캐시"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed_at REAL NOT NULL
+                )
+            """)
+
+    @contextmanager
+    def _connect(self):
+        """sqlite 연결 컨텍스트 매니저 (정상 종료 시 커밋)"""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(model: str, system_message: str, prompt: str) -> str:
+        """캐시 키 생성"""
+        payload = json.dumps([model, system_message, prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (만료된 항목은 미스로 처리)"""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_response_cache WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE llm_response_cache SET last_accessed_at = ? WHERE cache_key = ?",
+                (now, key)
+            )
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, model: str, response: str):
+        """응답 저장 후 TTL/크기 기준으로 오래된 항목 정리"""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO llm_response_cache
+                (cache_key, model, response, created_at, last_accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (key, model, response, now, now))
+
+            expired = conn.execute(
+                "DELETE FROM llm_response_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            ).rowcount
+
+            # 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+            overflow = conn.execute("""
+                DELETE FROM llm_response_cache
+                WHERE cache_key IN (
+                    SELECT cache_key FROM llm_response_cache
+                    ORDER BY last_accessed_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,)).rowcount
+
+            self.evictions += expired + overflow
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_response_cache")
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계"""
+        with self._lock, self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_ratio': self.hits / total if total else 0.0
+        }
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_llm_cache() -> LLMResponseCache:
+    """프로세스 전역 LLM 응답 캐시 조회"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(
+                    path=st.secrets.get("LLM_CACHE_PATH", DEFAULT_CACHE_PATH),
+                    ttl_seconds=int(st.secrets.get("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+                    max_entries=int(st.secrets.get("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+                )
+    return _cache
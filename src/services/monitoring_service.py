@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from src.utils.database import count_pending_tasks, get_recent_tasks
+
+DEFAULT_POLL_INTERVAL = 5  # 초
+IDLE_TIMEOUT = 60  # 초, 이 시간 동안 조회하는 화면이 없으면 폴링 중지
+HISTORY_SIZE = 720  # 보관할 샘플 수 (5초 주기 기준 1시간)
+THROUGHPUT_WINDOW = 300  # 초, 처리 속도 계산 구간
+STALL_AFTER = 300  # 초, 남은 작업이 있는데 이 시간 동안 줄지 않으면 정체로 판단
+
+class ProgressRecorder:
+    """남은 작업 수 샘플을 링 버퍼에 기록하고 처리 속도/ETA/정체 여부 계산"""
+
+    def __init__(self, size: int = HISTORY_SIZE):
+        self._samples = deque(maxlen=size)  # (timestamp, pending_count, completed)
+        self.last_progress_at = None
+
+    def record(self, pending_count: int, timestamp: Optional[float] = None):
+        timestamp = timestamp or time.time()
+        completed = 0
+        if self._samples:
+            # 새 작업이 추가되어 늘어난 경우는 완료로 보지 않음
+            completed = max(0, self._samples[-1][1] - pending_count)
+        if completed or self.last_progress_at is None:
+            self.last_progress_at = timestamp
+        self._samples.append((timestamp, pending_count, completed))
+
+    def history(self) -> List[Dict]:
+        return [
+            {'timestamp': ts, 'pending_count': pending, 'completed': completed}
+            for ts, pending, completed in self._samples
+        ]
+
+    def metrics(self, window: float = THROUGHPUT_WINDOW, stall_after: float = STALL_AFTER) -> Dict:
+        """최근 window초 기준 분당 처리량, 예상 완료 시간, 정체 여부"""
+        if not self._samples:
+            return {'throughput_per_min': None, 'eta_seconds': None, 'stalled': False, 'peak_pending': None}
+
+        now, pending, _ = self._samples[-1]
+        recent = [sample for sample in self._samples if sample[0] >= now - window]
+        elapsed = now - recent[0][0]
+        # 구간 첫 샘플의 완료 수는 구간 이전 변화이므로 제외
+        completed = sum(sample[2] for sample in recent[1:])
+        throughput = completed / elapsed * 60 if elapsed > 0 else None
+
+        eta = None
+        if pending == 0:
+            eta = 0
+        elif throughput:
+            eta = pending / throughput * 60
+
+        stalled = bool(
+            pending > 0
+            and self.last_progress_at is not None
+            and now - self.last_progress_at >= stall_after
+        )
+        return {
+            'throughput_per_min': throughput,
+            'eta_seconds': eta,
+            'stalled': stalled,
+            'peak_pending': max(sample[1] for sample in self._samples)
+        }
+
+class TaskMonitor:
+    """스크래핑 작업 현황을 하나의 백그라운드 스레드가 주기적으로 조회하여 공유
+
+    모니터링 화면을 보는 사람이 여럿이어도 DB 조회는 폴링 주기마다 한 번만 일어난다.
+    """
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL, idle_timeout: float = IDLE_TIMEOUT):
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._last_access = 0.0
+        self.recorder = ProgressRecorder()
+        self._snapshot = {
+            'pending_count': None,
+            'count_mode': None,
+            'recent_tasks': [],
+            'updated_at': None,
+            'error': None,
+            'metrics': self.recorder.metrics(),
+            'history': []
+        }
+
+    def _poll(self):
+        try:
+            pending = count_pending_tasks()
+            pending_count = pending['count']
+            recent_tasks = get_recent_tasks()
+            with self._lock:
+                self.recorder.record(pending_count)
+                self._snapshot = {
+                    'pending_count': pending_count,
+                    'count_mode': pending['mode'],
+                    'recent_tasks': recent_tasks,
+                    'updated_at': time.time(),
+                    'error': None,
+                    'metrics': self.recorder.metrics(),
+                    'history': self.recorder.history()
+                }
+        except Exception as e:
+            with self._lock:
+                self._snapshot = {**self._snapshot, 'error': str(e)}
+
+    def _run(self):
+        while True:
+            self._poll()
+            time.sleep(self.poll_interval)
+            with self._lock:
+                if time.monotonic() - self._last_access > self.idle_timeout:
+                    self._thread = None
+                    return
+
+    def snapshot(self) -> Dict:
+        """최신 현황 조회 (폴링 스레드가 없으면 시작)"""
+        with self._lock:
+            self._last_access = time.monotonic()
+            first_start = self._snapshot['updated_at'] is None
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="task-monitor", daemon=True)
+                self._thread.start()
+
+        # 최초 조회는 결과가 나올 때까지 잠시 대기
+        if first_start:
+            deadline = time.monotonic() + self.poll_interval
+            while time.monotonic() < deadline:
+                with self._lock:
+                    if self._snapshot['updated_at'] is not None or self._snapshot['error']:
+                        break
+                time.sleep(0.05)
+
+        with self._lock:
+            return dict(self._snapshot)
+
+_monitor = None
+_monitor_lock = threading.Lock()
+
+def get_task_monitor() -> TaskMonitor:
+    """프로세스 전역 작업 모니터 조회"""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = TaskMonitor(
+                poll_interval=float(st.secrets.get("MONITOR_POLL_INTERVAL", DEFAULT_POLL_INTERVAL))
+            )
+    return _monitor
@@ -1,22 +1,26 @@
-from playwright.async_api import async_playwright
-import asyncio
 from typing import Dict, List
 import streamlit as st
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.utils.playwright_helper import BrowserPool, pooled_page, navigate
+from src.utils.rate_limiter import HostRateLimiter, run_bounded, DEFAULT_CONCURRENCY
 
 class PlaywrightService:
     def __init__(self):
         self.progress_callback = None
         self.error_callback = None
+        self.browser_pool = None  # process_candidates 실행 중에만 사용
+        self.rate_limiter = None
     
     async def send_scout_message(self, candidate: Dict, message: Dict) -> bool:
         """단일 후보자에게 스카우트 메시지 발송"""
+        bucket = self.rate_limiter.bucket(candidate.get('page_url')) if self.rate_limiter else None
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-                
-                # 사람인 페이지 접속
-                await page.goto(candidate.get('page_url', '#'))
+            if bucket:
+                await bucket.acquire()
+            
+            async with pooled_page(self.browser_pool) as page:
+                # 사람인 페이지 접속 (메시지 입력란이 생기면 바로 진행)
+                await navigate(page, candidate.get('page_url', '#'), wait_for="#scout_title")
                 
                 # 메시지 입력
                 await page.fill("#scout_title", message['title'])
@@ -28,28 +32,34 @@ class PlaywrightService:
                 # 발송 완료 확인
                 success = await page.wait_for_selector(".success_message", timeout=10000)
                 
-                await browser.close()
+                if bucket and success:
+                    bucket.on_success()
+                elif bucket:
+                    bucket.on_failure()
                 return bool(success)
                 
         except Exception as e:
+            if bucket:
+                bucket.on_failure(timeout=isinstance(e, PlaywrightTimeoutError))
             if self.error_callback:
                 self.error_callback(f"발송 실패 ({candidate['name']}): {str(e)}")
             return False
 
-    async def process_candidates(self, candidates: List[Dict], message: Dict):
-        """모든 후보자에게 순차적으로 메시지 발송"""
-        total = len(candidates)
-        success_count = 0
-        
-        for idx, candidate in enumerate(candidates, 1):
-            if self.progress_callback:
-                self.progress_callback(idx, total)
-            
-            success = await self.send_scout_message(candidate, message)
-            if success:
-                success_count += 1
-            
-            # 서버 부하 방지를 위한 딜레이
-            await asyncio.sleep(2)
+    async def process_candidates(self, candidates: List[Dict], message: Dict, concurrency: int = None):
+        """후보자들에게 동시에 메시지 발송 (동시 발송 수 제한 + 호스트별 발송 속도 제한)"""
+        concurrency = concurrency or int(st.secrets.get("SCOUT_CONCURRENCY", DEFAULT_CONCURRENCY))
         
-        return success_count 
\ No newline at end of file
+        # 캠페인 동안 브라우저 하나를 띄워두고 페이지를 재사용
+        async with BrowserPool(size=concurrency) as pool:
+            self.browser_pool = pool
+            self.rate_limiter = HostRateLimiter()
+            try:
+                return await run_bounded(
+                    candidates,
+                    lambda candidate: self.send_scout_message(candidate, message),
+                    concurrency=concurrency,
+                    progress_callback=self.progress_callback
+                )
+            finally:
+                self.browser_pool = None
+                self.rate_limiter = None
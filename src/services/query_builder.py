@@ -0,0 +1,171 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 키워드와 비교할 후보자 텍스트 컬럼
+KEYWORD_COLUMNS = [
+    'regex_my_skills',
+    'regex_desired_job',
+    'regex_keywords',
+    'regex_work_experience'
+]
+
+# 결과로 표시할 컬럼
+RESULT_COLUMNS = [
+    'saramin_key',
+    'birth_year',
+    'location',
+    'regex_desired_annual_salary',
+    'regex_desired_job',
+    'regex_login_dt'
+]
+
+# 채용공고에서 인식할 지역명
+REGIONS = [
+    '서울', '경기', '인천', '부산', '대구', '광주', '대전', '울산', '세종',
+    '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주'
+]
+
+DEFAULT_LIMIT = 20
+OPEN_ENDED_EXPERIENCE_SPAN = 5  # "N년 이상"인 경우 N ~ N+5년으로 비교
+
+# regex_desired_annual_salary의 첫 번째 숫자(만원 단위)를 정수로 변환
+_SALARY_EXPR = (
+    "NULLIF(regexp_replace(split_part(regex_desired_annual_salary, '~', 1), "
+    "'[^0-9]', '', 'g'), '')::bigint"
+)
+
+def parse_keywords(keywords: str) -> List[str]:
+    """LLM이 산출한 키워드 문자열을 키워드 목록으로 변환 (번호/기호 제거, 중복 제거)"""
+    result = []
+    for token in re.split(r'[\n,]', keywords or ''):
+        token = re.sub(r'^\s*(?:\d+[.)]|[-•*·])\s*', '', token).strip()
+        if token and token not in result:
+            result.append(token)
+    return result
+
+def parse_experience_range(job_description: str) -> Optional[Tuple[int, int]]:
+    """채용공고에서 경력 년수 요건 추출 (예: '4~6년차', '3년 이상')"""
+    text = job_description or ''
+
+    match = re.search(r'(\d+)\s*[~\-]\s*(\d+)\s*년', text)
+    if match:
+        low, high = sorted((int(match.group(1)), int(match.group(2))))
+        return low, high
+
+    match = re.search(r'(\d+)\s*년\s*(?:차\s*)?이상', text)
+    if match:
+        low = int(match.group(1))
+        return low, low + OPEN_ENDED_EXPERIENCE_SPAN
+
+    return None
+
+def parse_regions(job_description: str) -> List[str]:
+    """채용공고에서 언급된 지역 추출"""
+    text = job_description or ''
+    return [region for region in REGIONS if region in text]
+
+def parse_target_salary(job_description: str) -> Optional[int]:
+    """채용공고에서 기준 연봉(만원) 추출, 범위인 경우 중간값 사용"""
+    text = (job_description or '').replace(',', '')
+
+    match = re.search(r'(\d{4,5})\s*[~\-]\s*(\d{4,5})\s*만', text)
+    if match:
+        return (int(match.group(1)) + int(match.group(2))) // 2
+
+    match = re.search(r'연봉\D{0,10}(\d{4,5})\s*만', text)
+    if match:
+        return int(match.group(1))
+
+    return None
+
+def _escape_like(value: str) -> str:
+    """LIKE 패턴의 와일드카드 문자 이스케이프"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def _quote_literal(value) -> str:
+    """SQL 리터럴로 변환 (standard_conforming_strings=on 기준)"""
+    if isinstance(value, int):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+def render_query(query: str, params: list) -> str:
+    """파라미터를 리터럴로 치환하여 편집기에 표시할 SQL 생성"""
+    return query % tuple(_quote_literal(p) for p in params)
+
+def build_filtering_query(keywords: str, job_description: str = "",
+                          limit: int = DEFAULT_LIMIT) -> Dict:
+    """키워드/경력/지역 조건으로 후보자 필터링 SQL 생성 (LLM 없이 결정적으로 생성)
+
+    키워드/지역은 대소문자 구분 없이(ILIKE) 비교한다 (색인 검색/점수 엔진과 같은 기준).
+    키워드 일치 개수가 많은 순, 희망 연봉이 기준 연봉에 가까운 순,
+    regex_login_dt가 최근인 순으로 정렬한다.
+    """
+    keyword_list = parse_keywords(keywords)
+    if not keyword_list:
+        raise ValueError("키워드가 없습니다.")
+
+    params = []
+
+    # 키워드별 일치 여부 합산
+    score_terms = []
+    for keyword in keyword_list:
+        pattern = f"%{_escape_like(keyword)}%"
+        conditions = " OR ".join(f"{column} ILIKE %s" for column in KEYWORD_COLUMNS)
+        score_terms.append(f"CASE WHEN ({conditions}) THEN 1 ELSE 0 END")
+        params.extend([pattern] * len(KEYWORD_COLUMNS))
+    score_expr = "\n            + ".join(score_terms)
+
+    where_clauses = []
+
+    experience = parse_experience_range(job_description)
+    if experience:
+        low, high = experience
+        years = list(range(low, high + 1))
+        where_clauses.append(
+            "(" + " OR ".join("regex_work_year LIKE %s" for _ in years) + ")"
+        )
+        params.extend(f"%{year}년%" for year in years)
+
+    regions = parse_regions(job_description)
+    if regions:
+        where_clauses.append(
+            "(" + " OR ".join("regex_desired_work_region ILIKE %s" for _ in regions) + ")"
+        )
+        params.extend(f"%{_escape_like(region)}%" for region in regions)
+
+    where_sql = ("WHERE " + "\n          AND ".join(where_clauses)) if where_clauses else ""
+
+    order_terms = ["keyword_match_count DESC"]
+    target_salary = parse_target_salary(job_description)
+    if target_salary is not None:
+        order_terms.append(f"ABS({_SALARY_EXPR} - %s) ASC NULLS LAST")
+    order_terms.append("regex_login_dt DESC NULLS LAST")
+
+    query = f"""WITH scored AS (
+    SELECT
+        {', '.join(RESULT_COLUMNS)},
+        (
+            {score_expr}
+        ) AS keyword_match_count
+    FROM scraping_saramin_candidates
+    {where_sql}
+)
+SELECT *
+FROM scored
+WHERE keyword_match_count > 0
+ORDER BY {', '.join(order_terms)}
+LIMIT %s"""
+
+    if target_salary is not None:
+        params.append(target_salary)
+    params.append(int(limit))
+
+    return {
+        "query": render_query(query, params),
+        "parameterized_query": query,
+        "params": params,
+        "keywords": keyword_list,
+        "experience_range": experience,
+        "regions": regions,
+        "target_salary": target_salary
+    }
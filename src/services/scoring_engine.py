@@ -0,0 +1,301 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from src.utils.database import get_db_connection
+from src.services.background_refresh import PeriodicRefresher
+from src.services.query_builder import (
+    KEYWORD_COLUMNS,
+    DEFAULT_LIMIT,
+    parse_experience_range,
+    parse_regions,
+    parse_target_salary
+)
+
+FETCH_SIZE = 5000
+DEFAULT_REFRESH_INTERVAL = 60  # 초
+DEFAULT_REBUILD_INTERVAL = 3600  # 초, 삭제된 후보자를 반영하기 위한 전체 재적재 주기
+DEFAULT_MAX_CACHED_KEYWORDS = 256  # 일치 벡터를 캐시할 키워드 수 (후보자 수만큼의 bool 배열)
+
+# 조건에 사용하는 컬럼 (키워드 비교용 텍스트는 KEYWORD_COLUMNS를 합쳐 하나로 저장)
+TEXT_COLUMN = 'text'
+WORK_YEAR_COLUMN = 'regex_work_year'
+WORK_REGION_COLUMN = 'regex_desired_work_region'
+CATEGORY_COLUMNS = [WORK_YEAR_COLUMN, WORK_REGION_COLUMN]
+
+def _parse_salary(values: pd.Series) -> np.ndarray:
+    """query_builder._SALARY_EXPR와 같은 규칙: '~' 앞 숫자만 남겨 만원 단위 정수로 변환 (없으면 NaN)"""
+    digits = (
+        values.fillna('').astype(str)
+        .str.split('~', n=1).str[0]
+        .str.replace(r'[^0-9]', '', regex=True)
+    )
+    return pd.to_numeric(digits.replace('', np.nan), errors='coerce').to_numpy(dtype=np.float64)
+
+class CandidateScoringEngine:
+    """후보자 텍스트 컬럼을 열 단위 배열로 캐시하고 키워드 일치 개수를 벡터 연산으로 계산
+
+    build_filtering_query의 CASE WHEN ... ILIKE 합산을 (키워드 수 × 후보자 수) 불리언 행렬의
+    합으로 구하고 (ILIKE와 같이 소문자로 바꿔 비교), 희망 연봉 근접도와
+    regex_login_dt 최신순으로 정렬한다. 키워드별 일치 벡터는 최근 사용한 max_cached_keywords개만
+    캐시되며 update_dt 기준 증분 갱신 시 바뀐 행만 다시 계산한다. 경력/지역처럼 값 종류가 적은 컬럼은
+    고유값에만 문자열 비교를 하고 코드 배열로 펼친다. DB 조회와 전체 재적재는 잠금 밖에서 한다.
+    """
+
+    def __init__(self, columns: List[str] = KEYWORD_COLUMNS,
+                 max_cached_keywords: int = DEFAULT_MAX_CACHED_KEYWORDS):
+        self.columns = columns
+        self.max_cached_keywords = max_cached_keywords
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.Lock()  # 갱신은 한 번에 하나만
+        self._reset()
+        self.last_rank_ms = None
+        self.last_rebuilt_at = None
+
+    def _reset(self):
+        self._frame = pd.DataFrame(columns=[TEXT_COLUMN, WORK_YEAR_COLUMN, WORK_REGION_COLUMN])
+        self._keys = pd.Index([], dtype=object)
+        self._salary = np.empty(0, dtype=np.float64)
+        self._login_dt = np.empty(0, dtype=object)
+        self._login_rank = np.empty(0, dtype=np.int64)
+        self._categories: Dict[str, Tuple[np.ndarray, pd.Index]] = {}  # 컬럼 -> (코드, 고유값)
+        self._matches: OrderedDict = OrderedDict()  # 소문자 키워드 -> 일치 벡터 (오래 안 쓴 순)
+        self._watermark = None
+        self.last_refreshed_at = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _load_rows(self, since=None) -> pd.DataFrame:
+        """since 이후 갱신된 후보자 조회 (since가 없으면 전체, FETCH_SIZE행씩 DataFrame으로 변환)"""
+        query = f"""
+            SELECT saramin_key, update_dt, {', '.join(self.columns)},
+                   {WORK_YEAR_COLUMN}, {WORK_REGION_COLUMN},
+                   regex_desired_annual_salary, regex_login_dt
+            FROM scraping_saramin_candidates
+        """
+        params = ()
+        if since is not None:
+            # 같은 시각에 갱신된 행을 놓치지 않도록 >= 비교 (다시 반영해도 결과는 같음),
+            # update_dt가 없는 행은 워터마크로 구분할 수 없으므로 매번 다시 반영
+            query += " WHERE update_dt >= %s OR update_dt IS NULL"
+            params = (since,)
+
+        columns = [
+            'saramin_key', 'update_dt', *self.columns,
+            WORK_YEAR_COLUMN, WORK_REGION_COLUMN,
+            'regex_desired_annual_salary', 'regex_login_dt'
+        ]
+        chunks = []
+        with get_db_connection() as conn:
+            with conn.cursor(name="candidate_scoring_refresh") as cur:
+                cur.execute(query, params)
+                while True:
+                    rows = cur.fetchmany(FETCH_SIZE)
+                    if not rows:
+                        break
+                    chunks.append(pd.DataFrame(rows, columns=columns))
+        return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+
+    def _match_vector(self, keyword: str, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        values = self._frame[TEXT_COLUMN] if rows is None else self._frame[TEXT_COLUMN].iloc[rows]
+        return values.str.contains(keyword, regex=False).to_numpy(dtype=bool)
+
+    def _apply(self, new: pd.DataFrame) -> int:
+        """조회한 후보자 행을 캐시에 반영 (호출하는 쪽에서 잠금)"""
+        if new.empty:
+            self.last_refreshed_at = time.time()
+            return 0
+
+        new = new.drop_duplicates('saramin_key', keep='last')
+        texts = new[self.columns[0]].fillna('').astype(str)
+        for column in self.columns[1:]:
+            texts = texts + '\n' + new[column].fillna('').astype(str)
+        texts = texts.str.lower()
+        incoming = pd.DataFrame({
+            TEXT_COLUMN: texts,
+            WORK_YEAR_COLUMN: new[WORK_YEAR_COLUMN].fillna('').astype(str),
+            WORK_REGION_COLUMN: new[WORK_REGION_COLUMN].fillna('').astype(str).str.lower()
+        }).reset_index(drop=True)
+        salary = _parse_salary(new['regex_desired_annual_salary'])
+        login_dt = new['regex_login_dt'].to_numpy(dtype=object)
+
+        # 기존 후보자는 제자리에서 덮어쓰고 새 후보자는 뒤에 추가
+        positions = self._keys.get_indexer(new['saramin_key'])
+        existing = positions >= 0
+        changed = positions[existing]
+        appended = ~existing
+
+        if existing.any():
+            self._frame.iloc[changed] = incoming[existing].to_numpy()
+            self._salary[changed] = salary[existing]
+            self._login_dt[changed] = login_dt[existing]
+
+        start = len(self._keys)
+        if appended.any():
+            self._frame = pd.concat([self._frame, incoming[appended]], ignore_index=True)
+            self._keys = self._keys.append(pd.Index(new['saramin_key'][appended].to_numpy(), dtype=object))
+            self._salary = np.concatenate([self._salary, salary[appended]])
+            self._login_dt = np.concatenate([self._login_dt, login_dt[appended]])
+
+        # 캐시된 일치 벡터는 바뀐 행과 추가된 행만 다시 계산
+        dirty = np.concatenate([changed, np.arange(start, len(self._keys))])
+        for keyword, vector in self._matches.items():
+            if len(vector) < len(self._keys):
+                vector = np.concatenate([vector, np.zeros(len(self._keys) - len(vector), dtype=bool)])
+            vector[dirty] = self._match_vector(keyword, dirty)
+            self._matches[keyword] = vector
+
+        self._categories = {
+            column: pd.factorize(self._frame[column]) for column in CATEGORY_COLUMNS
+        }
+
+        # regex_login_dt는 text 컬럼이므로 SQL과 같이 문자열 순서로 순위를 매김 (NULL은 -1)
+        self._login_rank, _ = pd.factorize(pd.Series(self._login_dt), sort=True)
+
+        update_dt = new['update_dt'].dropna()
+        if not update_dt.empty and (self._watermark is None or update_dt.max() > self._watermark):
+            self._watermark = update_dt.max().to_pydatetime()
+        self.last_refreshed_at = time.time()
+        return len(new)
+
+    def refresh(self) -> int:
+        """마지막 갱신 이후 추가/수정된 후보자만 반영 (최초 호출 시 전체 적재)"""
+        with self._refresh_lock:
+            if self._watermark is None:
+                return self._rebuild_unlocked()
+            new = self._load_rows(self._watermark)
+            with self._lock:
+                return self._apply(new)
+
+    def _rebuild_unlocked(self) -> int:
+        # 새 캐시를 잠금 밖에서 만들고 (자주 쓰던 키워드 벡터도 미리 계산) 교체
+        fresh = CandidateScoringEngine(self.columns, self.max_cached_keywords)
+        loaded = fresh._apply(self._load_rows())
+        for keyword in list(self._matches):
+            fresh._matches_for(keyword)
+
+        with self._lock:
+            for name in ('_frame', '_keys', '_salary', '_login_dt', '_login_rank',
+                         '_categories', '_matches', '_watermark', 'last_refreshed_at'):
+                setattr(self, name, getattr(fresh, name))
+            self.last_rebuilt_at = self.last_refreshed_at
+        return loaded
+
+    def rebuild(self) -> int:
+        """전체 재적재 후 교체 (삭제된 후보자 반영용)"""
+        with self._refresh_lock:
+            return self._rebuild_unlocked()
+
+    def _matches_for(self, keyword: str) -> np.ndarray:
+        """키워드 컬럼에 keyword(소문자)가 포함된 후보자 여부 (캐시 사용, 넘치면 오래 안 쓴 키워드 제거)"""
+        vector = self._matches.get(keyword)
+        if vector is None:
+            vector = self._match_vector(keyword)
+            self._matches[keyword] = vector
+            while len(self._matches) > self.max_cached_keywords:
+                self._matches.popitem(last=False)
+        else:
+            self._matches.move_to_end(keyword)
+        return vector
+
+    def _any_match(self, column: str, terms: List[str]) -> np.ndarray:
+        """column에 terms 중 하나라도 포함된 후보자 여부 (고유값에서 비교 후 코드로 펼침)"""
+        codes, uniques = self._categories.get(column, (np.empty(0, dtype=np.int64), pd.Index([])))
+        values = pd.Series(uniques, dtype=object).astype(str).str.lower()
+        hits = np.zeros(len(values) + 1, dtype=bool)  # 마지막 칸은 NULL(-1) 코드용
+        for term in terms:
+            hits[:-1] |= values.str.contains(term.lower(), regex=False).to_numpy(dtype=bool)
+        return hits[codes]
+
+    def score(self, keywords: List[str]) -> np.ndarray:
+        """후보자별 키워드 일치 개수 (키워드 × 후보자 행렬의 열 합)"""
+        with self._lock:
+            keywords = list(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+            if not keywords:
+                return np.zeros(len(self._keys), dtype=np.int32)
+            matrix = np.vstack([self._matches_for(keyword) for keyword in keywords])
+            return matrix.sum(axis=0, dtype=np.int32)
+
+    def rank(self, keywords: List[str], job_description: str = "",
+             limit: Optional[int] = DEFAULT_LIMIT) -> List[Tuple[str, int]]:
+        """build_filtering_query와 같은 조건/정렬로 [(saramin_key, keyword_match_count), ...] 반환
+
+        키워드 일치 개수 내림차순, 희망 연봉이 기준 연봉에 가까운 순, regex_login_dt 최신순
+        """
+        started = time.perf_counter()
+        with self._lock:
+            counts = self.score(keywords)
+            mask = counts > 0
+
+            experience = parse_experience_range(job_description)
+            if experience:
+                low, high = experience
+                mask &= self._any_match(WORK_YEAR_COLUMN, [f"{year}년" for year in range(low, high + 1)])
+
+            regions = parse_regions(job_description)
+            if regions:
+                mask &= self._any_match(WORK_REGION_COLUMN, regions)
+
+            selected = np.flatnonzero(mask)
+            sort_keys = [-self._login_rank[selected]]  # NULL(-1)은 마지막
+            target_salary = parse_target_salary(job_description)
+            if target_salary is not None:
+                distance = np.abs(self._salary[selected] - target_salary)
+                sort_keys.append(np.where(np.isnan(distance), np.inf, distance))
+            sort_keys.append(-counts[selected])
+
+            # np.lexsort는 마지막 키가 1순위
+            order = selected[np.lexsort(sort_keys)]
+            if limit:
+                order = order[:int(limit)]
+            ranked = list(zip(self._keys[order].tolist(), counts[order].tolist()))
+        self.last_rank_ms = (time.perf_counter() - started) * 1000
+        return ranked
+
+    def stats(self) -> dict:
+        """캐시 상태"""
+        with self._lock:
+            return {
+                'candidates': len(self._keys),
+                'cached_keywords': len(self._matches),
+                'watermark': self._watermark,
+                'last_refreshed_at': self.last_refreshed_at,
+                'last_rebuilt_at': self.last_rebuilt_at,
+                'last_rank_ms': self.last_rank_ms
+            }
+
+_engine = None
+_refresher = None
+_engine_lock = threading.Lock()
+
+def get_scoring_engine(refresh: bool = True) -> CandidateScoringEngine:
+    """프로세스 전역 점수 엔진 조회
+
+    최초 적재만 호출한 스레드에서 하고, 이후 증분 갱신/전체 재적재는 백그라운드 스레드가
+    주기적으로 하므로 요청은 DB 조회를 기다리지 않는다.
+    """
+    global _engine, _refresher
+    with _engine_lock:
+        if _engine is None:
+            _engine = CandidateScoringEngine(
+                max_cached_keywords=int(st.secrets.get("SCORING_ENGINE_MAX_KEYWORDS", DEFAULT_MAX_CACHED_KEYWORDS))
+            )
+
+    if refresh:
+        if _engine.last_refreshed_at is None:
+            _engine.refresh()
+        with _engine_lock:
+            if _refresher is None:
+                _refresher = PeriodicRefresher(
+                    _engine,
+                    name="scoring-engine-refresh",
+                    refresh_interval=float(st.secrets.get("SCORING_ENGINE_REFRESH_INTERVAL", DEFAULT_REFRESH_INTERVAL)),
+                    rebuild_interval=float(st.secrets.get("SCORING_ENGINE_REBUILD_INTERVAL", DEFAULT_REBUILD_INTERVAL))
+                ).start()
+    return _engine
@@ -0,0 +1,184 @@
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+import streamlit as st
+from src.utils import async_database
+from src.utils.playwright_helper import BrowserPool, pooled_page, navigate
+
+# 스카우트 응답 목록 페이지 셀렉터
+RESPONSE_ROW_SELECTOR = ".scout_response_list .response_item"
+RESPONSE_KEY_ATTRIBUTE = "data-saramin-key"
+RESPONSE_STATUS_SELECTOR = ".response_status"
+NEXT_PAGE_SELECTOR = ".pagination .btn_next:not(.disabled)"
+MAX_RESPONSE_PAGES = 100
+
+# 사람인 응답 상태 → scout_status
+STATUS_MAP = {
+    "수락": "accepted",
+    "거절": "rejected",
+    "미응답": "no_response_rejected"
+}
+
+async def check_candidate_status(url: str, candidate: dict, pool: BrowserPool = None) -> str:
+    """후보자의 응답 상태 확인 및 업데이트"""
+    try:
+        async with pooled_page(pool) as page:
+            await navigate(page, url, wait_for=RESPONSE_ROW_SELECTOR)
+            
+            # 상태 확인 로직...
+            status = await get_status_from_page(page)
+            
+            # 상태 매핑
+            new_status = STATUS_MAP.get(status.strip(), "no_response_rejected")
+            
+            # DB 상태 업데이트 (스레드 풀에서 실행하여 다른 페이지 작업을 막지 않음)
+            await async_database.update_candidate_status(candidate['mapping_id'], new_status)
+            
+            return new_status
+            
+    except Exception as e:
+        st.error(f"상태 확인 중 오류 발생: {str(e)}")
+        return "no_response_rejected"
+
+async def collect_contact_info(page_url: str, pool: BrowserPool = None) -> dict:
+    """수락한 후보자의 연락처 정보 수집"""
+    try:
+        async with pooled_page(pool) as page:
+            await navigate(page, page_url, wait_for=".contact_info")
+            
+            # 연락처 정보 추출
+            name = await page.locator(".candidate_name").text_content()
+            contact = await page.locator(".contact_info").text_content()
+            
+            return {
+                "name": name.strip(),
+                "contact": contact.strip()
+            }
+            
+    except Exception as e:
+        st.error(f"연락처 수집 중 오류 발생: {str(e)}")
+        return None
+
+async def harvest_response_statuses(scout_url: str, pool: BrowserPool = None) -> dict:
+    """스카우트 응답 목록 페이지를 한 번 열어 모든 페이지의 응답 상태를 수집
+    
+    반환값: {saramin_key: scout_status}
+    """
+    statuses = {}
+    async with pooled_page(pool) as page:
+        await navigate(page, scout_url)
+        
+        for _ in range(MAX_RESPONSE_PAGES):
+            await page.wait_for_selector(RESPONSE_ROW_SELECTOR, state="attached")
+            
+            # 현재 페이지의 모든 행을 한 번에 추출
+            rows = await page.eval_on_selector_all(
+                RESPONSE_ROW_SELECTOR,
+                """(rows, [keyAttr, statusSelector]) => rows.map(row => {
+                    const status = row.querySelector(statusSelector);
+                    return [row.getAttribute(keyAttr), status ? status.textContent : ''];
+                })""",
+                [RESPONSE_KEY_ATTRIBUTE, RESPONSE_STATUS_SELECTOR]
+            )
+            for saramin_key, status in rows:
+                if saramin_key:
+                    statuses[saramin_key] = STATUS_MAP.get((status or '').strip(), "no_response_rejected")
+            
+            next_button = await page.query_selector(NEXT_PAGE_SELECTOR)
+            if next_button is None:
+                break
+            
+            first_key = rows[0][0] if rows else None
+            await next_button.click()
+            # 목록이 다음 페이지로 바뀔 때까지 대기
+            await page.wait_for_function(
+                """([selector, keyAttr, firstKey]) => {
+                    const row = document.querySelector(selector);
+                    return row && row.getAttribute(keyAttr) !== firstKey;
+                }""",
+                arg=[RESPONSE_ROW_SELECTOR, RESPONSE_KEY_ATTRIBUTE, first_key]
+            )
+    
+    return statuses
+
+class ContactHarvester:
+    """수락한 후보자를 큐에 넣으면 여러 페이지가 동시에 연락처를 수집하고, 종료 시 한 번에 저장
+
+    사용법: async with ContactHarvester(pool) as harvester: harvester.put(candidate)
+    """
+
+    def __init__(self, pool: BrowserPool, workers: Optional[int] = None,
+                 progress_callback: Optional[Callable[[int, int], None]] = None):
+        self.pool = pool
+        self.workers = workers or pool.size
+        self.progress_callback = progress_callback
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self.contacts: Dict[str, tuple] = {}  # saramin_key -> (saramin_key, name, contact)
+        self.queued = 0
+        self.failed = 0
+        self.saved = 0
+
+    async def __aenter__(self):
+        self._tasks = [asyncio.create_task(self._drain()) for _ in range(self.workers)]
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def put(self, candidate: dict):
+        """연락처 수집 대상 추가"""
+        self.queued += 1
+        self._queue.put_nowait(candidate)
+
+    async def _drain(self):
+        while True:
+            candidate = await self._queue.get()
+            try:
+                contact_info = await collect_contact_info(candidate['page_url'], self.pool)
+                if contact_info:
+                    self.contacts[candidate['saramin_key']] = (
+                        candidate['saramin_key'], contact_info['name'], contact_info['contact']
+                    )
+                else:
+                    self.failed += 1
+            except Exception:
+                self.failed += 1  # 작업자가 멈추면 큐가 끝나지 않으므로 실패로 집계
+            finally:
+                self._queue.task_done()
+                if self.progress_callback:
+                    self.progress_callback(len(self.contacts) + self.failed, self.queued)
+
+    async def close(self) -> int:
+        """남은 수집을 마치고 연락처를 한 번에 저장한 뒤 저장 건수 반환"""
+        if self._tasks:
+            await self._queue.join()
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks = []
+            self.saved = await async_database.bulk_update_candidate_contacts(list(self.contacts.values()))
+        return self.saved
+
+async def check_and_collect_candidate(scout_url: str, candidate: dict, pool: BrowserPool = None,
+                                      harvester: Optional[ContactHarvester] = None) -> str:
+    """후보자 응답 상태를 확인하고, 수락한 경우 연락처까지 수집하여 저장
+    
+    harvester가 주어지면 연락처 수집은 harvester의 큐로 넘겨 동시에 처리한다.
+    """
+    # 상태 확인 (DB 상태 업데이트는 check_candidate_status에서 함)
+    status = await check_candidate_status(scout_url, candidate, pool)
+    
+    # 수락한 경우 추가 정보 수집
+    if status == 'accepted' and harvester is not None:
+        harvester.put(candidate)
+    elif status == 'accepted':
+        contact_info = await collect_contact_info(candidate['page_url'], pool)
+        if contact_info:
+            await async_database.update_candidate_contact(
+                candidate['saramin_key'],
+                contact_info['name'],
+                contact_info['contact']
+            )
+    
+    return status
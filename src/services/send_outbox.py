@@ -0,0 +1,127 @@
+import atexit
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+from src.utils.database import bulk_mark_scout_sent
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL_MS = 500
+CLOSE_RETRIES = 3
+
+class ScoutSendOutbox:
+    """발송 성공 결과를 모아 백그라운드 스레드에서 일괄 저장하는 인프로세스 outbox
+
+    batch_size건이 쌓이거나 flush_interval_ms가 지나면 저장하고,
+    close()(또는 with 블록 종료, 프로세스 종료) 시 남은 결과를 모두 저장한다.
+    campaign_id가 주어지면 캠페인 체크포인트도 같은 트랜잭션에서 'sent'로 기록하므로,
+    저장에 실패한 후보자는 캠페인에서도 발송 완료로 남지 않는다.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, flush_interval_ms: Optional[int] = None,
+                 campaign_id: Optional[int] = None):
+        self.batch_size = batch_size or int(st.secrets.get("SEND_OUTBOX_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+        self.flush_interval = (
+            flush_interval_ms or int(st.secrets.get("SEND_OUTBOX_FLUSH_MS", DEFAULT_FLUSH_INTERVAL_MS))
+        ) / 1000
+        self.campaign_id = campaign_id
+        self._pending: List[Tuple[int, str, int]] = []
+        self._checkpoints: List[str] = []  # 이미 발송되어 캠페인 기록만 남길 후보자
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 동시에 한 번만 저장
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+        self.stats = {'enqueued': 0, 'flushed': 0, 'missing': 0, 'batches': 0, 'errors': 0}
+
+    def start(self):
+        """백그라운드 flush 스레드 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="scout-send-outbox", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+        return self
+
+    def put(self, position_id: int, saramin_key: str, message_id: int):
+        """발송 성공 결과 추가 (batch_size에 도달하면 즉시 flush 요청)"""
+        with self._lock:
+            self._pending.append((position_id, saramin_key, message_id))
+            self.stats['enqueued'] += 1
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def put_checkpoint(self, saramin_key: str):
+        """이미 발송된 후보자를 캠페인 체크포인트에만 'sent'로 기록"""
+        with self._lock:
+            self._checkpoints.append(saramin_key)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending) + len(self._checkpoints)
+
+    def flush(self) -> int:
+        """쌓인 결과를 한 번에 저장 (실패 시 다음 flush에서 다시 시도하도록 되돌림)"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                checkpoints, self._checkpoints = self._checkpoints, []
+            if not batch and not checkpoints:
+                return 0
+
+            try:
+                saved = bulk_mark_scout_sent(batch, self.campaign_id, checkpoints)
+            except Exception as e:
+                with self._lock:
+                    self._pending = batch + self._pending
+                    self._checkpoints = checkpoints + self._checkpoints
+                    self.stats['errors'] += 1
+                self.last_error = str(e)
+                raise
+
+            with self._lock:
+                self.stats['flushed'] += saved
+                self.stats['missing'] += len(set((p, k) for p, k, _ in batch)) - saved
+                self.stats['batches'] += 1
+            return saved
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # 결과는 되돌려졌으므로 다음 주기에 재시도
+
+    def close(self):
+        """스레드 종료 후 남은 결과를 모두 저장 (재시도 후에도 실패하면 예외 발생)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+
+        for attempt in range(CLOSE_RETRIES):
+            try:
+                self.flush()
+                return
+            except Exception:
+                if attempt == CLOSE_RETRIES - 1:
+                    raise RuntimeError(
+                        f"발송 결과 {self.pending_count()}건을 저장하지 못했습니다: {self.last_error}"
+                    )
+                time.sleep(2 ** attempt)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def summary(self) -> Dict:
+        with self._lock:
+            return {**self.stats, 'pending': len(self._pending) + len(self._checkpoints)}
@@ -0,0 +1,51 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+from src.utils import database
+
+DEFAULT_MAX_WORKERS = database.DEFAULT_POOL_MAX_SIZE
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    """DB 호출 전용 스레드 풀 (커넥션 풀 크기만큼만 동시에 실행)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = int(st.secrets.get("DB_POOL_MAX_SIZE", DEFAULT_MAX_WORKERS))
+                _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-db")
+    return _executor
+
+async def run_db(func, *args, **kwargs):
+    """블로킹 DB 함수를 스레드 풀에서 실행하여 이벤트 루프를 막지 않음"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+def _offload(func):
+    """database 모듈 함수와 같은 시그니처의 코루틴 함수 생성"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_db(func, *args, **kwargs)
+    return wrapper
+
+# Playwright 코루틴에서 사용하는 조회/저장 함수 (src.utils.database와 동일한 이름)
+get_position_details = _offload(database.get_position_details)
+get_position_candidates = _offload(database.get_position_candidates)
+get_candidate_details = _offload(database.get_candidate_details)
+get_candidate_states = _offload(database.get_candidate_states)
+update_candidate_status = _offload(database.update_candidate_status)
+bulk_update_candidate_statuses = _offload(database.bulk_update_candidate_statuses)
+update_candidate_contact = _offload(database.update_candidate_contact)
+bulk_update_candidate_contacts = _offload(database.bulk_update_candidate_contacts)
+mark_scout_sent = _offload(database.mark_scout_sent)
+bulk_mark_scout_sent = _offload(database.bulk_mark_scout_sent)
+get_job_status = _offload(database.get_job_status)
+checkpoint_job = _offload(database.checkpoint_job)
+heartbeat_job = _offload(database.heartbeat_job)
+record_campaign_attempt = _offload(database.record_campaign_attempt)
+finish_campaign = _offload(database.finish_campaign)
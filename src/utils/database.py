@@ -1,30 +1,242 @@
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import extensions
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
 import streamlit as st
 from typing import List, Dict, Optional
 import json
+import re
+import threading
+import time
+import uuid
+import weakref
 import pandas as pd
 from datetime import datetime
+from src.utils.read_cache import cached_read, invalidate_reads, read_cache
+from src.utils.prepared_statements import PreparedStatementRegistry
+
+# 커넥션 풀 기본 설정 (st.secrets로 재정의 가능)
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 10
+DEFAULT_POOL_MAX_IDLE = 4  # 반납 후 닫지 않고 유지할 유휴 연결 수 (넘치는 연결은 반납 시 닫음)
+DEFAULT_POOL_HEALTHCHECK_INTERVAL = 30  # 초, 이 시간 이상 유휴 상태였던 연결만 점검
+
+class _MeteredConnectionPool(ThreadedConnectionPool):
+    """생성된 연결 수를 집계하는 커넥션 풀
+
+    psycopg2 풀은 유휴 연결이 minconn개 이상이면 반납된 연결을 닫아버려, 동시 호출이 몰릴 때마다
+    연결을 새로 맺게 된다. 시작 시에는 minconn개만 열고, 반납 시에는 max_idle개까지 유지한다.
+    """
+    def __init__(self, minconn, maxconn, *args, max_idle=None, **kwargs):
+        self.created_count = 0
+        self.max_idle = max(minconn, min(maxconn, max_idle if max_idle is not None else maxconn))
+        super().__init__(minconn, maxconn, *args, **kwargs)
+
+    def _connect(self, key=None):
+        conn = super()._connect(key)
+        self.created_count += 1
+        return conn
+
+    def _putconn(self, conn, key=None, close=False):
+        # putconn이 풀 잠금을 잡은 상태에서 호출되므로 유지 기준만 잠시 바꿔 위임
+        minconn, self.minconn = self.minconn, self.max_idle
+        try:
+            super()._putconn(conn, key, close)
+        finally:
+            self.minconn = minconn
+
+_pool = None
+_pool_lock = threading.Lock()
+_pool_slots = None
+_last_used = weakref.WeakKeyDictionary()  # conn -> 마지막 반납 시각
+_pool_stats = {
+    'checkouts': 0,
+    'in_use': 0,
+    'wait_time_total': 0.0,
+    'wait_time_max': 0.0,
+    'health_check_failures': 0
+}
+
+# 반복 실행되는 조회/갱신 SQL (연결별로 한 번만 PREPARE)
+prepared_statements = PreparedStatementRegistry()
+prepared_statements.register("update_candidate_status", """
+    UPDATE scraping_saramin_position_candidate
+    SET scout_status = $1,
+        last_checked_at = NOW()
+    WHERE id = $2
+""")
+prepared_statements.register("get_candidate_details", """
+    SELECT * FROM scraping_saramin_candidates
+    WHERE saramin_key = $1
+""")
+prepared_statements.register("get_candidate_states", """
+    SELECT c.*, pc.id as mapping_id, pc.scout_status
+    FROM scraping_saramin_candidates c
+    JOIN scraping_saramin_position_candidate pc 
+        ON c.saramin_key = pc.saramin_key
+    WHERE pc.position_id = $1 
+    AND c.saramin_key = ANY($2)
+""")
+prepared_statements.register("mark_scout_sent", """
+    UPDATE scraping_saramin_position_candidate
+    SET scout_status = 'sent',
+        last_checked_at = NOW()
+    WHERE position_id = $1 AND saramin_key = $2
+    RETURNING id as mapping_id
+""")
+prepared_statements.register("insert_scout_history", """
+    INSERT INTO scout_history 
+    (candidate_filter_id, message_id, status)
+    VALUES ($1, $2, 'sent')
+""")
+
+def _get_pool():
+    """프로세스 전역 커넥션 풀 조회 (최초 호출 시 생성)"""
+    global _pool, _pool_slots
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                min_size = int(st.secrets.get("DB_POOL_MIN_SIZE", DEFAULT_POOL_MIN_SIZE))
+                max_size = int(st.secrets.get("DB_POOL_MAX_SIZE", DEFAULT_POOL_MAX_SIZE))
+                max_idle = int(st.secrets.get("DB_POOL_MAX_IDLE", DEFAULT_POOL_MAX_IDLE))
+                _pool_slots = threading.BoundedSemaphore(max_size)
+                _pool = _MeteredConnectionPool(
+                    min_size, max_size, st.secrets["DATABASE_URL"], max_idle=max_idle
+                )
+    return _pool
+
+def _is_healthy(conn) -> bool:
+    """체크아웃 시 연결 상태 점검"""
+    if conn.closed:
+        return False
+    
+    interval = float(st.secrets.get("DB_POOL_HEALTHCHECK_INTERVAL", DEFAULT_POOL_HEALTHCHECK_INTERVAL))
+    if time.monotonic() - _last_used.get(conn, 0) < interval:
+        return True
+    
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+def _checkout(pool):
+    """풀에서 정상 연결 하나를 가져옴 (끊어진 연결은 폐기 후 재시도)"""
+    while True:
+        conn = pool.getconn()
+        if _is_healthy(conn):
+            return conn
+        with _pool_lock:
+            _pool_stats['health_check_failures'] += 1
+        _last_used.pop(conn, None)
+        prepared_statements.forget(conn)
+        pool.putconn(conn, close=True)
+
+def _release(pool, conn):
+    """사용한 연결을 풀에 반납 (열린 트랜잭션은 롤백)"""
+    discard = bool(conn.closed)
+    if not discard and conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            discard = True
+    
+    if discard:
+        _last_used.pop(conn, None)
+        prepared_statements.forget(conn)
+    else:
+        _last_used[conn] = time.monotonic()
+    pool.putconn(conn, close=discard)
 
 @contextmanager
 def get_db_connection():
-    """데이터베이스 연결 컨텍스트 매니저"""
+    """데이터베이스 연결 컨텍스트 매니저 (커넥션 풀 사용)"""
+    pool = _get_pool()
+    
+    # 풀이 가득 찬 경우 PoolError 대신 반납될 때까지 대기
+    wait_start = time.monotonic()
+    _pool_slots.acquire()
+    waited = time.monotonic() - wait_start
+    
     conn = None
     try:
-        conn = psycopg2.connect(st.secrets["DATABASE_URL"])
+        conn = _checkout(pool)
+        with _pool_lock:
+            _pool_stats['checkouts'] += 1
+            _pool_stats['in_use'] += 1
+            _pool_stats['wait_time_total'] += waited
+            _pool_stats['wait_time_max'] = max(_pool_stats['wait_time_max'], waited)
         yield conn
     finally:
         if conn is not None:
-            conn.close()
+            with _pool_lock:
+                _pool_stats['in_use'] -= 1
+            _release(pool, conn)
+        _pool_slots.release()
 
-def get_pending_tasks_count():
-    """temp_scraping_1 테이블의 남은 작업 수 조회"""
+def get_read_cache_stats() -> dict:
+    """조회 캐시 함수별 적중률"""
+    return read_cache.stats()
+
+def get_pool_stats() -> dict:
+    """커넥션 풀 지표 조회"""
+    with _pool_lock:
+        stats = dict(_pool_stats)
+    stats['created'] = _pool.created_count if _pool is not None else 0
+    stats['max_size'] = _pool.maxconn if _pool is not None else 0
+    stats['wait_time_avg'] = (
+        stats['wait_time_total'] / stats['checkouts'] if stats['checkouts'] else 0.0
+    )
+    stats['prepared_statements'] = prepared_statements.stats()
+    return stats
+
+# 남은 작업 수 조회 방식
+PENDING_COUNT_EXACT = 'exact'        # 항상 COUNT(*)
+PENDING_COUNT_ESTIMATE = 'estimate'  # 통계(pg_class) 기반 추정치
+PENDING_COUNT_AUTO = 'auto'          # 추정치가 임계값 미만일 때만 COUNT(*)
+DEFAULT_PENDING_COUNT_THRESHOLD = 100000
+
+def _estimate_pending_tasks(cur) -> Optional[int]:
+    """플래너와 같은 방식(reltuples/relpages × 현재 페이지 수)으로 행 수 추정"""
+    cur.execute("""
+        SELECT 
+            CASE 
+                WHEN c.reltuples < 0 THEN NULL
+                WHEN c.relpages > 0 THEN 
+                    (c.reltuples / c.relpages) 
+                    * (pg_relation_size(c.oid) / current_setting('block_size')::int)
+                ELSE c.reltuples
+            END as estimate
+        FROM pg_class c
+        WHERE c.oid = 'temp_scraping_1'::regclass
+    """)
+    result = cur.fetchone()
+    if not result or result['estimate'] is None:
+        return None  # 한 번도 ANALYZE되지 않은 경우
+    return int(result['estimate'])
+
+def count_pending_tasks(mode: Optional[str] = None) -> dict:
+    """남은 작업 수와 사용한 조회 방식 반환 ({'count': int, 'mode': 'exact' | 'estimate'})"""
+    mode = mode or st.secrets.get("PENDING_COUNT_MODE", PENDING_COUNT_AUTO)
+    threshold = int(st.secrets.get("PENDING_COUNT_EXACT_THRESHOLD", DEFAULT_PENDING_COUNT_THRESHOLD))
+    
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            if mode != PENDING_COUNT_EXACT:
+                estimate = _estimate_pending_tasks(cur)
+                if estimate is not None and (mode == PENDING_COUNT_ESTIMATE or estimate >= threshold):
+                    return {'count': estimate, 'mode': PENDING_COUNT_ESTIMATE}
+            
             cur.execute("SELECT COUNT(*) as count FROM temp_scraping_1")
             result = cur.fetchone()
-            return result['count']
+            return {'count': result['count'], 'mode': PENDING_COUNT_EXACT}
+
+def get_pending_tasks_count(mode: Optional[str] = None):
+    """temp_scraping_1 테이블의 남은 작업 수 조회"""
+    return count_pending_tasks(mode)['count']
 
 def get_recent_tasks(limit=10):
     """최근 작업 목록 조회"""
@@ -37,6 +249,7 @@ def get_recent_tasks(limit=10):
             """, (limit,))
             return cur.fetchall()
 
+@cached_read(ttl=60, tags=('positions',))
 def get_positions(search_term=None):
     """포지션 목록 조회"""
     with get_db_connection() as conn:
@@ -70,6 +283,7 @@ def get_positions(search_term=None):
             cur.execute(query, params)
             return cur.fetchall()
 
+@cached_read(ttl=30, tags=('positions',))
 def get_position_details(position_id):
     """포지션 상세 정보 조회"""
     with get_db_connection() as conn:
@@ -171,10 +385,19 @@ def save_filtering_history(position_id: int, job_description: str, step: str, re
             """, (filtering_id, step, json.dumps(result)))
             
             conn.commit()
+            # 새 히스토리 행이 가장 최근 채용 정보가 되므로 함께 무효화
+            invalidate_reads('filtering_history', 'recruitment_info')
             return filtering_id
 
 def save_filtering_intermediate(filtering_id: int, step: str, result: dict):
     """중간 결과 저장"""
+    save_filtering_intermediates(filtering_id, [(step, result)])
+
+def save_filtering_intermediates(filtering_id: int, steps: list):
+    """여러 단계의 중간 결과를 한 번에 저장 (steps: [(step_name, result), ...])"""
+    if not steps:
+        return
+    
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
             # 현재 단계 번호 조회
@@ -186,13 +409,17 @@ def save_filtering_intermediate(filtering_id: int, step: str, result: dict):
             next_step = cur.fetchone()['next_step']
             
             # 중간 결과 저장 - JSONB 타입으로 직접 저장
-            cur.execute("""
+            execute_values(cur, """
                 INSERT INTO filtering_intermediate_results
                 (filtering_id, step_number, step_name, result_data)
-                VALUES (%s, %s, %s, %s::jsonb)
-            """, (filtering_id, next_step, step, json.dumps(result)))
+                VALUES %s
+            """, [
+                (filtering_id, next_step + offset, step, json.dumps(result))
+                for offset, (step, result) in enumerate(steps)
+            ], template="(%s, %s, %s, %s::jsonb)")
             
             conn.commit()
+            invalidate_reads('filtering_history')
 
 def get_latest_filtering(position_id: int) -> dict:
     """최근 필터링 결과 조회"""
@@ -225,7 +452,9 @@ def update_filtering_results(filtering_id: int, status: str, filtered_count: int
                 WHERE id = %s
             """, (status, filtered_count, filtering_id))
             conn.commit()
+            invalidate_reads('filtering_history')
 
+@cached_read(ttl=30, tags=('filtering_history',))
 def get_filtering_history(position_id: int, limit: int = 5) -> list:
     """필터링 히스토리 조회"""
     with get_db_connection() as conn:
@@ -265,7 +494,61 @@ def get_intermediate_result(filtering_id: int, step: str) -> dict:
             result = cur.fetchone()
             return json.loads(result['result_data']) if result else None
 
-def save_candidate_selection(filtering_id: int, selected_candidates: list):
+def _upsert_position_candidates(cur, position_id: int, saramin_keys: list, 
+                                overwrite_status: bool = False, page_size: int = 1000) -> dict:
+    """포지션-후보자 매핑 일괄 upsert (multi-row VALUES, 페이지당 1회 왕복)
+    
+    overwrite_status가 False이면 이미 발송 등으로 진행된 후보자의 상태는 유지한다.
+    """
+    # 같은 문장 안에서 동일 키가 두 번 갱신되면 오류가 나므로 중복 제거
+    unique_keys = list(dict.fromkeys(saramin_keys))
+    result = {
+        'total': len(saramin_keys),
+        'inserted': 0,
+        'updated': 0,
+        'duplicates': len(saramin_keys) - len(unique_keys)
+    }
+    if not unique_keys:
+        return result
+    
+    status_clause = "'extracted'" if overwrite_status else """
+                CASE 
+                    WHEN scraping_saramin_position_candidate.scout_status = 'extracted' 
+                    THEN 'extracted'
+                    ELSE scraping_saramin_position_candidate.scout_status
+                END"""
+    
+    rows = execute_values(cur, f"""
+        INSERT INTO scraping_saramin_position_candidate 
+        (position_id, saramin_key, scout_status)
+        VALUES %s
+        ON CONFLICT (position_id, saramin_key) 
+        DO UPDATE SET 
+            scout_status = {status_clause},
+            last_checked_at = NOW()
+        RETURNING (xmax = 0) AS inserted
+    """, [(position_id, key) for key in unique_keys],
+        template="(%s, %s, 'extracted')", page_size=page_size, fetch=True)
+    
+    for row in rows:
+        inserted = row['inserted'] if isinstance(row, dict) else row[0]
+        if inserted:
+            result['inserted'] += 1
+        else:
+            result['updated'] += 1
+    return result
+
+def bulk_upsert_position_candidates(position_id: int, saramin_keys: list, 
+                                    overwrite_status: bool = False) -> dict:
+    """포지션-후보자 매핑 일괄 저장 (행별 결과 건수 반환)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            result = _upsert_position_candidates(cur, position_id, saramin_keys, overwrite_status)
+            conn.commit()
+            invalidate_reads('positions')
+            return result
+
+def save_candidate_selection(filtering_id: int, selected_candidates: list) -> dict:
     """선택된 후보자 저장"""
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
@@ -281,16 +564,12 @@ def save_candidate_selection(filtering_id: int, selected_candidates: list):
             position_id = result['position_id']
             
             # 선택된 후보자들의 상태를 'extracted'로 유지
-            for candidate in selected_candidates:
-                cur.execute("""
-                    INSERT INTO scraping_saramin_position_candidate 
-                    (position_id, saramin_key, scout_status)
-                    VALUES (%s, %s, 'extracted')
-                    ON CONFLICT (position_id, saramin_key) 
-                    DO UPDATE SET 
-                        scout_status = 'extracted',
-                        last_checked_at = NOW()
-                """, (position_id, candidate['saramin_key']))
+            upsert_result = _upsert_position_candidates(
+                cur,
+                position_id,
+                [c['saramin_key'] for c in selected_candidates],
+                overwrite_status=True
+            )
             
             # 선택되지 않은 후보자들은 제거 (선택사항)
             cur.execute("""
@@ -300,17 +579,27 @@ def save_candidate_selection(filtering_id: int, selected_candidates: list):
             """, (position_id, tuple(c['saramin_key'] for c in selected_candidates)))
             
             conn.commit()
+            invalidate_reads('positions')
+            return upsert_result
 
 def get_candidate_details(saramin_key: str):
     """후보자 상세 정보 조회"""
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("""
-                SELECT * FROM scraping_saramin_candidates
-                WHERE saramin_key = %s
-            """, (saramin_key,))
+            prepared_statements.execute(cur, "get_candidate_details", (saramin_key,))
             return cur.fetchone()
 
+def get_candidate_states(position_id: int, saramin_keys: list) -> Dict[str, Dict]:
+    """포지션 내 후보자 정보와 매핑 ID/스카우트 상태를 한 번에 조회 ({saramin_key: row})"""
+    if not saramin_keys:
+        return {}
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            prepared_statements.execute(
+                cur, "get_candidate_states", (position_id, list(dict.fromkeys(saramin_keys)))
+            )
+            return {row['saramin_key']: row for row in cur.fetchall()}
+
 def save_scout_message(position_id: int, title: str, content: str, valid_until: str):
     """스카우트 메시지 저장"""
     with get_db_connection() as conn:
@@ -359,6 +648,7 @@ def update_position_url(position_id: int, url: str):
                 WHERE id = %s
             """, (url, position_id))
             conn.commit()
+            invalidate_reads('positions')
 
 def get_position_candidates(position_id: int):
     """포지션에 매핑된 후보자 목록 조회"""
@@ -380,13 +670,26 @@ def update_candidate_status(mapping_id: int, status: str):
     """후보자 상태 업데이트"""
     with get_db_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("""
-                UPDATE scraping_saramin_position_candidate
-                SET scout_status = %s,
+            prepared_statements.execute(cur, "update_candidate_status", (status, mapping_id))
+            conn.commit()
+
+def bulk_update_candidate_statuses(updates: list) -> int:
+    """후보자 상태 일괄 업데이트 (updates: [(mapping_id, status), ...])"""
+    if not updates:
+        return 0
+    
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            execute_values(cur, """
+                UPDATE scraping_saramin_position_candidate pc
+                SET scout_status = v.status::scout_status,
                     last_checked_at = NOW()
-                WHERE id = %s
-            """, (status, mapping_id))
+                FROM (VALUES %s) AS v(mapping_id, status)
+                WHERE pc.id = v.mapping_id
+            """, updates, template="(%s::integer, %s::text)", page_size=1000)
+            updated = cur.rowcount
             conn.commit()
+            return updated
 
 def update_candidate_contact(saramin_key: str, name: str, contact: str):
     """수락한 후보자의 연락처 정보 업데이트"""
@@ -401,6 +704,28 @@ def update_candidate_contact(saramin_key: str, name: str, contact: str):
             """, (name, contact, saramin_key))
             conn.commit()
 
+def bulk_update_candidate_contacts(contacts: list) -> int:
+    """수락한 후보자 연락처 일괄 업데이트 (contacts: [(saramin_key, name, contact), ...])"""
+    # 같은 후보자가 두 번 들어오면 마지막 값만 반영
+    unique = list({key: (key, name, contact) for key, name, contact in contacts}.values())
+    if not unique:
+        return 0
+    
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            execute_values(cur, """
+                UPDATE scraping_saramin_candidates c
+                SET name = v.name,
+                    contact_info = v.contact,
+                    update_dt = NOW()
+                FROM (VALUES %s) AS v(saramin_key, name, contact)
+                WHERE c.saramin_key = v.saramin_key
+            """, unique, template="(%s::text, %s::text, %s::text)", page_size=1000)
+            updated = cur.rowcount
+            conn.commit()
+            return updated
+
+@cached_read(ttl=60, tags=('recruitment_info',))
 def get_latest_recruitment_info(position_id):
     """최근 채용 정보 조회"""
     with get_db_connection() as conn:
@@ -431,12 +756,163 @@ def save_recruitment_info(position_id: int, job_description: str, additional_inf
                 RETURNING id
             """, (position_id, job_description, additional_info))
             conn.commit()
+            invalidate_reads('recruitment_info', 'filtering_history')
             return cur.fetchone()['id']
 
+# 필터링 쿼리 실행 전 예산 (st.secrets로 재정의 가능)
+DEFAULT_QUERY_MAX_COST = 1000000
+DEFAULT_QUERY_MAX_ROWS = 5000
+DEFAULT_QUERY_STREAM_MAX_ROWS = 200000
+DEFAULT_QUERY_TIMEOUT_MS = 15000
+
+class QueryBudgetExceeded(Exception):
+    """실행 계획상 예상 비용이 예산을 넘어 실행하지 않은 쿼리"""
+    def __init__(self, message: str, plan: dict):
+        super().__init__(message)
+        self.plan = plan
+
+def _begin_guarded_read(conn, timeout_ms: Optional[int] = None):
+    """읽기 전용 트랜잭션 시작 및 쿼리별 statement_timeout 설정"""
+    timeout_ms = timeout_ms or int(st.secrets.get("QUERY_TIMEOUT_MS", DEFAULT_QUERY_TIMEOUT_MS))
+    if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+        conn.rollback()
+    with conn.cursor() as cur:
+        cur.execute("SET TRANSACTION READ ONLY")
+        cur.execute("SET LOCAL statement_timeout = %s", (timeout_ms,))
+
+def _summarize_plan(node: dict, depth: int = 0, lines: Optional[list] = None) -> list:
+    """EXPLAIN JSON 노드를 들여쓴 한 줄 요약 목록으로 변환"""
+    lines = [] if lines is None else lines
+    relation = f" on {node['Relation Name']}" if node.get('Relation Name') else ""
+    lines.append(
+        f"{'  ' * depth}{node['Node Type']}{relation} "
+        f"(cost={node['Total Cost']:.0f}, rows={node['Plan Rows']})"
+    )
+    for child in node.get('Plans', []):
+        _summarize_plan(child, depth + 1, lines)
+    return lines
+
+# 문자열/식별자 리터럴과 주석 (세미콜론/키워드 검사에서 제외)
+_SQL_LITERAL_OR_COMMENT = re.compile(
+    r"""'(?:[^']|'')*'|"(?:[^"]|"")*"|\$(\w*)\$.*?\$\1\$|--[^\n]*|/\*.*?\*/""", re.S
+)
+# 읽기 전용 트랜잭션을 끝내거나 설정을 바꿀 수 있는 트랜잭션 제어 키워드
+_TRANSACTION_CONTROL = re.compile(
+    r'\b(BEGIN|COMMIT|ROLLBACK|ABORT|SET|RESET|START\s+TRANSACTION|SAVEPOINT|RELEASE)\b', re.I
+)
+
+def _validate_read_query(query: str):
+    """SELECT/WITH 한 문장만 허용 (끝의 세미콜론 외의 세미콜론, 트랜잭션 제어 키워드 거부)"""
+    code = re.sub(r'[\s;]+$', '', _SQL_LITERAL_OR_COMMENT.sub(' ', query)).strip()
+    if not code or code.split(None, 1)[0].upper() not in ('SELECT', 'WITH'):
+        raise ValueError("SELECT 쿼리만 실행할 수 있습니다.")
+    if ';' in code:
+        raise ValueError("쿼리는 한 문장만 실행할 수 있습니다.")
+    keyword = _TRANSACTION_CONTROL.search(code)
+    if keyword:
+        raise ValueError(f"트랜잭션 제어 구문({keyword.group(1).upper()})은 실행할 수 없습니다.")
+
+def explain_query(query: str, params: Optional[dict] = None) -> dict:
+    """실행하지 않고 EXPLAIN으로 예상 비용/행 수 조회"""
+    _validate_read_query(query)
+    with get_db_connection() as conn:
+        try:
+            _begin_guarded_read(conn)
+            with conn.cursor() as cur:
+                cur.execute(f"EXPLAIN (FORMAT JSON) {_strip_query(query)}", params)
+                plan = cur.fetchone()[0][0]['Plan']
+        finally:
+            conn.rollback()
+    return {
+        'total_cost': plan['Total Cost'],
+        'plan_rows': plan['Plan Rows'],
+        'summary': _summarize_plan(plan),
+        'rewritten': False
+    }
+
+def guard_query(query: str, max_cost: Optional[float] = None, 
+                max_rows: Optional[int] = None, params: Optional[dict] = None) -> tuple:
+    """예산 검사 후 (실행할 쿼리, 실행 계획 요약) 반환
+    
+    예상 행 수가 max_rows를 넘으면 LIMIT을 씌워 다시 검사하고,
+    그래도 예상 비용이 max_cost를 넘으면 QueryBudgetExceeded를 발생시킨다.
+    params가 있으면 쿼리의 %(name)s 자리에 바인딩한다 (이때 리터럴 %는 %%로 써야 함).
+    """
+    max_cost = max_cost or float(st.secrets.get("QUERY_MAX_COST", DEFAULT_QUERY_MAX_COST))
+    max_rows = max_rows or int(st.secrets.get("QUERY_MAX_ROWS", DEFAULT_QUERY_MAX_ROWS))
+    
+    _validate_read_query(query)
+    plan = explain_query(query, params)
+    if plan['plan_rows'] > max_rows:
+        query = f"SELECT * FROM ({_strip_query(query)}) AS guarded LIMIT {int(max_rows)}"
+        plan = explain_query(query, params)
+        plan['rewritten'] = True
+    
+    plan['max_cost'] = max_cost
+    plan['max_rows'] = max_rows
+    if plan['total_cost'] > max_cost:
+        raise QueryBudgetExceeded(
+            f"예상 비용 {plan['total_cost']:.0f}이(가) 예산 {max_cost:.0f}을(를) 초과하여 실행하지 않았습니다.",
+            plan
+        )
+    return query, plan
+
 def execute_query(query: str) -> pd.DataFrame:
-    """SQL 쿼리 실행"""
+    """SQL 쿼리 실행 (예산 검사 후 읽기 전용 트랜잭션에서 실행)"""
+    query, plan = guard_query(query)
     with get_db_connection() as conn:
-        return pd.read_sql(query, conn)
+        try:
+            _begin_guarded_read(conn)
+            df = pd.read_sql(query, conn)
+        finally:
+            conn.rollback()
+    df.attrs['query_plan'] = plan
+    return df
+
+# 대용량 필터링 쿼리 스트리밍 기본값 (st.secrets로 재정의 가능)
+DEFAULT_QUERY_CHUNK_SIZE = 1000
+DEFAULT_QUERY_PREVIEW_ROWS = 100
+
+def _strip_query(query: str) -> str:
+    """서브쿼리/커서로 감쌀 수 있도록 끝의 세미콜론 제거"""
+    return re.sub(r'[\s;]+$', '', query).strip()
+
+def _iter_chunks(conn, query: str, chunk_size: int):
+    """서버 사이드(named) 커서로 chunk_size행씩 DataFrame 생성"""
+    with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cur:
+        cur.itersize = chunk_size
+        cur.execute(_strip_query(query))
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield pd.DataFrame(rows, columns=[col.name for col in cur.description])
+
+def iter_query_chunks(query: str, chunk_size: Optional[int] = None):
+    """SQL 쿼리 결과를 한 번에 올리지 않고 청크 단위로 조회"""
+    chunk_size = chunk_size or int(st.secrets.get("QUERY_CHUNK_SIZE", DEFAULT_QUERY_CHUNK_SIZE))
+    with get_db_connection() as conn:
+        try:
+            _begin_guarded_read(conn)
+            yield from _iter_chunks(conn, query, chunk_size)
+        finally:
+            conn.rollback()  # 읽기 전용 트랜잭션 및 커서 정리
+
+def fetch_query_page(query: str, page: int, page_size: Optional[int] = None) -> pd.DataFrame:
+    """SQL 쿼리 결과의 특정 페이지만 조회 (0부터 시작)"""
+    page_size = page_size or int(st.secrets.get("QUERY_PREVIEW_ROWS", DEFAULT_QUERY_PREVIEW_ROWS))
+    _validate_read_query(query)
+    with get_db_connection() as conn:
+        try:
+            _begin_guarded_read(conn)
+            # 필터링 SQL에는 LIKE '%키워드%'가 들어 있어 params를 넘기면 psycopg2가 %를 해석하므로 정수를 직접 넣음
+            return pd.read_sql(
+                f"SELECT * FROM ({_strip_query(query)}) AS paged "
+                f"LIMIT {int(page_size)} OFFSET {int(page) * int(page_size)}",
+                conn
+            )
+        finally:
+            conn.rollback()
 
 def get_latest_prompts(position_id: int) -> dict:
     """최신 프롬프트 세트 조회"""
@@ -503,6 +979,7 @@ def update_filtering_history(filtering_id: int, status: str, filtered_count: int
                 WHERE id = %s
             """, (status, filtered_count, filtering_id))
             conn.commit()
+            invalidate_reads('filtering_history')
 
 def get_latest_filtering_results(position_id: int, filtering_id: Optional[int] = None) -> pd.DataFrame:
     """최신 필터링 결과 조회"""
@@ -525,32 +1002,25 @@ def get_latest_filtering_results(position_id: int, filtering_id: Optional[int] =
             results = cur.fetchall()
             return pd.DataFrame(results) if results else pd.DataFrame()
 
-def execute_query_and_save_results(query: str, filtering_id: int, position_id: int) -> pd.DataFrame:
-    """SQL 쿼리 실행 및 결과 저장"""
+def execute_query_and_save_results(query: str, filtering_id: int, position_id: int,
+                                   params: Optional[dict] = None) -> pd.DataFrame:
+    """SQL 쿼리 실행 및 결과 저장 (params는 guard_query 참고)"""
+    query, plan = guard_query(query, params=params)
     with get_db_connection() as conn:
         try:
-            # 쿼리 실행
-            df = pd.read_sql(query, conn)
+            # 쿼리 실행 (읽기 전용 트랜잭션을 끝낸 뒤 저장)
+            _begin_guarded_read(conn)
+            df = pd.read_sql(query, conn, params=params)
+            conn.rollback()
+            df.attrs['query_plan'] = plan
             
             # 결과가 있는 경우에만 저장 진행
             if not df.empty:
                 with conn.cursor() as cur:
-                    # 각 후보자를 position_candidate 테이블에 'extracted' 상태로 저장
-                    for _, row in df.iterrows():
-                        cur.execute("""
-                            INSERT INTO scraping_saramin_position_candidate 
-                            (position_id, saramin_key, scout_status)
-                            VALUES (%s, %s, 'extracted')
-                            ON CONFLICT (position_id, saramin_key) 
-                            DO UPDATE SET 
-                                scout_status = 
-                                    CASE 
-                                        WHEN scraping_saramin_position_candidate.scout_status = 'extracted' 
-                                        THEN 'extracted'
-                                        ELSE scraping_saramin_position_candidate.scout_status
-                                    END,
-                                last_checked_at = NOW()
-                        """, (position_id, row['saramin_key']))
+                    # 전체 후보자를 position_candidate 테이블에 'extracted' 상태로 일괄 저장
+                    df.attrs['save_result'] = _upsert_position_candidates(
+                        cur, position_id, df['saramin_key'].tolist()
+                    )
                     
                     # 필터링 이력 업데이트
                     cur.execute("""
@@ -562,6 +1032,7 @@ def execute_query_and_save_results(query: str, filtering_id: int, position_id: i
                     """, (len(df), filtering_id))
                     
                     conn.commit()
+                    invalidate_reads('positions', 'filtering_history')
             
             return df
             
@@ -569,6 +1040,194 @@ def execute_query_and_save_results(query: str, filtering_id: int, position_id: i
             conn.rollback()
             raise e
 
+_candidates_table = None
+
+def _qualified_candidates_table() -> str:
+    """스키마를 포함한 후보자 테이블 이름 (CTE로 같은 이름을 가릴 때 원본 참조용)"""
+    global _candidates_table
+    if _candidates_table is None:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT quote_ident(n.nspname) || '.' || quote_ident(c.relname)
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    WHERE c.oid = 'scraping_saramin_candidates'::regclass
+                """)
+                _candidates_table = cur.fetchone()[0]
+    return _candidates_table
+
+def get_last_completed_at(position_id: int, exclude_filtering_id: Optional[int] = None):
+    """포지션의 마지막 필터링 완료 시각 (없으면 None)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT MAX(completed_at)
+                FROM filtering_history
+                WHERE position_id = %s
+                AND status = 'completed'
+                AND id IS DISTINCT FROM %s
+            """, (position_id, exclude_filtering_id))
+            return cur.fetchone()[0]
+
+# 쿼리 앞의 공백과 주석 (WITH 절 판별 전에 건너뜀)
+_LEADING_COMMENTS = re.compile(r'^(?:\s+|--[^\n]*|/\*.*?\*/)*', re.S)
+
+def build_incremental_query(query: str, since: datetime, position_id: int) -> tuple:
+    """저장된 필터링 쿼리를 변경된 후보자 + 현재 추출 목록에만 적용하도록 변환해 (쿼리, params) 반환
+    
+    같은 이름의 CTE로 scraping_saramin_candidates를 가려, since 이후 update_dt가 바뀐
+    후보자와 이미 'extracted' 상태인 후보자만 평가한다. 결과는 기존 목록과 합쳐진 순위가 된다.
+    두 조건을 OR로 묶으면 update_dt 인덱스를 쓰지 못하므로 각각 인덱스로 찾아 UNION ALL로 합친다.
+    since/position_id는 바인딩 파라미터로 넘기므로 원래 쿼리의 %는 %%로 바꾼다.
+    """
+    table = _qualified_candidates_table()
+    changed_cte = f"""scraping_saramin_candidates AS (
+    SELECT c.* FROM {table} c
+    WHERE c.update_dt > %(incremental_since)s
+    UNION ALL
+    SELECT c.* FROM {table} c
+    JOIN scraping_saramin_position_candidate pc ON pc.saramin_key = c.saramin_key
+    WHERE pc.position_id = %(position_id)s AND pc.scout_status = 'extracted'
+    AND (c.update_dt IS NULL OR c.update_dt <= %(incremental_since)s)
+)"""
+    params = {'incremental_since': since, 'position_id': int(position_id)}
+    query = _strip_query(query)
+    query = query[_LEADING_COMMENTS.match(query).end():].replace('%', '%%')
+    match = re.match(r'(?is)^with(\s+recursive)?\s', query)
+    if match:
+        # 기존 WITH 절 맨 앞에 추가
+        return f"{query[:match.end()]}{changed_cte},\n{query[match.end():]}", params
+    return f"WITH {changed_cte}\n{query}", params
+
+def execute_incremental_query_and_save_results(query: str, filtering_id: int, 
+                                               position_id: int) -> pd.DataFrame:
+    """마지막 필터링 이후 변경된 후보자만 평가해 기존 목록에 병합 (이전 실행이 없으면 전체 실행)"""
+    since = get_last_completed_at(position_id, exclude_filtering_id=filtering_id)
+    if since is None:
+        df = execute_query_and_save_results(query, filtering_id, position_id)
+        df.attrs['incremental_since'] = None
+        return df
+    
+    incremental_query, params = build_incremental_query(query, since, position_id)
+    df = execute_query_and_save_results(incremental_query, filtering_id, position_id, params=params)
+    df.attrs['incremental_since'] = since
+    return df
+
+def stream_query_and_save_results(query: str, filtering_id: int, position_id: int,
+                                  chunk_size: Optional[int] = None,
+                                  preview_rows: Optional[int] = None) -> pd.DataFrame:
+    """SQL 쿼리 결과를 청크 단위로 저장하고 미리보기 행만 반환
+    
+    반환한 DataFrame의 attrs에 전체 건수(total_count)와 저장 결과(save_result)를 담는다.
+    나머지 행은 attrs['guarded_query']를 fetch_query_page에 넘겨 필요할 때 페이지 단위로 조회한다.
+    """
+    chunk_size = chunk_size or int(st.secrets.get("QUERY_CHUNK_SIZE", DEFAULT_QUERY_CHUNK_SIZE))
+    preview_rows = preview_rows or int(st.secrets.get("QUERY_PREVIEW_ROWS", DEFAULT_QUERY_PREVIEW_ROWS))
+    query, plan = guard_query(
+        query, max_rows=int(st.secrets.get("QUERY_STREAM_MAX_ROWS", DEFAULT_QUERY_STREAM_MAX_ROWS))
+    )
+    
+    save_result = {'total': 0, 'inserted': 0, 'updated': 0, 'duplicates': 0}
+    preview = []
+    preview_count = 0
+    saramin_keys = []
+    # 연결 하나로: 읽기 전용 트랜잭션에서 청크 단위로 읽으며 키와 미리보기만 모은 뒤,
+    # 새 트랜잭션에서 청크 단위로 저장하고 한 번에 커밋 (연결 두 개를 잡으면 풀이 교착될 수 있음)
+    with get_db_connection() as conn:
+        try:
+            _begin_guarded_read(conn)
+            for chunk in _iter_chunks(conn, query, chunk_size):
+                saramin_keys.extend(chunk['saramin_key'].tolist())
+                if preview_count < preview_rows:
+                    preview.append(chunk.head(preview_rows - preview_count))
+                    preview_count += len(preview[-1])
+        finally:
+            conn.rollback()
+        
+        try:
+            with conn.cursor() as cur:
+                for start in range(0, len(saramin_keys), chunk_size):
+                    chunk_result = _upsert_position_candidates(
+                        cur, position_id, saramin_keys[start:start + chunk_size]
+                    )
+                    for key in save_result:
+                        save_result[key] += chunk_result[key]
+                
+                total_count = save_result['total']
+                if total_count:
+                    cur.execute("""
+                        UPDATE filtering_history 
+                        SET status = 'completed',
+                            filtered_count = %s,
+                            completed_at = NOW()
+                        WHERE id = %s
+                    """, (total_count, filtering_id))
+                conn.commit()
+                if total_count:
+                    invalidate_reads('positions', 'filtering_history')
+            
+        except Exception as e:
+            conn.rollback()
+            raise e
+    
+    df = pd.concat(preview, ignore_index=True) if preview else pd.DataFrame()
+    df.attrs['query_plan'] = plan
+    df.attrs['guarded_query'] = query  # 예산 검사로 LIMIT이 씌워졌을 수 있으므로 실제 실행한 쿼리
+    df.attrs['save_result'] = save_result
+    df.attrs['total_count'] = total_count
+    df.attrs['page_size'] = preview_rows
+    return df
+
+def save_ranked_candidates(ranked: list, filtering_id: int, position_id: int) -> pd.DataFrame:
+    """메모리에서 순위를 매긴 후보자 [(saramin_key, keyword_match_count), ...]를 조회 및 저장"""
+    if not ranked:
+        return pd.DataFrame()
+    
+    match_counts = dict(ranked)
+    with get_db_connection() as conn:
+        try:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                cur.execute("""
+                    SELECT 
+                        saramin_key,
+                        birth_year,
+                        location,
+                        regex_desired_annual_salary,
+                        regex_desired_job,
+                        regex_login_dt
+                    FROM scraping_saramin_candidates
+                    WHERE saramin_key = ANY(%s)
+                """, (list(match_counts),))
+                rows = cur.fetchall()
+                
+                df = pd.DataFrame(rows)
+                if df.empty:
+                    return df
+                
+                # 메모리에서 매긴 순위 유지
+                rank = {key: idx for idx, (key, _) in enumerate(ranked)}
+                df['keyword_match_count'] = df['saramin_key'].map(match_counts)
+                df = df.sort_values(by='saramin_key', key=lambda keys: keys.map(rank)).reset_index(drop=True)
+                
+                df.attrs['save_result'] = _upsert_position_candidates(
+                    cur, position_id, df['saramin_key'].tolist()
+                )
+                cur.execute("""
+                    UPDATE filtering_history 
+                    SET status = 'completed',
+                        filtered_count = %s,
+                        completed_at = NOW()
+                    WHERE id = %s
+                """, (len(df), filtering_id))
+                conn.commit()
+                invalidate_reads('positions', 'filtering_history')
+                return df
+                
+        except Exception as e:
+            conn.rollback()
+            raise e
+
 def get_filtering_results(filtering_id: int) -> pd.DataFrame:
     """특정 필터링 ID의 결과 조회"""
     with get_db_connection() as conn:
@@ -629,6 +1288,7 @@ def save_step_prompt(filtering_id: int, step_name: str, prompt: str):
             ))
             conn.commit()
 
+@cached_read(ttl=300, tags=('prompt_templates',))
 def get_latest_prompt_template(step_name: str) -> dict:
     """단계별 최신 프롬프트 템플릿 조회"""
     with get_db_connection() as conn:
@@ -678,4 +1338,394 @@ def save_prompt_template(step_name: str, template_name: str,
                 RETURNING id
             """, (step_name, template_name, template_content, is_default))
             conn.commit()
+            invalidate_reads('prompt_templates')
             return cur.fetchone()[0]
+
+def mark_scout_sent(position_id: int, saramin_key: str, message_id: int) -> int:
+    """발송 완료 처리 (매핑 상태를 'sent'로 변경하고 발송 이력 저장)"""
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            prepared_statements.execute(cur, "mark_scout_sent", (position_id, saramin_key))
+            result = cur.fetchone()
+            if not result:
+                raise Exception("Mapping not found")
+            
+            prepared_statements.execute(cur, "insert_scout_history", (result['mapping_id'], message_id))
+            
+            conn.commit()
+            return result['mapping_id']
+
+def bulk_mark_scout_sent(results: list, campaign_id: Optional[int] = None,
+                         checkpoint_keys: Optional[list] = None) -> int:
+    """발송 완료 일괄 처리 (results: [(position_id, saramin_key, message_id), ...])
+    
+    매핑 상태 갱신과 발송 이력 저장을 한 문장으로 처리하고 반영된 건수를 반환한다.
+    campaign_id가 주어지면 results의 후보자와 checkpoint_keys(이미 발송되어 기록만 남길 후보자)를
+    같은 트랜잭션에서 캠페인 체크포인트에 'sent'로 기록한다.
+    """
+    # 같은 후보자가 두 번 들어오면 마지막 결과만 반영
+    unique = list({(position_id, key): (position_id, key, message_id)
+                   for position_id, key, message_id in results}.values())
+    campaign_keys = list(dict.fromkeys(
+        [key for _, key, _ in unique] + list(checkpoint_keys or [])
+    )) if campaign_id is not None else []
+    if not unique and not campaign_keys:
+        return 0
+    
+    with get_db_connection() as conn:
+        try:
+            with conn.cursor() as cur:
+                rows = []
+                if unique:
+                    rows = execute_values(cur, """
+                        WITH v(position_id, saramin_key, message_id) AS (
+                            VALUES %s
+                        ),
+                        updated AS (
+                            UPDATE scraping_saramin_position_candidate pc
+                            SET scout_status = 'sent',
+                                last_checked_at = NOW()
+                            FROM v
+                            WHERE pc.position_id = v.position_id 
+                            AND pc.saramin_key = v.saramin_key
+                            RETURNING pc.id as mapping_id, v.message_id
+                        )
+                        INSERT INTO scout_history 
+                        (candidate_filter_id, message_id, status)
+                        SELECT mapping_id, message_id, 'sent' FROM updated
+                        RETURNING candidate_filter_id
+                    """, unique, template="(%s::integer, %s::text, %s::integer)", page_size=1000, fetch=True)
+                if campaign_keys:
+                    _mark_campaign_candidates_sent(cur, campaign_id, campaign_keys)
+                conn.commit()
+                return len(rows)
+        except Exception as e:
+            conn.rollback()
+            raise e
+
+def ensure_job_queue_table():
+    """백그라운드 작업 큐 테이블 생성 (없는 경우)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS scout_jobs (
+                    id BIGSERIAL PRIMARY KEY,
+                    batch_id UUID NOT NULL,
+                    job_type TEXT NOT NULL,
+                    position_id INTEGER,
+                    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    total INTEGER NOT NULL DEFAULT 0,
+                    cursor_position INTEGER NOT NULL DEFAULT 0,
+                    succeeded INTEGER NOT NULL DEFAULT 0,
+                    failed INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    worker_id TEXT,
+                    heartbeat_at TIMESTAMPTZ,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    started_at TIMESTAMPTZ,
+                    finished_at TIMESTAMPTZ
+                );
+                CREATE INDEX IF NOT EXISTS scout_jobs_queued_idx
+                    ON scout_jobs (created_at) WHERE status IN ('queued', 'running');
+                CREATE INDEX IF NOT EXISTS scout_jobs_batch_idx
+                    ON scout_jobs (batch_id);
+            """)
+            conn.commit()
+
+def enqueue_jobs(job_type: str, position_id: int, payloads: list, totals: list) -> str:
+    """같은 batch_id로 작업들을 큐에 등록하고 batch_id 반환"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            batch_id = str(uuid.uuid4())
+            execute_values(cur, """
+                INSERT INTO scout_jobs (batch_id, job_type, position_id, payload, total)
+                VALUES %s
+            """, [
+                (batch_id, job_type, position_id, json.dumps(payload, default=str), total)
+                for payload, total in zip(payloads, totals)
+            ], template="(%s, %s, %s, %s::jsonb, %s)")
+            conn.commit()
+            return batch_id
+
+def dequeue_job(worker_id: str, stale_after_seconds: int = 300) -> Optional[Dict]:
+    """대기 중인 작업 하나를 가져와 실행 상태로 변경 (SKIP LOCKED)
+    
+    heartbeat가 끊긴 실행 중 작업(워커 비정상 종료)도 다시 가져와 체크포인트부터 이어서 실행한다.
+    """
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                UPDATE scout_jobs
+                SET status = 'running',
+                    worker_id = %s,
+                    started_at = COALESCE(started_at, NOW()),
+                    heartbeat_at = NOW()
+                WHERE id = (
+                    SELECT id FROM scout_jobs
+                    WHERE status = 'queued'
+                    OR (status = 'running' AND heartbeat_at < NOW() - make_interval(secs => %s))
+                    ORDER BY created_at
+                    FOR UPDATE SKIP LOCKED
+                    LIMIT 1
+                )
+                RETURNING *
+            """, (worker_id, stale_after_seconds))
+            job = cur.fetchone()
+            conn.commit()
+            return job
+
+class JobLeaseLost(Exception):
+    """다른 워커가 가져갔거나 취소되어 이 워커가 더 이상 실행하면 안 되는 작업"""
+
+def _update_leased_job(cur, job_id: int, worker_id: str):
+    """worker_id 조건으로 갱신한 행이 없으면 JobLeaseLost 발생"""
+    if cur.rowcount == 0:
+        raise JobLeaseLost(f"작업 #{job_id}이(가) 더 이상 워커 {worker_id}의 실행 중 작업이 아닙니다.")
+
+def heartbeat_job(job_id: int, worker_id: str):
+    """실행 중인 작업의 heartbeat 갱신 (후보자 처리와 별도로 주기적으로 호출)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE scout_jobs
+                SET heartbeat_at = NOW()
+                WHERE id = %s AND worker_id = %s AND status = 'running'
+            """, (job_id, worker_id))
+            conn.commit()
+            _update_leased_job(cur, job_id, worker_id)
+
+def checkpoint_job(job_id: int, worker_id: str, cursor_position: int, succeeded: int, failed: int, 
+                   last_error: Optional[str] = None):
+    """작업 진행 위치 저장 (후보자 1명 처리할 때마다 호출)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE scout_jobs
+                SET cursor_position = %s,
+                    succeeded = %s,
+                    failed = %s,
+                    last_error = COALESCE(%s, last_error),
+                    heartbeat_at = NOW()
+                WHERE id = %s AND worker_id = %s AND status = 'running'
+            """, (cursor_position, succeeded, failed, last_error, job_id, worker_id))
+            conn.commit()
+            _update_leased_job(cur, job_id, worker_id)
+
+def finish_job(job_id: int, worker_id: str, status: str, last_error: Optional[str] = None):
+    """작업 종료 상태 기록 (completed / failed / cancelled)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE scout_jobs
+                SET status = %s,
+                    last_error = COALESCE(%s, last_error),
+                    finished_at = NOW()
+                WHERE id = %s AND worker_id = %s AND status = 'running'
+            """, (status, last_error, job_id, worker_id))
+            conn.commit()
+            _update_leased_job(cur, job_id, worker_id)
+
+def cancel_job_batch(batch_id: str):
+    """아직 끝나지 않은 배치 작업 취소"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE scout_jobs
+                SET status = 'cancelled',
+                    finished_at = NOW()
+                WHERE batch_id = %s AND status IN ('queued', 'running')
+            """, (batch_id,))
+            conn.commit()
+
+def get_job_status(job_id: int) -> Optional[str]:
+    """작업 상태 조회 (워커가 취소 여부 확인용)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT status FROM scout_jobs WHERE id = %s", (job_id,))
+            result = cur.fetchone()
+            return result[0] if result else None
+
+def get_job_batch_progress(batch_id: str) -> Dict:
+    """배치 작업 전체 진행률 조회"""
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT 
+                    COUNT(*) as jobs,
+                    COALESCE(SUM(total), 0) as total,
+                    COALESCE(SUM(cursor_position), 0) as processed,
+                    COALESCE(SUM(succeeded), 0) as succeeded,
+                    COALESCE(SUM(failed), 0) as failed,
+                    COUNT(*) FILTER (WHERE status = 'queued') as queued,
+                    COUNT(*) FILTER (WHERE status = 'running') as running,
+                    COUNT(*) FILTER (WHERE status IN ('completed', 'failed', 'cancelled')) as finished,
+                    MAX(last_error) as last_error
+                FROM scout_jobs
+                WHERE batch_id = %s
+            """, (batch_id,))
+            return cur.fetchone()
+
+def ensure_campaign_tables():
+    """스카우트 발송 캠페인 체크포인트 테이블 생성 (없는 경우)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS scout_campaigns (
+                    id BIGSERIAL PRIMARY KEY,
+                    position_id INTEGER NOT NULL,
+                    message JSONB NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'running',
+                    total INTEGER NOT NULL DEFAULT 0,
+                    cursor_position INTEGER NOT NULL DEFAULT 0,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    finished_at TIMESTAMPTZ
+                );
+                CREATE TABLE IF NOT EXISTS scout_campaign_candidates (
+                    campaign_id BIGINT NOT NULL REFERENCES scout_campaigns(id) ON DELETE CASCADE,
+                    saramin_key TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    candidate JSONB NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    last_attempt_at TIMESTAMPTZ,
+                    PRIMARY KEY (campaign_id, saramin_key)
+                );
+                CREATE INDEX IF NOT EXISTS scout_campaigns_position_idx
+                    ON scout_campaigns (position_id, created_at DESC);
+            """)
+            conn.commit()
+
+def create_campaign(position_id: int, message: Dict, candidates: list) -> int:
+    """발송 캠페인과 후보자별 체크포인트 행 생성 후 campaign_id 반환"""
+    candidates = list({c['saramin_key']: c for c in candidates}.values())
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                INSERT INTO scout_campaigns (position_id, message, total)
+                VALUES (%s, %s::jsonb, %s)
+                RETURNING id
+            """, (position_id, json.dumps(message, default=str), len(candidates)))
+            campaign_id = cur.fetchone()[0]
+            execute_values(cur, """
+                INSERT INTO scout_campaign_candidates (campaign_id, saramin_key, position, candidate)
+                VALUES %s
+            """, [
+                (campaign_id, candidate['saramin_key'], position, json.dumps(candidate, default=str))
+                for position, candidate in enumerate(candidates)
+            ], template="(%s, %s, %s, %s::jsonb)")
+            conn.commit()
+            return campaign_id
+
+def record_campaign_attempt(campaign_id: int, saramin_key: str, success: bool, 
+                            error: Optional[str] = None):
+    """후보자 1명의 발송 시도 결과 저장 (첫 시도면 캠페인 진행 위치도 증가)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                WITH attempted AS (
+                    UPDATE scout_campaign_candidates
+                    SET status = %s,
+                        attempts = attempts + 1,
+                        last_error = %s,
+                        last_attempt_at = NOW()
+                    WHERE campaign_id = %s AND saramin_key = %s
+                    RETURNING attempts
+                )
+                UPDATE scout_campaigns
+                SET cursor_position = cursor_position 
+                        + (SELECT COUNT(*) FROM attempted WHERE attempts = 1),
+                    updated_at = NOW()
+                WHERE id = %s
+            """, ('sent' if success else 'failed', None if success else error,
+                  campaign_id, saramin_key, campaign_id))
+            conn.commit()
+
+def _mark_campaign_candidates_sent(cur, campaign_id: int, saramin_keys: list):
+    """캠페인 후보자 여러 명을 발송 완료로 기록 (첫 시도면 캠페인 진행 위치도 증가)"""
+    cur.execute("""
+        WITH attempted AS (
+            UPDATE scout_campaign_candidates
+            SET status = 'sent',
+                attempts = attempts + 1,
+                last_error = NULL,
+                last_attempt_at = NOW()
+            WHERE campaign_id = %s AND saramin_key = ANY(%s) AND status != 'sent'
+            RETURNING attempts
+        )
+        UPDATE scout_campaigns
+        SET cursor_position = cursor_position 
+                + (SELECT COUNT(*) FROM attempted WHERE attempts = 1),
+            updated_at = NOW()
+        WHERE id = %s
+    """, (campaign_id, saramin_keys, campaign_id))
+
+def finish_campaign(campaign_id: int):
+    """캠페인 실행 종료 기록 (남은 후보자가 없으면 completed)"""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                UPDATE scout_campaigns
+                SET status = CASE 
+                        WHEN EXISTS (
+                            SELECT 1 FROM scout_campaign_candidates
+                            WHERE campaign_id = %s AND status != 'sent'
+                        ) THEN 'interrupted'
+                        ELSE 'completed'
+                    END,
+                    updated_at = NOW(),
+                    finished_at = NOW()
+                WHERE id = %s
+            """, (campaign_id, campaign_id))
+            conn.commit()
+
+def get_campaign(campaign_id: int) -> Optional[Dict]:
+    """캠페인 정보 조회"""
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("SELECT * FROM scout_campaigns WHERE id = %s", (campaign_id,))
+            return cur.fetchone()
+
+def get_resumable_campaign_candidates(campaign_id: int, max_attempts: int) -> List[Dict]:
+    """아직 발송하지 못한 후보자 조회 (미시도 + 재시도 횟수가 남은 실패), 원래 순서대로"""
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT candidate, attempts, last_error
+                FROM scout_campaign_candidates
+                WHERE campaign_id = %s
+                AND status != 'sent'
+                AND attempts < %s
+                ORDER BY position
+            """, (campaign_id, max_attempts))
+            return [
+                {**row['candidate'], 'attempts': row['attempts'], 'last_error': row['last_error']}
+                for row in cur.fetchall()
+            ]
+
+def get_position_campaigns(position_id: int, limit: int = 10) -> List[Dict]:
+    """포지션의 최근 발송 캠페인과 후보자 상태별 건수 조회"""
+    with get_db_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("""
+                SELECT 
+                    c.id,
+                    c.status,
+                    c.total,
+                    c.cursor_position,
+                    c.created_at,
+                    c.updated_at,
+                    COUNT(*) FILTER (WHERE cc.status = 'sent') as sent,
+                    COUNT(*) FILTER (WHERE cc.status = 'failed') as failed,
+                    COUNT(*) FILTER (WHERE cc.status = 'pending') as pending,
+                    MAX(cc.last_error) as last_error
+                FROM scout_campaigns c
+                LEFT JOIN scout_campaign_candidates cc ON cc.campaign_id = c.id
+                WHERE c.position_id = %s
+                GROUP BY c.id
+                ORDER BY c.created_at DESC
+                LIMIT %s
+            """, (position_id, limit))
+            return cur.fetchall()
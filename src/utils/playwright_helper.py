@@ -0,0 +1,326 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import streamlit as st
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Request, Response, Route
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_USES = 50  # 컨텍스트 하나를 재사용할 최대 횟수
+
+# 요청 차단 프로필 기본값 (st.secrets로 재정의 가능)
+DEFAULT_REQUEST_PROFILE = 'lean'
+DEFAULT_BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+DEFAULT_DENIED_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'facebook.com',
+    'criteo.com', 'criteo.net', 'kakao.com', 'daumcdn.net', 'naver.net'
+)
+# 차단한 요청의 크기를 아직 관측하지 못했을 때 쓰는 리소스 유형별 추정 크기 (bytes)
+ESTIMATED_RESOURCE_BYTES = {
+    'image': 30000,
+    'media': 500000,
+    'font': 40000,
+    'stylesheet': 20000,
+    'script': 30000
+}
+DEFAULT_ESTIMATED_BYTES = 10000
+
+def _matches_domain(host: str, domains: Iterable[str]) -> bool:
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+class RequestProfile:
+    """브라우저 컨텍스트에 적용하는 요청 차단 규칙과 페이지 대기 방식
+
+    리소스 유형(blocked_resource_types)과 도메인(denied_domains)으로 요청을 차단하고,
+    allowed_domains가 있으면 그 밖의 도메인(서드파티)도 모두 차단한다.
+    """
+
+    def __init__(self, name: str, blocked_resource_types: Iterable[str] = (),
+                 allowed_domains: Iterable[str] = (), denied_domains: Iterable[str] = (),
+                 wait_until: str = 'domcontentloaded'):
+        self.name = name
+        self.blocked_resource_types = set(blocked_resource_types)
+        self.allowed_domains = tuple(allowed_domains)
+        self.denied_domains = tuple(denied_domains)
+        self.wait_until = wait_until
+        self._lock = threading.Lock()
+        self._observed_bytes: Dict[str, list] = {}  # resource_type -> [합계, 건수]
+        self.stats = {
+            'requests': 0,
+            'blocked': 0,
+            'blocked_by_reason': {},
+            'bytes_loaded': 0,
+            'bytes_saved_estimate': 0,
+            'navigations': 0,
+            'navigation_time_total': 0.0
+        }
+
+    @property
+    def is_passthrough(self) -> bool:
+        return not (self.blocked_resource_types or self.allowed_domains or self.denied_domains)
+
+    def block_reason(self, request: Request) -> Optional[str]:
+        """차단 사유 (허용하면 None)"""
+        if request.resource_type == 'document' and request.is_navigation_request():
+            return None
+        if request.resource_type in self.blocked_resource_types:
+            return f"type:{request.resource_type}"
+
+        host = urlparse(request.url).hostname or ''
+        if not host:
+            return None  # data:, blob: 등
+        if _matches_domain(host, self.denied_domains):
+            return "domain:denied"
+        if self.allowed_domains and not _matches_domain(host, self.allowed_domains):
+            return "domain:third_party"
+        return None
+
+    def _estimated_bytes(self, resource_type: str) -> int:
+        total, count = self._observed_bytes.get(resource_type, (0, 0))
+        if count:
+            return total // count
+        return ESTIMATED_RESOURCE_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+
+    async def handle_route(self, route: Route):
+        """context.route 핸들러"""
+        reason = self.block_reason(route.request)
+        with self._lock:
+            self.stats['requests'] += 1
+            if reason:
+                self.stats['blocked'] += 1
+                self.stats['blocked_by_reason'][reason] = self.stats['blocked_by_reason'].get(reason, 0) + 1
+                self.stats['bytes_saved_estimate'] += self._estimated_bytes(route.request.resource_type)
+        if reason:
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    def on_response(self, response: Response):
+        """허용된 응답의 크기 집계 (Content-Length 기준)"""
+        length = response.headers.get('content-length')
+        if not length or not length.isdigit():
+            return
+        resource_type = response.request.resource_type
+        with self._lock:
+            self.stats['bytes_loaded'] += int(length)
+            observed = self._observed_bytes.setdefault(resource_type, [0, 0])
+            observed[0] += int(length)
+            observed[1] += 1
+
+    def record_navigation(self, elapsed: float):
+        with self._lock:
+            self.stats['navigations'] += 1
+            self.stats['navigation_time_total'] += elapsed
+
+    async def apply(self, context: BrowserContext):
+        """컨텍스트에 요청 라우팅 등록"""
+        context.on("response", self.on_response)
+        if not self.is_passthrough:
+            await context.route("**/*", self.handle_route)
+
+    def summary(self) -> dict:
+        with self._lock:
+            stats = dict(self.stats, blocked_by_reason=dict(self.stats['blocked_by_reason']))
+        stats['name'] = self.name
+        stats['navigation_time_avg'] = (
+            stats['navigation_time_total'] / stats['navigations'] if stats['navigations'] else 0.0
+        )
+        return stats
+
+def _build_profiles() -> Dict[str, RequestProfile]:
+    return {
+        # 필요한 DOM만 받는 기본 프로필
+        'lean': RequestProfile(
+            'lean',
+            blocked_resource_types=st.secrets.get("BROWSER_BLOCKED_RESOURCE_TYPES", DEFAULT_BLOCKED_RESOURCE_TYPES),
+            allowed_domains=st.secrets.get("BROWSER_ALLOWED_DOMAINS", ()),
+            denied_domains=st.secrets.get("BROWSER_DENIED_DOMAINS", DEFAULT_DENIED_DOMAINS),
+            wait_until='domcontentloaded'
+        ),
+        # 차단 없이 전체 페이지를 받는 프로필 (문제 확인 및 비교용)
+        'full': RequestProfile('full', wait_until='load')
+    }
+
+_profiles: Optional[Dict[str, RequestProfile]] = None
+_profiles_lock = threading.Lock()
+
+def get_request_profile(name: Optional[str] = None) -> RequestProfile:
+    """이름으로 프로세스 전역 요청 프로필 조회 (지표가 프로필 단위로 누적됨)"""
+    global _profiles
+    if _profiles is None:
+        with _profiles_lock:
+            if _profiles is None:
+                _profiles = _build_profiles()
+    name = name or st.secrets.get("BROWSER_REQUEST_PROFILE", DEFAULT_REQUEST_PROFILE)
+    if name not in _profiles:
+        raise ValueError(f"알 수 없는 요청 프로필: {name}")
+    return _profiles[name]
+
+def get_request_profile_stats() -> Dict[str, dict]:
+    """프로필별 요청 차단/절감 지표 ('full' 대비 평균 이동 시간 절감량 포함)"""
+    if _profiles is None:
+        return {}
+    summaries = {name: profile.summary() for name, profile in _profiles.items()}
+    baseline = summaries['full']['navigation_time_avg']
+    for summary in summaries.values():
+        summary['time_saved_estimate'] = (
+            max(0.0, baseline - summary['navigation_time_avg']) * summary['navigations']
+            if baseline and summary['navigations'] else 0.0
+        )
+    return summaries
+
+# 풀에서 만든 페이지 → 적용된 요청 프로필
+_page_profiles: "weakref.WeakKeyDictionary[Page, RequestProfile]" = weakref.WeakKeyDictionary()
+
+async def navigate(page: Page, url: str, wait_for: Optional[str] = None, timeout: float = 30000):
+    """프로필의 대기 방식으로 이동한 뒤 필요한 셀렉터만 기다림 (load 이벤트를 기다리지 않음)"""
+    profile = _page_profiles.get(page)
+    start = time.monotonic()
+    response = await page.goto(url, wait_until=profile.wait_until if profile else 'load', timeout=timeout)
+    if wait_for:
+        await page.wait_for_selector(wait_for, state="attached", timeout=timeout)
+    if profile:
+        profile.record_navigation(time.monotonic() - start)
+    return response
+
+class _PoolSlot:
+    """브라우저 컨텍스트 + 페이지 한 쌍"""
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+class BrowserPool:
+    """Chromium 한 개를 띄워두고 컨텍스트/페이지를 재사용하는 브라우저 풀
+
+    Playwright 객체는 생성된 이벤트 루프에 묶이므로, 풀은 하나의 asyncio.run 안에서
+    (발송 캠페인, 응답 상태 확인 등 작업 단위로) 열고 닫는다.
+    """
+
+    def __init__(self, size: Optional[int] = None, max_uses: Optional[int] = None,
+                 headless: bool = True, storage_state: Optional[str] = None,
+                 profile: Optional[str] = None):
+        self.size = size or int(st.secrets.get("BROWSER_POOL_SIZE", DEFAULT_POOL_SIZE))
+        self.max_uses = max_uses or int(st.secrets.get("BROWSER_MAX_USES", DEFAULT_MAX_USES))
+        self.headless = headless
+        # 로그인된 사람인 세션 (Playwright storage state JSON 파일)
+        self.storage_state = storage_state or st.secrets.get("SARAMIN_STORAGE_STATE")
+        self.profile = get_request_profile(profile)
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._slots: Optional[asyncio.Queue] = None
+        self._launch_lock = asyncio.Lock()
+        self.stats = {
+            'browser_launches': 0,
+            'contexts_created': 0,
+            'recycled': 0,
+            'crashes': 0,
+            'uses': 0
+        }
+
+    async def start(self):
+        """브라우저 실행 및 슬롯 생성"""
+        self._playwright = await async_playwright().start()
+        await self._ensure_browser()
+        self._slots = asyncio.Queue()
+        for _ in range(self.size):
+            self._slots.put_nowait(await self._new_slot())
+        return self
+
+    async def close(self):
+        """모든 컨텍스트와 브라우저 종료"""
+        if self._slots is not None:
+            while not self._slots.empty():
+                await self._close_slot(self._slots.get_nowait())
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _ensure_browser(self):
+        """브라우저가 없거나 비정상 종료된 경우 다시 실행"""
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                self.stats['browser_launches'] += 1
+
+    async def _new_slot(self) -> _PoolSlot:
+        await self._ensure_browser()
+        context_options = {}
+        if self.storage_state and os.path.exists(self.storage_state):
+            context_options['storage_state'] = self.storage_state
+        context = await self._browser.new_context(**context_options)
+        await self.profile.apply(context)
+        page = await context.new_page()
+        _page_profiles[page] = self.profile
+        self.stats['contexts_created'] += 1
+        return _PoolSlot(context, page)
+
+    async def _close_slot(self, slot: _PoolSlot):
+        try:
+            await slot.context.close()
+        except Exception:
+            pass  # 이미 종료된 컨텍스트
+
+    async def _recycle(self, slot: _PoolSlot) -> _PoolSlot:
+        await self._close_slot(slot)
+        self.stats['recycled'] += 1
+        return await self._new_slot()
+
+    @asynccontextmanager
+    async def page(self):
+        """풀에서 페이지를 빌려 사용 (사용 횟수 초과/오류 시 컨텍스트 교체)"""
+        slot = await self._slots.get()
+        failed = False
+        try:
+            if slot.page.is_closed() or not self._browser.is_connected():
+                slot = await self._recycle(slot)
+            yield slot.page
+        except Exception:
+            failed = True
+            self.stats['crashes'] += 1
+            raise
+        finally:
+            slot.uses += 1
+            self.stats['uses'] += 1
+            try:
+                if failed or slot.uses >= self.max_uses:
+                    slot = await self._recycle(slot)
+            finally:
+                self._slots.put_nowait(slot)
+
+    async def save_storage_state(self, path: Optional[str] = None):
+        """현재 로그인 세션을 파일로 저장하여 이후 컨텍스트에서 재사용"""
+        path = path or self.storage_state
+        if not path:
+            raise ValueError("storage state 경로가 설정되지 않았습니다.")
+        slot = await self._slots.get()
+        try:
+            await slot.context.storage_state(path=path)
+        finally:
+            self._slots.put_nowait(slot)
+
+@asynccontextmanager
+async def pooled_page(pool: Optional[BrowserPool] = None):
+    """풀이 주어지면 풀의 페이지를, 없으면 일회용 브라우저의 페이지를 제공"""
+    if pool is not None:
+        async with pool.page() as page:
+            yield page
+    else:
+        async with BrowserPool(size=1) as temp_pool:
+            async with temp_pool.page() as page:
+                yield page
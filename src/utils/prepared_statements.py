@@ -0,0 +1,78 @@
+import threading
+import weakref
+from typing import Dict, Optional, Sequence
+
+from psycopg2 import errors, extensions
+
+class PreparedStatementRegistry:
+    """자주 실행하는 SQL을 연결별로 한 번만 PREPARE하고 이후에는 이름으로 EXECUTE
+
+    PREPARE는 세션 단위로 유지되므로 준비 기록은 연결 객체에 묶어 두고(약한 참조),
+    연결 객체가 사라지면 함께 지워진다. 파라미터 타입은 생략하면 서버가 SQL 문맥에서 추론한다.
+    """
+
+    def __init__(self):
+        self._statements: Dict[str, tuple] = {}  # name -> (param_types, sql)
+        self._prepared = weakref.WeakKeyDictionary()  # conn -> 준비된 문장 이름
+        self._lock = threading.Lock()
+        self._stats = {'prepares': 0, 'executions': 0}
+
+    def register(self, name: str, sql: str, param_types: Optional[Sequence[str]] = None):
+        """$1, $2 ... 자리표시자를 쓰는 SQL 등록"""
+        self._statements[name] = (tuple(param_types or ()), sql)
+
+    def _prepare(self, cur, name: str):
+        param_types, sql = self._statements[name]
+        types = f" ({', '.join(param_types)})" if param_types else ""
+        cur.execute(f"PREPARE {name}{types} AS {sql}")
+        with self._lock:
+            self._prepared.setdefault(cur.connection, set()).add(name)
+            self._stats['prepares'] += 1
+
+    def _execute(self, cur, name: str, params: Sequence):
+        if params:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", tuple(params))
+        else:
+            cur.execute(f"EXECUTE {name}")
+
+    def execute(self, cur, name: str, params: Sequence = ()):
+        """커서의 연결에 준비되지 않았으면 PREPARE 후 EXECUTE
+
+        서버에 문장이 없으면(연결이 재설정된 경우 등) 다시 PREPARE하여 한 번 재시도한다.
+        트랜잭션 도중이면 이미 실패한 트랜잭션을 되살릴 수 없으므로 기록만 지우고 예외를 그대로 올린다.
+        """
+        conn = cur.connection
+        with self._lock:
+            prepared = name in self._prepared.get(conn, ())
+
+        if not prepared:
+            self._prepare(cur, name)
+            self._execute(cur, name, params)
+        else:
+            in_transaction = conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE
+            try:
+                self._execute(cur, name, params)
+            except errors.InvalidSqlStatementName:
+                self.forget(conn)
+                if in_transaction:
+                    raise
+                conn.rollback()
+                self._prepare(cur, name)
+                self._execute(cur, name, params)
+
+        with self._lock:
+            self._stats['executions'] += 1
+
+    def forget(self, conn):
+        """폐기되는 연결의 준비 기록 삭제"""
+        with self._lock:
+            self._prepared.pop(conn, None)
+
+    def stats(self) -> dict:
+        """PREPARE/EXECUTE 횟수와 준비된 연결 수"""
+        with self._lock:
+            return {
+                **self._stats,
+                'connections': len(self._prepared),
+                'statements': len(self._statements)
+            }
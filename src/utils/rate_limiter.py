@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import streamlit as st
+
+DEFAULT_HOST = "www.saramin.co.kr"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE_PER_SEC = 1.0
+DEFAULT_BURST = 2
+FAILURE_BACKOFF = 1.0  # 초, 실패 시 시작 대기 시간
+TIMEOUT_BACKOFF = 5.0  # 초, 타임아웃 시 시작 대기 시간
+MAX_BACKOFF = 60.0
+
+class AdaptiveTokenBucket:
+    """호스트별 토큰 버킷 (실패/타임아웃이 이어지면 버킷 보충을 점점 길게 멈춤)"""
+
+    def __init__(self, rate: float, burst: int, max_backoff: float = MAX_BACKOFF,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = burst
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated_at = clock()  # 이 시각부터 토큰이 다시 채워짐 (백오프 중에는 미래 시각)
+        self.backoff = 0.0
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약(부족하면 음수)하고 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.tokens -= 1
+            return max(0.0, self.updated_at - now) + max(0.0, -self.tokens) / self.rate
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기
+
+        예약과 대기 시간 계산만 잠금 안에서 하고 잠금 없이 기다리므로,
+        한 발송자의 대기가 같은 호스트의 다른 발송자를 막지 않는다.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        """성공 시 다음 실패에 적용할 백오프를 절반으로 줄임"""
+        with self._lock:
+            self.backoff = self.backoff / 2 if self.backoff >= FAILURE_BACKOFF else 0.0
+
+    def on_failure(self, timeout: bool = False):
+        """실패 시 백오프를 두 배로 늘리고(타임아웃은 더 길게 시작) 그동안 버킷 보충을 멈춤
+
+        남은 토큰을 비우고 보충 시작 시각을 백오프만큼 미루므로, 이후의 모든 예약이 함께 늦춰진다.
+        """
+        with self._lock:
+            base = TIMEOUT_BACKOFF if timeout else FAILURE_BACKOFF
+            self.backoff = min(self.max_backoff, max(base, self.backoff * 2))
+            now = self.clock()
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+            self.updated_at = max(self.updated_at, now + self.backoff)
+
+def host_of(url: Optional[str]) -> str:
+    """URL의 호스트 (없으면 사람인 기본 호스트)"""
+    return urlparse(url or '').netloc or DEFAULT_HOST
+
+class HostRateLimiter:
+    """호스트별 AdaptiveTokenBucket 모음 (하나의 이벤트 루프 안에서 사용)"""
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        self.rate = rate or float(st.secrets.get("SARAMIN_RATE_PER_SEC", DEFAULT_RATE_PER_SEC))
+        self.burst = burst or int(st.secrets.get("SARAMIN_BURST", DEFAULT_BURST))
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+
+    def bucket(self, url: Optional[str]) -> AdaptiveTokenBucket:
+        host = host_of(url)
+        if host not in self._buckets:
+            self._buckets[host] = AdaptiveTokenBucket(self.rate, self.burst)
+        return self._buckets[host]
+
+async def run_bounded(items: List, handler: Callable[[object], Awaitable[bool]],
+                      concurrency: Optional[int] = None,
+                      progress_callback: Optional[Callable[[int, int], None]] = None) -> int:
+    """최대 concurrency개씩 동시에 handler를 실행하고 성공 건수를 반환"""
+    concurrency = concurrency or int(st.secrets.get("SCOUT_CONCURRENCY", DEFAULT_CONCURRENCY))
+    semaphore = asyncio.Semaphore(concurrency)
+    total = len(items)
+    completed = 0
+    success_count = 0
+
+    async def run_one(item):
+        nonlocal completed, success_count
+        async with semaphore:
+            try:
+                success = await handler(item)
+            except Exception:
+                # 한 건의 예외로 전체 캠페인이 중단되지 않도록 실패로 집계
+                success = False
+        completed += 1
+        if success:
+            success_count += 1
+        if progress_callback:
+            progress_callback(completed, total)
+
+    await asyncio.gather(*(run_one(item) for item in items))
+    return success_count
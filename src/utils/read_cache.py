@@ -0,0 +1,93 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict
+
+DEFAULT_MAX_ENTRIES = 1024
+
+class ReadCache:
+    """프로세스 전역 조회 결과 캐시 (항목별 TTL, 태그 단위 무효화, 최대 항목 수 초과 시 LRU 제거)"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires_at, tags, value), 오래 안 쓴 순
+        self.max_entries = max_entries
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _record(self, name: str, hit: bool):
+        stats = self._stats.setdefault(name, {'hits': 0, 'misses': 0})
+        stats['hits' if hit else 'misses'] += 1
+
+    def get(self, key: tuple):
+        """(적중 여부, 값) 반환"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._record(key[0], True)
+                self._entries.move_to_end(key)
+                return True, copy.deepcopy(entry[2])
+            self._entries.pop(key, None)
+            self._record(key[0], False)
+            return False, None
+
+    def set(self, key: tuple, value, ttl: float, tags: tuple):
+        with self._lock:
+            now = time.monotonic()
+            self._entries[key] = (now + ttl, tags, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                # 다시 읽히지 않아 남아 있는 만료 항목부터 정리하고, 그래도 넘치면 오래 안 쓴 항목 제거
+                for expired in [k for k, entry in self._entries.items() if entry[0] <= now]:
+                    del self._entries[expired]
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, *tags: str):
+        """태그가 하나라도 겹치는 항목 제거"""
+        tags = set(tags)
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if tags & set(entry[1])]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Dict]:
+        """함수별 적중/미스 횟수와 적중률"""
+        with self._lock:
+            result = {}
+            for name, stats in self._stats.items():
+                total = stats['hits'] + stats['misses']
+                result[name] = {
+                    **stats,
+                    'hit_ratio': stats['hits'] / total if total else 0.0
+                }
+            return result
+
+read_cache = ReadCache()
+
+def cached_read(ttl: float, tags: tuple):
+    """조회 함수 결과를 ttl초 동안 캐시 (tags로 묶어 쓰기 함수에서 무효화)"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            hit, value = read_cache.get(key)
+            if hit:
+                return value
+            value = func(*args, **kwargs)
+            read_cache.set(key, value, ttl, tags)
+            return value
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+def invalidate_reads(*tags: str):
+    """태그에 해당하는 캐시 무효화"""
+    read_cache.invalidate(*tags)
@@ -13,12 +13,21 @@ from src.utils.database import (
     save_candidate_filtering_result,
     update_filtering_history,
     execute_query_and_save_results,
+    stream_query_and_save_results,
+    execute_incremental_query_and_save_results,
+    fetch_query_page,
+    QueryBudgetExceeded,
+    save_ranked_candidates,
     get_latest_step_prompt,
     save_step_prompt,
     save_prompt_template,
     get_latest_prompt_template
 )
 from src.services.ai_service import AIService
+from src.services.llm_cache import get_llm_cache
+from src.services.candidate_index import get_candidate_index
+from src.services.scoring_engine import get_scoring_engine
+from src.services.query_builder import parse_keywords, DEFAULT_LIMIT
 from openai import OpenAI
 import json
 
@@ -60,6 +69,16 @@ def load_example_data(example_type: str):
         st.session_state.job_type = example["job_type"]
         st.rerun()
 
+def show_query_plan(plan: dict):
+    """쿼리 예산 검사 결과와 실행 계획 요약 표시"""
+    st.caption(
+        f"예상 비용 {plan['total_cost']:.0f} / 예산 {plan['max_cost']:.0f} · "
+        f"예상 행 수 {plan['plan_rows']} / 예산 {plan['max_rows']}"
+    )
+    if plan['rewritten']:
+        st.warning(f"예상 행 수가 예산을 넘어 LIMIT {plan['max_rows']}을(를) 적용해 실행했습니다.")
+    st.code("\n".join(plan['summary']), language="text")
+
 @require_auth
 def show_ai_filtering_page():
     st.title("AI 기반 후보자 필터링")
@@ -70,6 +89,27 @@ def show_ai_filtering_page():
         
     position_id = st.session_state.selected_position_id
     
+    # LLM 응답 캐시 설정
+    with st.expander("LLM 응답 캐시", expanded=False):
+        st.checkbox(
+            "캐시 사용 안 함 (항상 새로 요청)",
+            key="llm_cache_bypass",
+            help="같은 프롬프트는 저장된 응답을 재사용합니다. 체크하면 매번 GPT를 다시 호출합니다."
+        )
+        cache_stats = get_llm_cache().stats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("저장된 응답", cache_stats['entries'])
+        with col2:
+            st.metric("적중", cache_stats['hits'])
+        with col3:
+            st.metric("미스", cache_stats['misses'])
+        with col4:
+            st.metric("적중률", f"{cache_stats['hit_ratio']*100:.1f}%")
+        if st.button("캐시 비우기", key="clear_llm_cache"):
+            get_llm_cache().clear()
+            st.success("LLM 응답 캐시를 비웠습니다.")
+    
     # 프롬프트 관리 섹션
     st.header("1. 프롬프트 이력")
     
@@ -330,6 +370,46 @@ def show_ai_filtering_page():
     # 키워드 통합 섹션
     st.header("4. 키워드 통합")
     
+    # 추출/정제를 동시에 실행하고 바로 통합까지 진행
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        pipeline_button = st.button("추출·정제·통합 한번에 실행", key="run_keyword_pipeline")
+    with col2:
+        st.caption("채용공고와 직무 분류로 키워드 추출과 정제를 동시에 실행한 뒤 통합합니다.")
+    
+    if pipeline_button:
+        if not job_description or not job_type:
+            st.error("채용공고와 직무 분류를 모두 입력해주세요.")
+        else:
+            with st.spinner("키워드 추출·정제·통합 중..."):
+                if "filtering_id" not in st.session_state:
+                    st.session_state.filtering_id = save_filtering_history(
+                        position_id=position_id,
+                        job_description=job_description,
+                        step="prompts",
+                        result={
+                            'prompt1': st.session_state.get('extract_prompt_input', ''),
+                            'prompt2': st.session_state.get('refine_prompt_input', ''),
+                            'prompt3': st.session_state.get('combine_prompt', '')
+                        }
+                    )
+                
+                ai_service = AIService()
+                result = ai_service.run_keyword_pipeline(
+                    job_description,
+                    job_type,
+                    filtering_id=st.session_state.filtering_id
+                )
+                if result:
+                    st.session_state.extracted_keywords = result['extracted_keywords']
+                    st.session_state.refined_keywords = result['refined_keywords']
+                    st.session_state.combined_keywords = result['combined_keywords']
+                    # 편집 위젯이 새 결과를 표시하도록 기존 입력값 제거
+                    for widget_key in ['edited_extracted_keywords', 'edited_refined_keywords', 'edited_combined_keywords']:
+                        st.session_state.pop(widget_key, None)
+                    st.success("키워드 추출·정제·통합 완료!")
+                    st.rerun()
+    
     if 'extracted_keywords' in st.session_state and 'refined_keywords' in st.session_state:
         with st.expander("통합 프롬프트 설정", expanded=False):
             st.markdown("""
@@ -485,13 +565,21 @@ order는 키워드가 많이 일치하는 순서, 연봉수준이 비슷한것 
                     st.session_state.current_sql_template_id = template_id
                     st.session_state.current_sql_prompt = sql_prompt
         
+        use_llm_sql = st.checkbox(
+            "GPT로 SQL 생성",
+            value=False,
+            key="use_llm_sql",
+            help="기본적으로 쿼리 빌더가 키워드/경력/지역 조건으로 SQL을 즉시 생성합니다. 체크하면 위 프롬프트로 GPT에 요청합니다."
+        )
+        
         # 쿼리 생성 버튼
         if st.button("SQL 쿼리 생성", key="generate_sql_button"):
             with st.spinner("SQL 쿼리 생성 중..."):
                 ai_service = AIService()
                 result = ai_service.generate_sql(
                     keywords=st.session_state.combined_keywords['keywords'],
-                    job_description=st.session_state.get('job_description', '')
+                    job_description=st.session_state.get('job_description', ''),
+                    use_llm=use_llm_sql
                 )
                 if result:
                     st.session_state.sql_query = result
@@ -510,13 +598,43 @@ order는 키워드가 많이 일치하는 순서, 연봉수준이 비슷한것 
     with st.container():
         st.markdown("---")
         st.subheader("쿼리 실행")
-        col1, col2 = st.columns([1, 4])
+        col1, col2, col3 = st.columns([1, 1, 3])
         with col1:
             execute_button = st.button("쿼리 실행", key="execute_sql_button")
         with col2:
+            index_button = st.button(
+                "인덱스 검색",
+                key="index_search_button",
+                help="통합 키워드로 메모리 색인에서 바로 검색합니다 (경력/지역 조건은 적용되지 않음)."
+            )
+            score_button = st.button(
+                "점수 엔진 검색",
+                key="scoring_engine_button",
+                help="통합 키워드와 채용공고의 경력/지역/연봉 조건으로 메모리에서 바로 순위를 계산합니다."
+            )
+        with col3:
             st.info("쿼리를 직접 입력하거나 수정하여 실행할 수 있습니다.")
+            stream_results = st.checkbox(
+                "대용량 스트리밍 실행",
+                value=False,
+                key="stream_query_results",
+                help="LIMIT 없이 넓게 조회할 때 사용합니다. 결과를 청크 단위로 저장하고 미리보기만 메모리에 유지합니다."
+            )
+            incremental_results = st.checkbox(
+                "변경분만 다시 필터링",
+                value=False,
+                key="incremental_query_results",
+                disabled=stream_results,
+                help="마지막 필터링 완료 이후 추가/수정된 후보자만 평가해 기존 추출 목록과 합칩니다. 이전 실행이 없으면 전체를 실행합니다."
+            )
+        
+        run_query = execute_button and edited_query.strip()  # 쿼리가 비어있지 않은 경우에만 실행
+        run_index = index_button and 'combined_keywords' in st.session_state
+        run_score = score_button and 'combined_keywords' in st.session_state
+        if (index_button and not run_index) or (score_button and not run_score):
+            st.error("키워드 통합을 먼저 완료해주세요.")
         
-        if execute_button and edited_query.strip():  # 쿼리가 비어있지 않은 경우에만 실행
+        if run_query or run_index or run_score:
             # filtering_id가 없는 경우 새로 생성
             if "filtering_id" not in st.session_state:
                 filtering_id = save_filtering_history(
@@ -527,30 +645,116 @@ order는 키워드가 많이 일치하는 순서, 연봉수준이 비슷한것 
                 )
                 st.session_state.filtering_id = filtering_id
             
-            # 수정된 쿼리로 실행 및 결과 저장
-            results = execute_query_and_save_results(
-                query=edited_query,
-                filtering_id=st.session_state.filtering_id,
-                position_id=st.session_state.selected_position_id
-            )
+            if run_query:
+                # 수정된 쿼리로 실행 및 결과 저장 (스트리밍 시 미리보기만 반환)
+                if stream_results:
+                    execute = stream_query_and_save_results
+                elif incremental_results:
+                    execute = execute_incremental_query_and_save_results
+                else:
+                    execute = execute_query_and_save_results
+                try:
+                    results = execute(
+                        query=edited_query,
+                        filtering_id=st.session_state.filtering_id,
+                        position_id=st.session_state.selected_position_id
+                    )
+                    st.session_state.executed_query = edited_query
+                except QueryBudgetExceeded as e:
+                    # 예산 초과 쿼리는 실행하지 않고 실행 계획만 표시
+                    results = None
+                    st.error(str(e))
+                    show_query_plan(e.plan)
+                except ValueError as e:
+                    # SELECT 한 문장이 아닌 쿼리는 EXPLAIN 전에 거부
+                    results = None
+                    st.error(str(e))
+            elif run_score:
+                # 열 단위 캐시에서 키워드 일치 개수/연봉 근접도/최근 로그인 순으로 순위 계산
+                engine = get_scoring_engine()
+                ranked = engine.rank(
+                    parse_keywords(st.session_state.combined_keywords['keywords']),
+                    job_description=st.session_state.get('job_description', ''),
+                    limit=DEFAULT_LIMIT
+                )
+                results = save_ranked_candidates(
+                    ranked,
+                    filtering_id=st.session_state.filtering_id,
+                    position_id=st.session_state.selected_position_id
+                )
+                st.caption(f"후보자 {len(engine)}명 점수 계산: {engine.last_rank_ms:.0f}ms")
+            else:
+                # 메모리 색인에서 키워드 일치 개수 순으로 검색
+                index = get_candidate_index()
+                ranked = index.search(
+                    parse_keywords(st.session_state.combined_keywords['keywords']),
+                    limit=DEFAULT_LIMIT
+                )
+                results = save_ranked_candidates(
+                    ranked,
+                    filtering_id=st.session_state.filtering_id,
+                    position_id=st.session_state.selected_position_id
+                )
             
-            # 세션에 필터링 결과와 관련 정보 저장
-            st.session_state.filtering_results = results
-            st.session_state.executed_query = edited_query
-            st.session_state.last_executed_position_id = st.session_state.selected_position_id
-            st.session_state.current_filtering_id = st.session_state.filtering_id
+            if results is not None:
+                # 세션에 필터링 결과와 관련 정보 저장
+                st.session_state.filtering_results = results
+                st.session_state.last_executed_position_id = st.session_state.selected_position_id
+                st.session_state.current_filtering_id = st.session_state.filtering_id
+                st.session_state.pop('result_page_data', None)  # 이전 실행에서 조회한 페이지는 버림
             
-            # 결과 표시
-            st.success(f"쿼리 실행 완료! {len(results)}개의 결과가 있습니다.")
+                # 결과 표시
+                total_count = results.attrs.get('total_count', len(results))
+                st.session_state.streamed_total_count = total_count if 'total_count' in results.attrs else None
+                st.success(f"쿼리 실행 완료! {total_count}개의 결과가 있습니다.")
+                if total_count > len(results):
+                    st.caption(f"미리보기로 상위 {len(results)}개만 표시합니다. 나머지는 아래 '전체 결과 페이지'에서 확인하세요.")
+                if results.attrs.get('incremental_since'):
+                    st.caption(
+                        f"{results.attrs['incremental_since']:%Y-%m-%d %H:%M} 이후 변경된 후보자만 평가하여 "
+                        f"기존 추출 목록과 합친 순위입니다."
+                    )
+                save_result = results.attrs.get('save_result')
+                if save_result:
+                    st.caption(
+                        f"후보자 저장: 신규 {save_result['inserted']}명 / "
+                        f"갱신 {save_result['updated']}명 / 중복 {save_result['duplicates']}건"
+                    )
             
-            # 결과 데이터프레임 표시
-            with st.expander("실행 결과", expanded=True):
-                st.dataframe(results)
+                query_plan = results.attrs.get('query_plan')
+                if query_plan:
+                    with st.expander("실행 계획"):
+                        show_query_plan(query_plan)
+                
+                # 결과 데이터프레임 표시
+                with st.expander("실행 결과", expanded=True):
+                    st.dataframe(results)
                 
-                # 통계 정보 표시
-                if 'keyword_match_count' in results.columns:
-                    st.subheader("키워드 매칭 통계")
-                    st.write(results['keyword_match_count'].describe())
+                    # 통계 정보 표시
+                    if 'keyword_match_count' in results.columns:
+                        st.subheader("키워드 매칭 통계")
+                        st.write(results['keyword_match_count'].describe())
+    
+    # 스트리밍 실행 결과는 필요한 페이지만 다시 조회
+    streamed_total = st.session_state.get('streamed_total_count')
+    streamed_results = st.session_state.get('filtering_results', pd.DataFrame())
+    page_size = streamed_results.attrs.get('page_size')
+    paged_query = streamed_results.attrs.get('guarded_query')
+    if streamed_total and page_size and streamed_total > page_size and paged_query:
+        with st.expander("전체 결과 페이지"):
+            page_count = (streamed_total + page_size - 1) // page_size
+            page = st.number_input("페이지", min_value=1, max_value=page_count, value=1, key="result_page")
+            # expander는 접혀 있어도 rerun마다 실행되므로 버튼을 눌렀을 때만 조회하고 결과는 세션에 유지
+            if st.button("페이지 조회", key="fetch_result_page"):
+                st.session_state.result_page_data = {
+                    'query': paged_query,
+                    'page': page,
+                    'rows': fetch_query_page(paged_query, page - 1, page_size)
+                }
+            page_data = st.session_state.get('result_page_data')
+            if page_data and page_data['query'] == paged_query:
+                st.dataframe(page_data['rows'])
+                st.caption(f"{page_data['page']} / {page_count} 페이지 (페이지당 {page_size}개)")
     
     # 다음 단계로 이동하는 버튼을 쿼리 실행 결과와 독립적으로 배치
     st.markdown("---")
@@ -574,7 +778,8 @@ order는 키워드가 많이 일치하는 순서, 연봉수준이 비슷한것 
         keys_to_clear = [
             'extracted_keywords', 'refined_keywords', 'combined_keywords', 
             'sql_query', 'filtering_results', 'executed_query', 'filtering_id',
-            'current_filtering_id', 'last_executed_position_id'
+            'current_filtering_id', 'last_executed_position_id', 'streamed_total_count',
+            'result_page', 'result_page_data'
         ]
         for key in keys_to_clear:
             if key in st.session_state:
@@ -3,61 +3,76 @@ import asyncio
 import random
 from ..utils.auth_helper import require_auth
 from ..utils.database import (
-    get_db_connection,
-    save_scout_history
+    get_candidate_states,
+    mark_scout_sent
 )
-from psycopg2.extras import RealDictCursor
-import time
+from ..utils import async_database
+from ..utils.rate_limiter import HostRateLimiter
+from ..services.job_service import submit_scout_send_job
+from ..services.send_outbox import ScoutSendOutbox
+from ..services.campaign_service import (
+    DEFAULT_MAX_ATTEMPTS,
+    start_campaign,
+    run_campaign,
+    load_campaign_for_resume,
+    list_resumable_campaigns
+)
+from .job_progress import show_job_progress
 
 class PlaywrightService:
     def __init__(self):
         self.progress_callback = None
         self.error_callback = None
         self.failed_candidates = []  # 실패한 후보자 목록
+        self.rate_limiter = None
+        self.candidate_states = None  # {saramin_key: 매핑 정보}, 발송 캠페인 단위로 일괄 조회
+        self.outbox = None  # 발송 결과 일괄 저장 (process_candidates 실행 중에만 사용)
+        self.campaign_id = None  # 마지막으로 실행한 발송 캠페인
+        self.outbox_summary = None
 
     async def send_scout_message(self, candidate: dict, message: dict) -> bool:
         """단일 후보자에게 스카우트 메시지 발송 (가상)"""
+        bucket = self.rate_limiter.bucket(candidate.get('page_url')) if self.rate_limiter else None
         try:
+            if bucket:
+                await bucket.acquire()
+            
+            # 발송 전에 미리 조회한 매핑 확인 (후보자별 조회 없음)
+            if self.candidate_states is not None:
+                state = self.candidate_states.get(candidate['saramin_key'])
+                if not state:
+                    raise Exception("Mapping not found")
+                if state['scout_status'] == 'sent':
+                    # 이미 발송된 후보자는 중복 발송하지 않고 캠페인 기록만 남김
+                    if self.outbox is not None:
+                        self.outbox.put_checkpoint(candidate['saramin_key'])
+                    return True
+            
             # 랜덤하게 성공/실패 결정 (80% 성공률)
             success = random.random() > 0.2
             
             if success:
-                # 발송 성공 시 상태 업데이트
-                with get_db_connection() as conn:
-                    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                        # position_candidate 테이블에서 mapping_id 조회
-                        cur.execute("""
-                            SELECT id as mapping_id
-                            FROM scraping_saramin_position_candidate
-                            WHERE position_id = %s AND saramin_key = %s
-                        """, (st.session_state.selected_position_id, candidate['saramin_key']))
-                        
-                        result = cur.fetchone()
-                        if not result:
-                            raise Exception("Mapping not found")
-                        
-                        mapping_id = result['mapping_id']
-                        
-                        # 상태 업데이트
-                        cur.execute("""
-                            UPDATE scraping_saramin_position_candidate
-                            SET scout_status = 'sent',
-                                last_checked_at = NOW()
-                            WHERE id = %s
-                        """, (mapping_id,))
-                        
-                        # scout_history에 기록 추가
-                        cur.execute("""
-                            INSERT INTO scout_history 
-                            (candidate_filter_id, message_id, status)
-                            VALUES (%s, %s, 'sent')
-                        """, (mapping_id, message['id']))
-                        
-                        conn.commit()
+                # 발송 성공 시 상태 업데이트 및 발송 이력 저장 (outbox가 모아서 일괄 저장)
+                if self.outbox is not None:
+                    self.outbox.put(
+                        st.session_state.selected_position_id,
+                        candidate['saramin_key'],
+                        message['id']
+                    )
+                else:
+                    await async_database.mark_scout_sent(
+                        st.session_state.selected_position_id,
+                        candidate['saramin_key'],
+                        message['id']
+                    )
                 
                 await asyncio.sleep(0.5)  # 가상의 딜레이
+                if bucket:
+                    bucket.on_success()
                 return True
             else:
+                if bucket:
+                    bucket.on_failure()
                 if self.error_callback:
                     self.error_callback(f"발송 실패 ({candidate.get('name_extraction') or candidate.get('name') or '이름 없음'}): 랜덤 실패")
                 self.failed_candidates.append(candidate)
@@ -65,28 +80,64 @@ class PlaywrightService:
                 return False
                 
         except Exception as e:
+            if bucket:
+                bucket.on_failure()
             if self.error_callback:
                 self.error_callback(f"발송 실패 ({candidate.get('name_extraction') or candidate.get('name') or '이름 없음'}): {str(e)}")
             self.failed_candidates.append(candidate)
             return False
 
-    async def process_candidates(self, candidates: list, message: dict):
-        """모든 후보자에게 순차적으로 메시지 발송"""
-        total = len(candidates)
-        success_count = 0
-        self.failed_candidates = []  # 실패 목록 초기화
+    async def process_candidates(self, candidates: list, message: dict, concurrency: int = None,
+                                 campaign_id: int = None, max_attempts: int = 1):
+        """후보자들에게 동시에 메시지 발송 (동시 발송 수 제한 + 호스트별 발송 속도 제한)
         
-        for idx, candidate in enumerate(candidates, 1):
-            if self.progress_callback:
-                self.progress_callback(idx, total)
-            
-            success = await self.send_scout_message(candidate, message)
-            if success:
-                success_count += 1
-            
-            await asyncio.sleep(0.2)  # 서버 부하 방지
+        후보자별 시도 결과는 캠페인 기록에 저장되어 중단되더라도 resume_campaign으로 이어서 발송할 수 있다.
+        """
+        if campaign_id is None:
+            campaign_id = await async_database.run_db(
+                start_campaign, st.session_state.selected_position_id, candidates, message
+            )
+        self.campaign_id = campaign_id
+        self.failed_candidates = []  # 실패 목록 초기화
+        self.rate_limiter = HostRateLimiter()
+        self.candidate_states = await async_database.get_candidate_states(
+            st.session_state.selected_position_id,
+            [candidate['saramin_key'] for candidate in candidates]
+        )
+        try:
+            # 발송과 DB 저장이 겹쳐 진행되도록 결과와 캠페인 체크포인트는 outbox로 보내고,
+            # run_campaign이 캠페인 종료 전에 outbox를 닫아 남은 결과를 저장
+            self.outbox = ScoutSendOutbox(campaign_id=campaign_id).start()
+            success_count, self.failed_candidates = await run_campaign(
+                campaign_id,
+                candidates,
+                lambda candidate: self.send_scout_message(candidate, message),
+                max_attempts=max_attempts,
+                concurrency=concurrency,
+                progress_callback=self.progress_callback,
+                outbox=self.outbox
+            )
+            return success_count
+        finally:
+            if self.outbox is not None:
+                self.outbox_summary = self.outbox.summary()
+            self.outbox = None
+            self.rate_limiter = None
+            self.candidate_states = None
+
+    async def resume_campaign(self, campaign_id: int, max_attempts: int = None):
+        """중단된 캠페인을 체크포인트부터 이어서 발송 (실패한 후보자는 백오프 후 재시도)
         
-        return success_count
+        반환값: (성공 건수, 이번에 시도한 후보자 수)
+        """
+        max_attempts = max_attempts or int(st.secrets.get("CAMPAIGN_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS))
+        campaign, candidates = await async_database.run_db(
+            load_campaign_for_resume, campaign_id, max_attempts
+        )
+        success_count = await self.process_candidates(
+            candidates, campaign['message'], campaign_id=campaign_id, max_attempts=max_attempts
+        )
+        return success_count, len(candidates)
 
 playwright_service = PlaywrightService()
 
@@ -105,21 +156,14 @@ def show_auto_scout_page():
         return
     
     # 발송 대상 필터링 (sent가 아닌 후보자만)
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            candidates_to_send = []
-            for candidate in st.session_state.selected_candidates:
-                cur.execute("""
-                    SELECT c.*, pc.scout_status
-                    FROM scraping_saramin_candidates c
-                    JOIN scraping_saramin_position_candidate pc 
-                        ON c.saramin_key = pc.saramin_key
-                    WHERE pc.position_id = %s 
-                    AND c.saramin_key = %s
-                """, (st.session_state.selected_position_id, candidate['saramin_key']))
-                result = cur.fetchone()
-                if result and result['scout_status'] != 'sent':
-                    candidates_to_send.append(result)  # 전체 정보를 포함한 결과 사용
+    states = get_candidate_states(
+        st.session_state.selected_position_id,
+        [candidate['saramin_key'] for candidate in st.session_state.selected_candidates]
+    )
+    candidates_to_send = [
+        states[key] for key in dict.fromkeys(c['saramin_key'] for c in st.session_state.selected_candidates)
+        if key in states and states[key]['scout_status'] != 'sent'
+    ]  # 선택 순서를 유지하고 전체 정보를 포함한 결과 사용
     
     if not candidates_to_send:
         st.info("모든 후보자에게 이미 발송되었습니다.")
@@ -176,13 +220,60 @@ def show_auto_send_ui(candidates: list, message: dict):
         st.session_state.success_count = 0
         st.session_state.failed_candidates = []
     
+    # 백그라운드 발송 (별도 워커 프로세스가 처리, 페이지를 떠나도 계속 진행)
+    if st.session_state.get('scout_job_batch_id'):
+        st.write("#### 백그라운드 발송 진행 상황")
+        show_job_progress('scout_job_batch_id')
+        return
+    
     if not st.session_state.sending:
+        if st.button(
+            "백그라운드 작업으로 발송",
+            use_container_width=True,
+            help="발송 작업을 큐에 등록하고 워커(python -m src.worker)가 처리합니다."
+        ):
+            st.session_state.scout_job_batch_id = submit_scout_send_job(
+                st.session_state.selected_position_id,
+                candidates,
+                message
+            )
+            st.rerun()
+        
         if st.button("자동 발송 시작", use_container_width=True):
             st.session_state.sending = True
             st.session_state.progress = 0
             st.session_state.success_count = 0
             st.session_state.failed_candidates = []
             st.rerun()
+        
+        # 중단되었거나 실패가 남은 캠페인은 체크포인트부터 이어서 발송
+        campaigns = list_resumable_campaigns(st.session_state.selected_position_id)
+        if campaigns:
+            with st.expander(f"이어서 발송할 수 있는 캠페인 ({len(campaigns)}개)"):
+                campaign_labels = {
+                    campaign['id']: (
+                        f"#{campaign['id']} ({campaign['created_at']:%m-%d %H:%M}) · "
+                        f"진행 {campaign['cursor_position']}/{campaign['total']} · "
+                        f"발송 {campaign['sent']} / 실패 {campaign['failed']} / 미시도 {campaign['pending']}"
+                    )
+                    for campaign in campaigns
+                }
+                selected_campaign = st.selectbox(
+                    "캠페인",
+                    options=list(campaign_labels),
+                    format_func=campaign_labels.get,
+                    key="resume_campaign_select"
+                )
+                last_error = next(c['last_error'] for c in campaigns if c['id'] == selected_campaign)
+                if last_error:
+                    st.caption(f"마지막 오류: {last_error}")
+                if st.button("캠페인 재개", use_container_width=True):
+                    st.session_state.resume_campaign_id = selected_campaign
+                    st.session_state.sending = True
+                    st.session_state.progress = 0
+                    st.session_state.success_count = 0
+                    st.session_state.failed_candidates = []
+                    st.rerun()
     
     if st.session_state.sending:
         progress_bar = st.progress(0)
@@ -204,75 +295,54 @@ def show_auto_send_ui(candidates: list, message: dict):
         playwright_service.error_callback = on_error
         
         if st.session_state.progress == 0:  # 아직 시작하지 않은 경우
-            total = len(candidates)
-            success_count = 0
-            
-            for idx, candidate in enumerate(candidates, 1):
-                update_progress(idx, total)
-                
-                # 가상의 발송 로직
-                success = random.random() > 0.2  # 80% 성공률
-                
-                if success:
-                    try:
-                        with get_db_connection() as conn:
-                            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                                # mapping_id 조회
-                                cur.execute("""
-                                    SELECT id as mapping_id
-                                    FROM scraping_saramin_position_candidate
-                                    WHERE position_id = %s AND saramin_key = %s
-                                """, (st.session_state.selected_position_id, candidate['saramin_key']))
-                                
-                                result = cur.fetchone()
-                                if not result:
-                                    raise Exception("Mapping not found")
-                                
-                                mapping_id = result['mapping_id']
-                                
-                                # 상태 업데이트
-                                cur.execute("""
-                                    UPDATE scraping_saramin_position_candidate
-                                    SET scout_status = 'sent',
-                                        last_checked_at = NOW()
-                                    WHERE id = %s
-                                """, (mapping_id,))
-                                
-                                # scout_history에 기록 추가
-                                cur.execute("""
-                                    INSERT INTO scout_history 
-                                    (candidate_filter_id, message_id, status)
-                                    VALUES (%s, %s, 'sent')
-                                """, (mapping_id, message['id']))
-                                
-                                conn.commit()
-                        success_count += 1
-                    except Exception as e:
-                        on_error(f"DB 업데이트 실패: {str(e)}")
-                        st.session_state.failed_candidates.append(candidate)
-                else:
-                    st.session_state.failed_candidates.append(candidate)
+            resume_campaign_id = st.session_state.pop('resume_campaign_id', None)
+            if resume_campaign_id:
+                # 체크포인트부터 이어서 발송 (실패한 후보자는 백오프 후 재시도)
+                success_count, total = asyncio.run(
+                    playwright_service.resume_campaign(resume_campaign_id)
+                )
+            else:
+                total = len(candidates)
                 
-                time.sleep(0.5)  # 가상의 딜레이
+                # 동시 발송 (발송 수/속도 제한은 서비스에서 처리)
+                success_count = asyncio.run(
+                    playwright_service.process_candidates(candidates, message)
+                )
+            st.session_state.scout_campaign_id = playwright_service.campaign_id
+            st.session_state.failed_candidates = playwright_service.failed_candidates
+            st.session_state.send_total = total
+            st.session_state.outbox_summary = playwright_service.outbox_summary
             
             st.session_state.success_count = success_count
             st.session_state.progress = 1.0
-            progress_bar.progress(1.0)
-            
-            # 결과 표시
-            st.success(f"발송 완료! {success_count}/{total} 성공")
-            
-            if st.session_state.failed_candidates:
-                st.warning(f"{len(st.session_state.failed_candidates)}명의 후보자에게 발송 실패")
-                if st.button("실패한 후보자 재시도", use_container_width=True):
-                    st.session_state.progress = 0
-                    st.rerun()
-            
-            if st.button("응답 관리로 이동", use_container_width=True):
-                st.session_state.current_page = "응답 관리"
-                st.session_state.sending = False
+        
+        # 결과 표시 (버튼을 눌러 다시 실행되어도 유지)
+        progress_bar.progress(1.0)
+        st.success(
+            f"발송 완료! {st.session_state.success_count}/"
+            f"{st.session_state.get('send_total', len(candidates))} 성공"
+        )
+        outbox_summary = st.session_state.get('outbox_summary')
+        if outbox_summary:
+            st.caption(
+                f"발송 결과 저장: {outbox_summary['flushed']}건 "
+                f"({outbox_summary['batches']}회 일괄 저장)"
+            )
+            if outbox_summary['missing']:
+                st.warning(f"{outbox_summary['missing']}건은 후보자 매핑이 없어 저장되지 않았습니다.")
+        
+        if st.session_state.failed_candidates:
+            st.warning(f"{len(st.session_state.failed_candidates)}명의 후보자에게 발송 실패")
+            if st.button("실패한 후보자 재시도", use_container_width=True):
+                # 같은 캠페인에서 실패한 후보자만 백오프 후 재시도
+                st.session_state.resume_campaign_id = st.session_state.scout_campaign_id
+                st.session_state.progress = 0
                 st.rerun()
-            
+        
+        if st.button("응답 관리로 이동", use_container_width=True):
+            st.session_state.current_page = "응답 관리"
+            st.session_state.sending = False
+            st.rerun()
 
 def show_manual_send_ui(candidates: list, message: dict):
     """수동 발송 UI"""
@@ -315,38 +385,12 @@ def show_manual_send_ui(candidates: list, message: dict):
             with col3:
                 if st.button("발송 완료", key=f"manual_send_{candidate['saramin_key']}"):
                     try:
-                        with get_db_connection() as conn:
-                            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                                # mapping_id 조회
-                                cur.execute("""
-                                    SELECT id as mapping_id
-                                    FROM scraping_saramin_position_candidate
-                                    WHERE position_id = %s AND saramin_key = %s
-                                """, (st.session_state.selected_position_id, candidate['saramin_key']))
-                                
-                                result = cur.fetchone()
-                                if not result:
-                                    raise Exception("Mapping not found")
-                                
-                                mapping_id = result['mapping_id']
-                                
-                                # 상태 업데이트
-                                cur.execute("""
-                                    UPDATE scraping_saramin_position_candidate
-                                    SET scout_status = 'sent',
-                                        last_checked_at = NOW()
-                                    WHERE id = %s
-                                """, (mapping_id,))
-                                
-                                # scout_history에 기록 추가
-                                cur.execute("""
-                                    INSERT INTO scout_history 
-                                    (candidate_filter_id, message_id, status)
-                                    VALUES (%s, %s, 'sent')
-                                """, (mapping_id, message['id']))
-                                
-                                conn.commit()
-                                
+                        mark_scout_sent(
+                            st.session_state.selected_position_id,
+                            candidate['saramin_key'],
+                            message['id']
+                        )
+                        
                         st.success(f"{name}님에게 발송 완료")
                         st.rerun()
                         
@@ -0,0 +1,42 @@
+import streamlit as st
+from src.utils.database import get_job_batch_progress, cancel_job_batch
+
+def show_job_progress(session_key: str):
+    """백그라운드 작업 진행률 표시 (세션에는 batch_id만 보관하고 DB에서 진행 상황 조회)"""
+    batch_id = st.session_state.get(session_key)
+    if not batch_id:
+        return None
+
+    progress = get_job_batch_progress(batch_id)
+    if not progress or not progress['jobs']:
+        st.warning("작업 정보를 찾을 수 없습니다.")
+        del st.session_state[session_key]
+        return None
+
+    total = progress['total'] or 0
+    processed = progress['processed'] or 0
+    st.progress(processed / total if total else 1.0)
+    st.text(
+        f"처리 {processed}/{total} · 성공 {progress['succeeded']} · 실패 {progress['failed']} "
+        f"(대기 {progress['queued']} / 실행 중 {progress['running']} / 종료 {progress['finished']} 작업)"
+    )
+    if progress['last_error']:
+        st.caption(f"최근 오류: {progress['last_error']}")
+
+    done = progress['finished'] == progress['jobs']
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("진행 상황 새로고침", key=f"{session_key}_refresh", use_container_width=True):
+            st.rerun()
+    with col2:
+        if not done and st.button("작업 취소", key=f"{session_key}_cancel", use_container_width=True):
+            cancel_job_batch(batch_id)
+            st.rerun()
+    with col3:
+        if done and st.button("작업 닫기", key=f"{session_key}_close", use_container_width=True):
+            del st.session_state[session_key]
+            st.rerun()
+
+    if done:
+        st.success(f"백그라운드 작업 종료: {progress['succeeded']}/{total} 성공")
+    return progress
@@ -1,6 +1,9 @@
 import streamlit as st
 from src.utils.auth_helper import require_auth
-from src.utils.database import get_pending_tasks_count, get_recent_tasks
+from src.utils.database import get_pool_stats, get_read_cache_stats
+from src.utils.playwright_helper import get_request_profile_stats
+from src.services.monitoring_service import get_task_monitor
+import pandas as pd
 import time
 
 @require_auth
@@ -26,39 +29,128 @@ def show_monitoring_page():
             st.rerun()
     
     with col1:
-        # 남은 작업 수 표시
-        pending_count = get_pending_tasks_count()
-        st.metric(
-            label="남은 작업 수", 
-            value=pending_count,
-            delta=-1 if pending_count > 0 else None
-        )
-        
-        # 진행률 표시
-        if "initial_count" not in st.session_state:
-            st.session_state.initial_count = pending_count
+        # 작업 현황 영역만 주기적으로 다시 그림 (페이지 전체 rerun 없음)
+        @st.fragment(run_every=st.session_state.refresh_interval)
+        def show_task_status():
+            # 공유 모니터의 최신 현황 사용 (화면 수와 관계없이 DB 조회는 폴링 주기당 1회)
+            snapshot = get_task_monitor().snapshot()
+            if snapshot['error']:
+                st.error(f"작업 현황 조회 실패: {snapshot['error']}")
+            if snapshot['pending_count'] is None:
+                st.info("작업 현황을 불러오는 중입니다...")
+                return
+            
+            # 남은 작업 수 표시
+            pending_count = snapshot['pending_count']
+            is_estimate = snapshot['count_mode'] == 'estimate'
+            st.metric(
+                label="남은 작업 수 (추정치)" if is_estimate else "남은 작업 수", 
+                value=f"~{pending_count:,}" if is_estimate else pending_count,
+                delta=-1 if pending_count > 0 else None
+            )
+            st.caption(
+                "조회 방식: 통계 기반 추정 (pg_class)" if is_estimate 
+                else "조회 방식: 정확한 집계 (COUNT)"
+            )
+            
+            # 처리 속도 / 예상 완료 시간
+            metrics = snapshot['metrics']
+            mcol1, mcol2 = st.columns(2)
+            with mcol1:
+                throughput = metrics['throughput_per_min']
+                st.metric("처리 속도", f"{throughput:.1f}건/분" if throughput is not None else "-")
+            with mcol2:
+                eta = metrics['eta_seconds']
+                st.metric("예상 완료", f"{eta/60:.0f}분 후" if eta is not None else "-")
+            if metrics['stalled']:
+                st.warning("최근 5분 동안 처리된 작업이 없습니다. 스크래핑 워커 상태를 확인해주세요.")
+            
+            # 진행률 표시 (서버에 기록된 최대 작업 수 기준, 세션이 바뀌어도 유지)
+            peak_pending = metrics['peak_pending']
+            if peak_pending:
+                progress = max(0.0, 1 - (pending_count / peak_pending))
+                st.progress(progress)
+                st.text(f"진행률: {progress*100:.1f}%")
+            
+            # 추이 차트
+            history = pd.DataFrame(snapshot['history'])
+            if len(history) > 1:
+                history['time'] = pd.to_datetime(history['timestamp'], unit='s')
+                history = history.set_index('time')
+                st.line_chart(history[['pending_count']].rename(columns={'pending_count': '남은 작업 수'}))
+                throughput_series = history['completed'].resample('1min').sum()
+                st.bar_chart(throughput_series.rename('분당 처리 건수'))
+            
+            # 최근 작업 목록
+            st.subheader("최근 작업 목록")
+            recent_tasks = snapshot['recent_tasks']
+            if recent_tasks:
+                task_df = pd.DataFrame(recent_tasks)
+                st.dataframe(
+                    task_df,
+                    use_container_width=True,
+                    hide_index=True
+                )
+            else:
+                st.info("현재 진행 중인 작업이 없습니다.")
+            
+            st.caption(f"마지막 갱신: {time.strftime('%H:%M:%S', time.localtime(snapshot['updated_at']))}")
         
-        if st.session_state.initial_count > 0:
-            progress = 1 - (pending_count / st.session_state.initial_count)
-            st.progress(progress)
-            st.text(f"진행률: {progress*100:.1f}%")
+        show_task_status()
     
-    # 최근 작업 목록
-    st.subheader("최근 작업 목록")
-    recent_tasks = get_recent_tasks()
-    if recent_tasks:
-        task_df = pd.DataFrame(recent_tasks)
-        st.dataframe(
-            task_df,
-            use_container_width=True,
-            hide_index=True
+    # DB 커넥션 풀 상태
+    with st.expander("DB 커넥션 풀 상태"):
+        pool_stats = get_pool_stats()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("사용 중", f"{pool_stats['in_use']}/{pool_stats['max_size']}")
+        with col2:
+            st.metric("생성된 연결", pool_stats['created'])
+        with col3:
+            st.metric("평균 대기(ms)", f"{pool_stats['wait_time_avg']*1000:.1f}")
+        with col4:
+            st.metric("최대 대기(ms)", f"{pool_stats['wait_time_max']*1000:.1f}")
+        prepared = pool_stats['prepared_statements']
+        st.caption(
+            f"Prepared statement: PREPARE {prepared['prepares']}회 / "
+            f"EXECUTE {prepared['executions']}회 (연결 {prepared['connections']}개)"
         )
-    else:
-        st.info("현재 진행 중인 작업이 없습니다.")
     
-    # 자동 새로고침
-    time.sleep(st.session_state.refresh_interval)
-    st.rerun()
+    # 브라우저 요청 프로필 (차단한 요청과 절감량 추정)
+    with st.expander("브라우저 요청 프로필"):
+        profile_stats = get_request_profile_stats()
+        if any(stats['requests'] or stats['navigations'] for stats in profile_stats.values()):
+            st.dataframe(
+                pd.DataFrame([
+                    {'프로필': name, '요청': stats['requests'], '차단': stats['blocked'],
+                     '받은 용량(KB)': stats['bytes_loaded'] // 1024,
+                     '절감 추정(KB)': stats['bytes_saved_estimate'] // 1024,
+                     '평균 이동(ms)': f"{stats['navigation_time_avg']*1000:.0f}",
+                     '절감 시간 추정(s)': f"{stats['time_saved_estimate']:.1f}"}
+                    for name, stats in profile_stats.items()
+                ]),
+                use_container_width=True,
+                hide_index=True
+            )
+            st.caption("절감 시간은 'full' 프로필의 평균 이동 시간과 비교한 추정치입니다.")
+        else:
+            st.info("아직 이 프로세스에서 실행된 브라우저 작업이 없습니다.")
+    
+    # 조회 캐시 적중률
+    with st.expander("조회 캐시 적중률"):
+        cache_stats = get_read_cache_stats()
+        if cache_stats:
+            st.dataframe(
+                pd.DataFrame([
+                    {'함수': name, '적중': stats['hits'], '미스': stats['misses'],
+                     '적중률': f"{stats['hit_ratio']*100:.1f}%"}
+                    for name, stats in cache_stats.items()
+                ]),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("아직 캐시된 조회가 없습니다.")
     
     # 도움말
     with st.expander("도움말"):
@@ -66,10 +158,12 @@ def show_monitoring_page():
         ### 모니터링 페이지 사용법
         
         1. **남은 작업 수**: temp_scraping_1 테이블에 남아있는 작업의 수를 표시합니다.
-        2. **진행률**: 전체 작업 대비 완료된 작업의 비율을 표시합니다.
-        3. **최근 작업 목록**: 가장 최근에 추가된 작업들을 보여줍니다.
+        2. **진행률**: 기록된 최대 작업 수 대비 완료된 작업의 비율을 표시합니다.
+        3. **처리 속도/예상 완료**: 최근 5분간 분당 처리 건수와 남은 작업의 예상 완료 시간을 표시합니다.
+        4. **최근 작업 목록**: 가장 최근에 추가된 작업들을 보여줍니다.
         
         ### 새로고침 설정
         - 슬라이더를 사용하여 자동 새로고침 간격을 조정할 수 있습니다.
+        - 작업 현황은 서버에서 한 번만 조회하여 모든 화면이 공유합니다.
         - '수동 새로고침' 버튼을 클릭하여 즉시 데이터를 갱신할 수 있습니다.
         """)
@@ -11,114 +11,91 @@ from src.utils.database import (
     update_candidate_contact,
     get_db_connection
 )
+from src.utils import async_database
 from src.services.playwright_service import PlaywrightService
-from playwright.async_api import async_playwright
+from src.services.scout_service import (
+    check_and_collect_candidate,
+    harvest_response_statuses,
+    ContactHarvester
+)
+from src.services.job_service import submit_response_sweep_job
+from src.utils.playwright_helper import BrowserPool
+from src.views.job_progress import show_job_progress
 from typing import List, Dict
 from psycopg2.extras import RealDictCursor
 
 playwright_service = PlaywrightService()
 
-async def check_candidate_status(url: str, candidate: dict) -> str:
-    """후보자의 응답 상태 확인 및 업데이트"""
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            await page.goto(url)
-            
-            # 상태 확인 로직...
-            status = await get_status_from_page(page)
-            
-            # 상태 매핑
-            status_map = {
-                "수락": "accepted",
-                "거절": "rejected",
-                "미응답": "no_response_rejected"
-            }
-            new_status = status_map.get(status.strip(), "no_response_rejected")
-            
-            # DB 상태 업데이트
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE scraping_saramin_position_candidate
-                        SET scout_status = %s::scout_status,
-                            last_checked_at = NOW()
-                        WHERE id = %s
-                    """, (new_status, candidate['mapping_id']))
-                    conn.commit()
-            
-            return new_status
-            
-    except Exception as e:
-        st.error(f"상태 확인 중 오류 발생: {str(e)}")
-        return "no_response_rejected"
-
-async def collect_contact_info(page_url: str) -> dict:
-    """수락한 후보자의 연락처 정보 수집"""
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
-            await page.goto(page_url)
-            
-            # 연락처 정보 추출
-            name = await page.locator(".candidate_name").text_content()
-            contact = await page.locator(".contact_info").text_content()
-            
-            await browser.close()
-            
-            return {
-                "name": name.strip(),
-                "contact": contact.strip()
-            }
-            
-    except Exception as e:
-        st.error(f"연락처 수집 중 오류 발생: {str(e)}")
-        return None
-
 async def update_candidate_statuses(position_details: dict, candidates: list):
     """모든 후보자의 상태 업데이트"""
     total = len(candidates)
     progress_bar = st.progress(0)
     status_text = st.empty()
     
-    for idx, candidate in enumerate(candidates, 1):
-        progress = idx / total
-        progress_bar.progress(progress)
-        status_text.text(f"진행 중... ({idx}/{total})")
-        
-        try:
-            # 상태 확인
-            status = await check_candidate_status(
-                position_details['scout_url'],
-                candidate
-            )
-            
-            # 상태 업데이트
-            update_candidate_status(
-                candidate['mapping_id'],
-                status
-            )
+    # 전체 확인 작업 동안 브라우저 하나를 띄워두고 페이지를 재사용
+    async with BrowserPool() as pool:
+        # 수락한 후보자의 연락처는 상태 확인과 별도로 남는 페이지에서 동시에 수집
+        async with ContactHarvester(pool) as harvester:
+            for idx, candidate in enumerate(candidates, 1):
+                progress = idx / total
+                progress_bar.progress(progress)
+                status_text.text(f"진행 중... ({idx}/{total})")
+                
+                try:
+                    # 상태 확인 (수락한 경우 연락처 수집 큐에 추가)
+                    await check_and_collect_candidate(
+                        position_details['scout_url'],
+                        candidate,
+                        pool,
+                        harvester
+                    )
+                
+                except Exception as e:
+                    st.error(f"오류 발생 ({candidate['name']}): {str(e)}")
             
-            # 수락한 경우 추가 정보 수집
+            if harvester.queued:
+                status_text.text(f"연락처 수집 마무리 중... ({harvester.queued}명)")
+    
+    status_text.empty()
+    return True
+
+async def harvest_candidate_statuses(position_details: dict, candidates: list) -> dict:
+    """응답 목록 페이지를 한 번만 읽어 전체 후보자 상태를 일괄 업데이트"""
+    status_text = st.empty()
+    
+    async with BrowserPool() as pool:
+        status_text.text("응답 목록 수집 중...")
+        statuses = await harvest_response_statuses(position_details['scout_url'], pool)
+        
+        # 목록에 있는 후보자 중 상태가 바뀐 경우만 반영
+        updates = []
+        newly_accepted = []
+        for candidate in candidates:
+            status = statuses.get(candidate['saramin_key'])
+            if status is None or status == candidate['scout_status']:
+                continue
+            updates.append((candidate['mapping_id'], status))
             if status == 'accepted':
-                contact_info = await collect_contact_info(
-                    candidate['page_url']
-                )
-                if contact_info:
-                    update_candidate_contact(
-                        candidate['saramin_key'],
-                        contact_info['name'],
-                        contact_info['contact']
-                    )
+                newly_accepted.append(candidate)
+        
+        status_text.text(f"상태 변경 {len(updates)}건 저장 중...")
+        updated = await async_database.bulk_update_candidate_statuses(updates)
+        
+        # 수락한 경우 추가 정보 수집 (풀의 페이지 수만큼 동시에 수집 후 일괄 저장)
+        def on_contact_progress(done, queued):
+            status_text.text(f"연락처 수집 중... ({done}/{queued})")
         
-        except Exception as e:
-            st.error(f"오류 발생 ({candidate['name']}): {str(e)}")
+        async with ContactHarvester(pool, progress_callback=on_contact_progress) as harvester:
+            for candidate in newly_accepted:
+                harvester.put(candidate)
     
-    return True
+    status_text.empty()
+    return {
+        'found': len(statuses),
+        'updated': updated,
+        'accepted': len(newly_accepted),
+        'contacts': harvester.saved
+    }
 
 @require_auth
 def show_response_page():
@@ -173,6 +150,24 @@ def show_auto_update_ui(position_id: int, position_details: dict):
                 st.success("URL이 저장되었습니다.")
                 st.rerun()
     
+    # 백그라운드 응답 확인 진행 상황
+    if st.session_state.get('response_job_batch_id'):
+        st.write("#### 백그라운드 응답 확인 진행 상황")
+        show_job_progress('response_job_batch_id')
+    elif st.button("백그라운드 작업으로 응답 확인", use_container_width=True):
+        if not position_details.get('scout_url'):
+            st.error("먼저 URL을 입력해주세요.")
+            return
+        st.session_state.response_job_batch_id = submit_response_sweep_job(position_id)
+        st.rerun()
+    
+    update_mode = st.radio(
+        "확인 방식",
+        options=["응답 목록 일괄 수집", "후보자별 확인"],
+        horizontal=True,
+        help="일괄 수집은 응답 목록 페이지를 한 번만 읽어 전체 후보자 상태를 갱신합니다."
+    )
+    
     # 상태 업데이트 시작
     if st.button("응답 상태 업데이트", use_container_width=True):
         if not position_details.get('scout_url'):
@@ -184,7 +179,14 @@ def show_auto_update_ui(position_id: int, position_details: dict):
             candidates = get_position_candidates(position_id)
             
             # 비동기 업데이트 실행
-            asyncio.run(update_candidate_statuses(position_details, candidates))
+            if update_mode == "응답 목록 일괄 수집":
+                result = asyncio.run(harvest_candidate_statuses(position_details, candidates))
+                st.info(
+                    f"응답 목록 {result['found']}명 확인 · 상태 변경 {result['updated']}명 · "
+                    f"신규 수락 {result['accepted']}명 · 연락처 저장 {result['contacts']}명"
+                )
+            else:
+                asyncio.run(update_candidate_statuses(position_details, candidates))
             
             st.success("상태 업데이트가 완료되었습니다.")
 
@@ -0,0 +1,38 @@
+"""스카우트 발송 / 응답 확인 백그라운드 워커
+
+Streamlit 앱과 별도 프로세스로 실행하며, 여러 개를 동시에 띄워 큐를 나눠 처리할 수 있다.
+
+    python -m src.worker
+"""
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.database import ensure_job_queue_table, dequeue_job
+from src.services.job_service import run_job
+
+POLL_INTERVAL = 2  # 초, 큐가 비었을 때 대기 시간
+
+def main():
+    worker_id = f"{socket.gethostname()}-{os.getpid()}"
+    ensure_job_queue_table()
+    print(f"[{worker_id}] 워커 시작")
+
+    while True:
+        job = dequeue_job(worker_id)
+        if job is None:
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        print(f"[{worker_id}] 작업 #{job['id']} ({job['job_type']}) 시작 - {job['cursor_position']}/{job['total']}")
+        run_job(job)
+        print(f"[{worker_id}] 작업 #{job['id']} 종료")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from src.services.background_refresh import PeriodicRefresher
+from src.services.candidate_index import CandidateSearchIndex, _ngrams
+
+T1 = datetime(2024, 1, 1, 9)
+T2 = datetime(2024, 1, 2, 9)
+
+def _index(batches) -> CandidateSearchIndex:
+    """_fetch가 호출될 때마다 batches를 차례로 돌려주는 색인 (since 인자는 fetches에 기록)"""
+    index = CandidateSearchIndex()
+    index.fetches = []
+    batches = list(batches)
+
+    def fetch(since=None):
+        index.fetches.append(since)
+        return batches.pop(0)
+
+    index._fetch = fetch
+    return index
+
+def test_ngrams():
+    assert _ngrams('파이썬') == {'파이', '이썬'}
+    assert _ngrams('c') == {'c'}
+    assert _ngrams('') == set()
+
+def test_search_matches_substrings_case_insensitively():
+    """bigram 교집합으로 좁힌 뒤 원문에 부분 문자열이 있는 후보자만 일치로 판정"""
+    index = _index([[
+        ('a', T1, 'python, django'),
+        ('b', T1, '파이썬 백엔드'),
+        ('c', T1, '파이프라인 이썬'),  # bigram은 모두 있지만 '파이썬'은 없음
+        ('d', T1, 'c++, go'),
+    ]])
+    index.refresh()
+
+    assert index.search(['Python']) == [('a', 1)]
+    assert index.search(['파이썬']) == [('b', 1)]
+    assert sorted(index.search(['G'])) == [('a', 1), ('d', 1)]  # 한 글자는 원문 전체에서 확인
+    assert index.search(['DJANGO', 'python', '백엔드'], min_match=2) == [('a', 2)]
+    assert index.search(['java']) == []
+
+def test_refresh_reindexes_changed_rows_after_watermark():
+    """증분 갱신은 마지막 update_dt 이후만 조회하고, 바뀐 후보자는 이전 n-gram을 지운 뒤 다시 색인"""
+    index = _index([
+        [('a', T1, 'python'), ('b', None, 'java')],
+        [('a', T2, 'golang'), ('c', T2, 'python')],
+    ])
+    index.refresh()
+    assert index.search(['python']) == [('a', 1)]
+
+    assert index.refresh() == 2
+
+    assert index.fetches == [None, T1]
+    assert index.stats()['watermark'] == T2
+    assert index.search(['python']) == [('c', 1)]
+    assert index.search(['golang']) == [('a', 1)]
+    assert index.search(['java']) == [('b', 1)]
+    assert len(index) == 3
+
+def test_periodic_refresher_rebuilds_when_due():
+    index = _index([
+        [('a', T1, 'python')],
+        [('b', T2, 'python')],
+        [('a', T1, 'python')],
+    ])
+    refresher = PeriodicRefresher(index, 'test', refresh_interval=60, rebuild_interval=3600)
+
+    refresher.run_once()  # 아직 전체 색인 전이면 전체 재색인
+    refresher.run_once()
+    assert index.fetches == [None, T1]
+
+    index.last_rebuilt_at -= 3600
+    refresher.run_once()
+    assert index.fetches == [None, T1, None]
+    assert index.search(['python']) == [('a', 1)]  # 재색인 시 삭제된 b가 빠짐
@@ -0,0 +1,96 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from src.utils import database
+
+LIKE_QUERY = """
+    SELECT saramin_key
+    FROM scraping_saramin_candidates
+    WHERE regex_my_skills LIKE '%파이썬%'
+    ORDER BY saramin_key;
+"""
+
+class _FakeConnection:
+    def rollback(self):
+        pass
+
+def test_fetch_query_page_with_like_pattern(monkeypatch):
+    """LIKE '%...%'가 들어 있는 필터링 SQL도 페이지 조회가 가능해야 함"""
+    executed = []
+
+    @contextmanager
+    def fake_connection():
+        yield _FakeConnection()
+
+    def fake_read_sql(sql, conn, params=None):
+        # psycopg2는 params가 있을 때만 SQL 전체를 % 포맷하므로 같은 방식으로 재현
+        executed.append(sql % tuple(params) if params is not None else sql)
+        return pd.DataFrame({'saramin_key': ['k1']})
+
+    monkeypatch.setattr(database, 'get_db_connection', fake_connection)
+    monkeypatch.setattr(database, '_begin_guarded_read', lambda conn: None)
+    monkeypatch.setattr(database.pd, 'read_sql', fake_read_sql)
+
+    df = database.fetch_query_page(LIKE_QUERY, page=2, page_size=20)
+
+    assert df['saramin_key'].tolist() == ['k1']
+    assert "LIKE '%파이썬%'" in executed[0]
+    assert executed[0].endswith("LIMIT 20 OFFSET 40")
+
+def test_guard_query_rejects_multiple_statements(monkeypatch):
+    """세미콜론으로 이어 붙인 COMMIT/DELETE는 EXPLAIN 전에 거부해야 함"""
+    def fail_connection():
+        raise AssertionError("검증 전에 DB에 연결하면 안 됨")
+
+    monkeypatch.setattr(database, 'get_db_connection', fail_connection)
+
+    for query in (
+        "SELECT 1; COMMIT; DELETE FROM scraping_saramin_candidates",
+        "SELECT 1; DELETE FROM scraping_saramin_candidates;",
+        "WITH x AS (SELECT 1) SELECT * FROM x; ROLLBACK",
+        "SELECT 1; SET TRANSACTION READ WRITE",
+        "-- 설명\nDELETE FROM scraping_saramin_candidates",
+    ):
+        with pytest.raises(ValueError):
+            database.guard_query(query, max_cost=1, max_rows=1)
+        with pytest.raises(ValueError):
+            database.explain_query(query)
+
+def test_guard_query_ignores_semicolons_in_literals_and_comments(monkeypatch):
+    """문자열/주석 안의 세미콜론과 끝의 세미콜론은 허용"""
+    explained = []
+    monkeypatch.setattr(
+        database, 'explain_query',
+        lambda query, params=None: explained.append(query) or {'total_cost': 1, 'plan_rows': 1}
+    )
+
+    query = "/* 백엔드; 파이썬 */\nSELECT saramin_key FROM scraping_saramin_candidates WHERE regex_my_skills LIKE '%a;b%' ;\n"
+    guarded, _ = database.guard_query(query, max_cost=10, max_rows=10)
+
+    assert guarded == query
+    assert explained == [query]
+
+def test_build_incremental_query_binds_since_and_skips_leading_comments(monkeypatch):
+    """주석으로 시작하는 WITH 쿼리도 WITH 절 하나로 합치고, since는 파라미터로 바인딩"""
+    monkeypatch.setattr(database, '_qualified_candidates_table', lambda: 'public.scraping_saramin_candidates')
+    since = datetime(2024, 1, 2, 9, tzinfo=timezone.utc)
+    query = """-- 생성된 필터링 쿼리
+/* 키워드: 파이썬 */
+WITH scored AS (
+    SELECT saramin_key FROM scraping_saramin_candidates WHERE regex_my_skills ILIKE '%파이썬%'
+)
+SELECT * FROM scored;"""
+
+    sql, params = database.build_incremental_query(query, since, '7')
+
+    assert params == {'incremental_since': since, 'position_id': 7}
+    assert sql.upper().count('WITH') == 1
+    assert since.isoformat() not in sql
+    # psycopg2와 같은 pyformat 치환 후 원래의 LIKE 패턴이 그대로 남아야 함
+    rendered = sql % {'incremental_since': "'2024-01-02T09:00:00+00:00'", 'position_id': 7}
+    assert "ILIKE '%파이썬%'" in rendered
+    assert "c.update_dt > '2024-01-02T09:00:00+00:00'" in rendered
+    assert 'WHERE pc.position_id = 7' in rendered
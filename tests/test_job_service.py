@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from src.services import job_service
+from src.utils.database import JobLeaseLost
+
+JOB = {
+    'id': 7, 'worker_id': 'worker-a', 'job_type': job_service.SCOUT_SEND_JOB,
+    'cursor_position': 1, 'succeeded': 1, 'failed': 0,
+    'payload': {'candidates': [{'saramin_key': 'k0'}, {'saramin_key': 'k1'}, {'saramin_key': 'k2'}]}
+}
+
+def test_run_items_checkpoints_with_worker_id(monkeypatch):
+    """체크포인트 위치부터 이어서 처리하고 worker_id와 함께 진행 위치 저장"""
+    checkpoints = []
+
+    async def get_job_status(job_id):
+        return 'running'
+
+    async def checkpoint_job(*args):
+        checkpoints.append(args)
+
+    monkeypatch.setattr(job_service.async_database, 'get_job_status', get_job_status)
+    monkeypatch.setattr(job_service.async_database, 'checkpoint_job', checkpoint_job)
+
+    async def handle(candidate):
+        return candidate['saramin_key'] != 'k2'
+
+    assert asyncio.run(job_service._run_items(JOB, handle)) == 'completed'
+    assert checkpoints == [
+        (7, 'worker-a', 2, 2, 0, None),
+        (7, 'worker-a', 3, 2, 1, None)
+    ]
+
+def test_lost_lease_stops_long_running_handler(monkeypatch):
+    """후보자 처리 중이라도 heartbeat에서 작업을 잃으면 handler를 중단"""
+    heartbeats = []
+    cancelled = []
+
+    async def heartbeat_job(job_id, worker_id):
+        heartbeats.append((job_id, worker_id))
+        if len(heartbeats) == 2:
+            raise JobLeaseLost("다른 워커가 가져감")
+
+    monkeypatch.setattr(job_service.async_database, 'heartbeat_job', heartbeat_job)
+
+    async def slow_handler(job):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(job['id'])
+            raise
+        return 'completed'
+
+    with pytest.raises(JobLeaseLost):
+        asyncio.run(job_service._run_with_heartbeat(slow_handler, JOB, interval=0.01))
+    assert heartbeats == [(7, 'worker-a'), (7, 'worker-a')]
+    assert cancelled == [7]
+
+def test_run_job_does_not_finish_lost_job(monkeypatch):
+    """작업을 잃은 워커는 종료 상태를 덮어쓰지 않음"""
+    finished = []
+
+    async def handler(job):
+        raise JobLeaseLost("다른 워커가 가져감")
+
+    monkeypatch.setitem(job_service.JOB_HANDLERS, job_service.SCOUT_SEND_JOB, handler)
+    monkeypatch.setattr(job_service, 'finish_job', lambda *args: finished.append(args))
+
+    job_service.run_job(JOB)
+
+    assert finished == []
@@ -0,0 +1,65 @@
+import pytest
+
+from src.services import llm_cache
+from src.services.llm_cache import LLMResponseCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """llm_cache의 time.time을 테스트에서 직접 움직이는 시계로 교체"""
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache.time, 'time', lambda: now[0])
+    return now
+
+def test_get_returns_cached_response_until_ttl(tmp_path, clock):
+    cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+    key = cache.make_key("gpt-4", "system", "prompt")
+
+    assert cache.get(key) is None
+    cache.set(key, "gpt-4", "응답")
+    clock[0] += 59
+    assert cache.get(key) == "응답"
+
+    clock[0] += 2
+    assert cache.get(key) is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 2
+
+def test_set_evicts_expired_then_least_recently_used(tmp_path, clock):
+    cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60, max_entries=2)
+
+    cache.set("old", "gpt-4", "만료될 응답")
+    clock[0] += 30
+    cache.set("a", "gpt-4", "A")
+    clock[0] += 1
+    cache.set("b", "gpt-4", "B")  # 3개지만 old는 아직 유효하므로 가장 오래 안 쓴 old 제거
+    assert cache.get("old") is None
+
+    clock[0] += 1
+    assert cache.get("a") == "A"  # a를 사용해 b가 가장 오래 안 쓴 항목이 됨
+    clock[0] += 1
+    cache.set("c", "gpt-4", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['evictions'] == 2
+
+def test_make_key_depends_on_all_parts():
+    keys = {
+        LLMResponseCache.make_key("gpt-4", "system", "prompt"),
+        LLMResponseCache.make_key("gpt-4o", "system", "prompt"),
+        LLMResponseCache.make_key("gpt-4", "system2", "prompt"),
+        LLMResponseCache.make_key("gpt-4", "system", "prompt2"),
+    }
+    assert len(keys) == 4
+
+def test_set_sweeps_expired_entries(tmp_path, clock):
+    cache = LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), ttl_seconds=60)
+    cache.set("x", "gpt-4", "X")
+    clock[0] += 61
+
+    cache.set("y", "gpt-4", "Y")
+
+    assert cache.stats()['entries'] == 1
+    assert cache.stats()['evictions'] == 1
@@ -0,0 +1,74 @@
+import pytest
+
+from src.services.query_builder import (
+    KEYWORD_COLUMNS,
+    OPEN_ENDED_EXPERIENCE_SPAN,
+    _escape_like,
+    _quote_literal,
+    build_filtering_query,
+    parse_experience_range,
+    parse_keywords,
+    parse_regions,
+    parse_target_salary,
+    render_query
+)
+
+def test_parse_keywords_strips_numbering_and_duplicates():
+    keywords = "1. Python\n2) Django, - AWS\n• Python\n\n* 백엔드 ,"
+    assert parse_keywords(keywords) == ['Python', 'Django', 'AWS', '백엔드']
+    assert parse_keywords("") == []
+    assert parse_keywords(None) == []
+
+@pytest.mark.parametrize("text, expected", [
+    ("경력 4~6년차", (4, 6)),
+    ("6 - 4년", (4, 6)),
+    ("3년 이상", (3, 3 + OPEN_ENDED_EXPERIENCE_SPAN)),
+    ("5년차 이상 우대", (5, 5 + OPEN_ENDED_EXPERIENCE_SPAN)),
+    ("신입 가능", None),
+    (None, None),
+])
+def test_parse_experience_range(text, expected):
+    assert parse_experience_range(text) == expected
+
+def test_parse_regions_and_target_salary():
+    assert parse_regions("근무지: 서울 또는 경기 (재택 가능)") == ['서울', '경기']
+    assert parse_regions(None) == []
+    assert parse_target_salary("연봉 5,000 ~ 7,000만원") == 6000
+    assert parse_target_salary("연봉은 최대 6500만원") == 6500
+    assert parse_target_salary("연봉 협의") is None
+
+def test_quote_literal_escapes_single_quotes():
+    assert _quote_literal(20) == "20"
+    assert _quote_literal("O'Reilly") == "'O''Reilly'"
+    assert _quote_literal("'; DROP TABLE x; --") == "'''; DROP TABLE x; --'"
+
+def test_escape_like_wildcards():
+    assert _escape_like("100%") == "100\\%"
+    assert _escape_like("snake_case") == "snake\\_case"
+    assert _escape_like("C:\\path") == "C:\\\\path"
+
+def test_render_query_keeps_percent_inside_literals():
+    assert render_query(
+        "SELECT * FROM t WHERE a ILIKE %s AND b = %s LIMIT %s", ['%파이썬%', "it's", 5]
+    ) == "SELECT * FROM t WHERE a ILIKE '%파이썬%' AND b = 'it''s' LIMIT 5"
+
+def test_build_filtering_query_parameters():
+    result = build_filtering_query("1. C++\n2. 50%_off's", "경력 3~4년, 서울, 연봉 6000만원", limit=10)
+
+    assert result['keywords'] == ['C++', "50%_off's"]
+    assert result['experience_range'] == (3, 4)
+    assert result['regions'] == ['서울']
+    assert result['target_salary'] == 6000
+    assert result['params'] == (
+        ['%C++%'] * len(KEYWORD_COLUMNS)
+        + ["%50\\%\\_off's%"] * len(KEYWORD_COLUMNS)
+        + ['%3년%', '%4년%', '%서울%', 6000, 10]
+    )
+    # 편집기에 표시하는 SQL은 따옴표가 이스케이프된 리터럴로 치환됨
+    assert "ILIKE '%50\\%\\_off''s%'" in result['query']
+    assert result['query'].rstrip().endswith("LIMIT 10")
+    assert result['parameterized_query'].count('%s') == len(result['params'])
+
+def test_build_filtering_query_requires_keywords():
+    with pytest.raises(ValueError):
+        build_filtering_query(" \n, ")
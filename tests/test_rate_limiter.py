@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import AdaptiveTokenBucket, FAILURE_BACKOFF, TIMEOUT_BACKOFF
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return _FakeClock()
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """asyncio.sleep 대신 대기 시간만 기록"""
+    recorded = []
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+
+    monkeypatch.setattr(rate_limiter.asyncio, 'sleep', fake_sleep)
+    return recorded
+
+def test_burst_then_rate_spacing(clock, sleeps):
+    """버스트만큼은 바로 통과하고 이후 예약은 rate 간격으로 늦춰짐"""
+    bucket = AdaptiveTokenBucket(rate=2.0, burst=2, clock=clock)
+
+    for _ in range(4):
+        asyncio.run(bucket.acquire())
+
+    assert sleeps == [0.5, 1.0]
+
+def test_refill_after_idle(clock):
+    bucket = AdaptiveTokenBucket(rate=1.0, burst=2, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 1.0]
+
+    clock.now += 10
+
+    assert bucket.reserve() == 0.0
+
+def test_failure_delays_every_later_reservation(clock):
+    """실패 후에는 어느 발송자의 예약이든 백오프만큼 함께 늦춰짐"""
+    bucket = AdaptiveTokenBucket(rate=1.0, burst=2, clock=clock)
+
+    bucket.on_failure()
+
+    assert bucket.reserve() == pytest.approx(FAILURE_BACKOFF + 1.0)
+    assert bucket.reserve() == pytest.approx(FAILURE_BACKOFF + 2.0)
+
+    clock.now += FAILURE_BACKOFF + 2.0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+def test_backoff_grows_on_failures_and_shrinks_on_success(clock):
+    bucket = AdaptiveTokenBucket(rate=1.0, burst=2, max_backoff=8.0, clock=clock)
+
+    bucket.on_failure(timeout=True)
+    assert bucket.backoff == TIMEOUT_BACKOFF
+    bucket.on_failure()
+    assert bucket.backoff == 8.0  # max_backoff로 제한
+    assert bucket.reserve() == pytest.approx(8.0 + 1.0)
+
+    bucket.on_success()
+    assert bucket.backoff == 4.0
+    for _ in range(4):  # 2 -> 1 -> 0.5 -> 0
+        bucket.on_success()
+    assert bucket.backoff == 0.0
@@ -0,0 +1,31 @@
+from src.utils import read_cache as read_cache_module
+from src.utils.read_cache import ReadCache
+
+def test_read_cache_evicts_least_recently_used():
+    """최대 항목 수를 넘으면 가장 오래 안 쓴 항목부터 제거"""
+    cache = ReadCache(max_entries=2)
+    cache.set(('a',), 1, ttl=60, tags=())
+    cache.set(('b',), 2, ttl=60, tags=())
+    assert cache.get(('a',)) == (True, 1)
+
+    cache.set(('c',), 3, ttl=60, tags=())
+
+    assert len(cache) == 2
+    assert cache.get(('b',)) == (False, None)
+    assert cache.get(('a',)) == (True, 1)
+    assert cache.get(('c',)) == (True, 3)
+
+def test_read_cache_sweeps_expired_entries_before_evicting(monkeypatch):
+    """다시 읽히지 않은 만료 항목은 넘칠 때 살아 있는 항목보다 먼저 정리"""
+    now = [100.0]
+    monkeypatch.setattr(read_cache_module.time, 'monotonic', lambda: now[0])
+    cache = ReadCache(max_entries=2)
+    cache.set(('live',), 1, ttl=60, tags=())
+    cache.set(('short',), 2, ttl=1, tags=())
+    now[0] += 5
+
+    cache.set(('new',), 3, ttl=60, tags=())
+
+    assert len(cache) == 2
+    assert cache.get(('live',)) == (True, 1)
+    assert cache.get(('new',)) == (True, 3)
@@ -0,0 +1,113 @@
+from datetime import datetime
+
+import pandas as pd
+
+from src.services.query_builder import KEYWORD_COLUMNS
+from src.services.scoring_engine import CandidateScoringEngine
+
+def _rows(*candidates) -> pd.DataFrame:
+    """(saramin_key, update_dt, 보유 기술, 희망 지역, 희망 연봉, 최근 로그인) 목록을 조회 결과 형태로 변환"""
+    records = []
+    for key, update_dt, skills, region, salary, login_dt in candidates:
+        record = {'saramin_key': key, 'update_dt': update_dt}
+        record.update({column: None for column in KEYWORD_COLUMNS})
+        record['regex_my_skills'] = skills
+        record['regex_work_year'] = '3년'
+        record['regex_desired_work_region'] = region
+        record['regex_desired_annual_salary'] = salary
+        record['regex_login_dt'] = login_dt
+        records.append(record)
+    return pd.DataFrame(records)
+
+def _engine(batches, **kwargs) -> CandidateScoringEngine:
+    """_load_rows가 호출될 때마다 batches를 차례로 돌려주는 엔진 (since 인자는 loads에 기록)"""
+    engine = CandidateScoringEngine(**kwargs)
+    engine.loads = []
+    batches = list(batches)
+
+    def load_rows(since=None):
+        engine.loads.append(since)
+        return batches.pop(0)
+
+    engine._load_rows = load_rows
+    return engine
+
+T1 = datetime(2024, 1, 1, 9)
+T2 = datetime(2024, 1, 2, 9)
+T3 = datetime(2024, 1, 3, 9)
+
+CANDIDATES = _rows(
+    ('a', T1, 'Python, Django', '서울 강남', '5000~6000', '2024-01-02'),
+    ('b', T1, 'python', '서울', '7000', '2024-01-03'),
+    ('c', T1, 'PYTHON django', '경기 성남', '5200', '2024-01-01'),
+    ('d', T1, 'Java', '서울', '5000', '2024-01-04'),
+    ('e', T1, 'Python Django', '서울', None, '2024-01-05'),
+)
+
+def test_rank_orders_by_matches_salary_distance_then_login():
+    """키워드 일치 개수 → 기준 연봉 근접도 → 최근 로그인 순 (대소문자 구분 없음)"""
+    engine = _engine([CANDIDATES])
+    engine.refresh()
+
+    assert engine.rank(['Python', 'django'], job_description="연봉 5000만원") == [
+        ('a', 2), ('c', 2), ('e', 2), ('b', 1)
+    ]
+    assert engine.rank(['Python', 'django']) == [('e', 2), ('a', 2), ('c', 2), ('b', 1)]
+    assert engine.rank(['Python', 'django'], limit=2) == [('e', 2), ('a', 2)]
+
+def test_rank_filters_regions():
+    engine = _engine([CANDIDATES])
+    engine.refresh()
+
+    assert engine.rank(['python'], job_description="근무지 서울") == [('e', 1), ('b', 1), ('a', 1)]
+
+def test_refresh_updates_rows_in_place_and_recomputes_cached_vectors():
+    """증분 갱신 시 기존 후보자는 같은 위치에서 덮어쓰고 새 후보자는 뒤에 추가"""
+    engine = _engine([
+        CANDIDATES,
+        _rows(
+            ('b', T2, 'Rust', '서울', '7000', '2024-01-06'),
+            ('f', T2, 'Django', '부산', '4000', '2024-01-07'),
+        )
+    ])
+    engine.refresh()
+    assert engine.score(['django']).tolist() == [1, 0, 1, 0, 1]
+
+    assert engine.refresh() == 2
+
+    assert engine._keys.tolist() == ['a', 'b', 'c', 'd', 'e', 'f']
+    assert engine._frame['text'].iloc[1].strip() == 'rust'
+    # 캐시된 'django' 벡터는 바뀐 b와 추가된 f만 다시 계산됨
+    assert engine._matches['django'].tolist() == [True, False, True, False, True, True]
+    assert engine.rank(['python', 'rust']) == [('b', 1), ('e', 1), ('a', 1), ('c', 1)]
+
+def test_refresh_loads_from_latest_update_dt():
+    """두 번째 갱신부터는 지금까지 본 가장 늦은 update_dt 이후만 조회 (NULL은 무시)"""
+    engine = _engine([
+        _rows(
+            ('a', T1, 'Python', '서울', None, None),
+            ('b', T2, 'Python', '서울', None, None),
+            ('c', None, 'Python', '서울', None, None),
+        ),
+        _rows(('d', T3, 'Python', '서울', None, None)),
+        _rows(),
+    ])
+
+    engine.refresh()
+    engine.refresh()
+    engine.refresh()
+
+    assert engine.loads == [None, T2, T3]
+    assert len(engine) == 4
+
+def test_keyword_vector_cache_is_bounded():
+    """일치 벡터 캐시는 최근 사용한 max_cached_keywords개만 유지"""
+    engine = _engine([CANDIDATES], max_cached_keywords=2)
+    engine.refresh()
+
+    engine.score(['python'])
+    engine.score(['django'])
+    engine.score(['python'])
+    engine.score(['java'])
+
+    assert list(engine._matches) == ['python', 'java']
@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from src.services import send_outbox
+from src.services.send_outbox import CLOSE_RETRIES, ScoutSendOutbox
+
+class _FlakyStore:
+    """처음 failures번은 실패하고 이후에는 저장한 결과를 기록하는 bulk_mark_scout_sent 대역"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = []
+        self.saved = threading.Event()
+
+    def __call__(self, results, campaign_id=None, checkpoint_keys=None):
+        self.calls.append((list(results), campaign_id, list(checkpoint_keys or [])))
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("connection lost")
+        self.saved.set()
+        return len(results)
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(send_outbox.time, 'sleep', recorded.append)
+    return recorded
+
+def _outbox(monkeypatch, store, **kwargs) -> ScoutSendOutbox:
+    monkeypatch.setattr(send_outbox, 'bulk_mark_scout_sent', store)
+    return ScoutSendOutbox(batch_size=kwargs.pop('batch_size', 10), flush_interval_ms=60000, **kwargs)
+
+def test_failed_flush_keeps_results_for_the_next_flush(monkeypatch):
+    store = _FlakyStore(failures=1)
+    outbox = _outbox(monkeypatch, store, campaign_id=3)
+    outbox.put(1, 'k1', 9)
+    outbox.put_checkpoint('k0')
+
+    with pytest.raises(RuntimeError):
+        outbox.flush()
+    outbox.put(1, 'k2', 9)
+
+    assert outbox.pending_count() == 3
+    assert outbox.flush() == 2
+    assert store.calls[-1] == ([(1, 'k1', 9), (1, 'k2', 9)], 3, ['k0'])
+    assert outbox.summary() == {
+        'enqueued': 2, 'flushed': 2, 'missing': 0, 'batches': 1, 'errors': 1, 'pending': 0
+    }
+
+def test_close_retries_with_backoff(monkeypatch, sleeps):
+    store = _FlakyStore(failures=CLOSE_RETRIES - 1)
+    outbox = _outbox(monkeypatch, store)
+    outbox.put(1, 'k1', 9)
+
+    outbox.close()
+
+    assert sleeps == [2 ** attempt for attempt in range(CLOSE_RETRIES - 1)]
+    assert len(store.calls) == CLOSE_RETRIES
+    assert outbox.pending_count() == 0
+
+def test_close_raises_when_retries_are_exhausted(monkeypatch, sleeps):
+    store = _FlakyStore(failures=CLOSE_RETRIES)
+    outbox = _outbox(monkeypatch, store)
+    outbox.put(1, 'k1', 9)
+
+    with pytest.raises(RuntimeError, match="1건"):
+        outbox.close()
+    assert outbox.pending_count() == 1
+
+def test_background_thread_flushes_full_batches(monkeypatch):
+    store = _FlakyStore()
+    with _outbox(monkeypatch, store, batch_size=2) as outbox:
+        outbox.put(1, 'k1', 9)
+        outbox.put(1, 'k2', 9)
+        # flush 주기(60초)를 기다리지 않고 batch_size에 도달하면 바로 저장
+        assert store.saved.wait(5)
+
+    assert store.calls == [([(1, 'k1', 9), (1, 'k2', 9)], None, [])]